@@ -1,6 +1,9 @@
 """AFrameXR API"""
 
 from .aggregate import *
+from .batch import *
+from .binning import *
+from .compiled import *
 from .components import *
 from .data import *
 from .encoding import *
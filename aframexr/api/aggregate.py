@@ -1,5 +1,4 @@
 import polars as pl
-from polars import DataFrame
 
 from ..utils.validators import AframeXRValidator
 
@@ -40,20 +39,14 @@ class AggregatedFieldDef:
         return specs
 
     # Utils
-    def get_aggregated_data(self, data: DataFrame, groupby: list) -> DataFrame:
-        """Returns the aggregated data."""
-        try:
-            if self.op == 'count':
-                expression = pl.len().alias(self.as_field)  # Counts the rows per group
-            else:
-                expression = getattr(  # Take the polars method of column "self.field" and operation "self.op"
-                    pl.col(self.field),  # Take the column (field)
-                    self.op  # Aggregate operation
-                )().alias(self.as_field)  # Execute the operation and rename the column
-            return data.group_by(groupby, maintain_order=True).agg(expression)
-
-        except pl.exceptions.ColumnNotFoundError:
-            raise KeyError(f'Data has no field "{self.field}".')
+    def get_expression(self) -> pl.Expr:
+        """Returns the polars expression of the aggregate."""
+        if self.op == 'count':
+            return pl.len().alias(self.as_field)  # Counts the rows per group
+        return getattr(  # Take the polars method of column "self.field" and operation "self.op"
+            pl.col(self.field),  # Take the column (field)
+            self.op  # Aggregate operation
+        )().alias(self.as_field)  # Execute the operation and rename the column
 
     @staticmethod
     def split_operator_field(aggregate_formula: str):
@@ -0,0 +1,248 @@
+import multiprocessing
+import os
+import pickle
+
+import polars as pl
+
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterator, Literal
+
+from .components import TopLevelMixin
+from ..utils.constants import DEFAULT_BATCH_PENDING_TASKS, DEFAULT_BATCH_START_METHOD
+from ..utils.scene_creator import SceneCreator
+from ..utils.validators import AframeXRValidator
+
+
+def _to_columnar_specs(specs: dict) -> dict:
+    """Returns the specifications with the raw data of the charts (list of dictionaries) as polars DataFrames."""
+    def to_columnar(chart_specs: dict) -> dict:
+        values = chart_specs.get('data', {}).get('values')
+        if isinstance(values, list):  # Shipped to the workers as columns (not as one dictionary per row)
+            return {**chart_specs, 'data': {**chart_specs['data'], 'values': pl.DataFrame(values)}}
+        return chart_specs
+
+    if 'concat' in specs:
+        return {**specs, 'concat': [to_columnar(chart_specs) for chart_specs in specs['concat']]}
+    return to_columnar(specs)
+
+
+def _picklable_error(error: Exception) -> Exception:
+    """Returns the error, or a RuntimeError with its message if it cannot be sent back from the worker."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f'{type(error).__name__}: {error}')
+
+
+def _render_scene(specs: dict) -> str | Exception:
+    """Returns the HTML of the scene, or the error raised while rendering it (executed by the workers)."""
+    try:
+        AframeXRValidator.validate_chart_specs(specs)
+        return SceneCreator.create_scene(specs)
+    except Exception as error:
+        return _picklable_error(error)
+
+
+def _save_scene(specs: dict, fp: str) -> Exception | None:
+    """Streams the HTML of the scene into the file, returning the error raised if any (executed by the workers)."""
+    try:
+        AframeXRValidator.validate_chart_specs(specs)
+        html_chunks = SceneCreator.iter_scene(specs)
+        with open(fp, 'w') as file:
+            try:
+                file.writelines(html_chunks)
+            except BaseException:
+                file.close()
+                os.remove(fp)  # Do not keep a partial scene
+                raise
+    except Exception as error:
+        return _picklable_error(error)
+    return None
+
+
+def _iter_tasks(charts: list, extra_args: list[tuple], scene_options: dict, results: list) -> Iterator[tuple]:
+    """
+    Yields the index and the arguments of the function of each chart, preparing the specifications when they are
+    requested (the errors raised preparing them are stored in results, without aborting the batch).
+    """
+    for index, chart in enumerate(charts):
+        try:
+            AframeXRValidator.validate_type('chart', chart, TopLevelMixin)
+            specs = _to_columnar_specs(chart._get_scene_specs(**scene_options))
+        except Exception as error:  # Reported as the result of the chart
+            results[index] = error
+            continue
+        yield index, (specs, *extra_args[index])
+
+
+def _create_executor(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(DEFAULT_BATCH_START_METHOD))
+
+
+def _store_result(future: Future, task: tuple, results: list, crashed_tasks: list) -> None:
+    """Stores the result of the task, or adds the task to crashed_tasks if the pool was broken while executing it."""
+    index, _ = task
+    try:
+        results[index] = future.result()
+    except BrokenProcessPool:  # A worker died (this or other task could have crashed it)
+        crashed_tasks.append(task)
+    except Exception as error:  # For example, the arguments could not be pickled
+        results[index] = _picklable_error(error)
+
+
+def _run_batch(function: Callable, charts: list, extra_args: list[tuple], workers: int | None,
+               scene_options: dict) -> list:
+    """
+    Returns the result of the function for the specifications of each chart (or the error raised preparing them).
+
+    Notes
+    -----
+    The specifications are prepared in this process (converting the data into polars DataFrames, which are pickled
+    as columns), while the function is executed by a pool of workers. Only DEFAULT_BATCH_PENDING_TASKS charts per
+    worker are submitted at the same time, and the specifications of each chart are prepared when it is submitted,
+    so the data of the whole batch is never loaded at once. If workers is 1, the function is executed in this
+    process.
+
+    If a worker dies (for example, killed by the system or crashed by a native library), the pool is restarted. The
+    charts being executed at that time are executed again one by one, so the chart crashing the worker gets the
+    BrokenProcessPool error as its result, and the rest of the batch is not aborted.
+    """
+    AframeXRValidator.validate_type('charts', charts, list)
+    if workers is not None:
+        AframeXRValidator.validate_type('workers', workers, int)
+        AframeXRValidator.validate_positive_number('workers', workers)
+
+    results = [None] * len(charts)
+    tasks = _iter_tasks(charts, extra_args, scene_options, results)
+    if workers == 1:
+        for index, args in tasks:
+            results[index] = function(*args)
+        return results
+
+    workers = min(workers or os.cpu_count() or 1, max(len(charts), 1))
+    executor = _create_executor(workers)
+    pending = {}  # Task (index and arguments) of each submitted future
+    try:
+        while True:
+            while len(pending) < DEFAULT_BATCH_PENDING_TASKS * workers and (task := next(tasks, None)) is not None:
+                pending[executor.submit(function, *task[1])] = task
+            if not pending:
+                return results
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            crashed_tasks = []
+            for future in done:
+                _store_result(future, pending.pop(future), results, crashed_tasks)
+            if not crashed_tasks:
+                continue
+
+            wait(pending)  # The rest of the futures of the broken pool are finished (or failed)
+            for future, task in pending.items():
+                _store_result(future, task, results, crashed_tasks)
+            pending.clear()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+            executor = _create_executor(workers)
+            for index, args in sorted(crashed_tasks, key=lambda crashed_task: crashed_task[0]):
+                try:  # Executed alone, so the crash of the worker is caused by this chart
+                    results[index] = executor.submit(function, *args).result()
+                except BrokenProcessPool as error:
+                    results[index] = error
+                    executor.shutdown(wait=True)
+                    executor = _create_executor(workers)  # Restart the pool for the remaining charts
+                except Exception as error:
+                    results[index] = _picklable_error(error)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def render_many(charts: list, workers: int = None, ar_scale: str = None, environment: Literal['default', 'contact',
+'egypt', 'checkerboard', 'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan',
+'dream', 'volcano', 'starry', 'osiris'] = 'default', max_elements: int = None) -> list[str | Exception]:
+    """
+    Returns the HTML of the scene of each chart, rendered by a pool of processes.
+
+    Parameters
+    ----------
+    charts : list
+        Charts (or concatenations of charts) to render.
+    workers : int (optional)
+        Number of processes. If not defined, using the number of CPUs. If 1, the charts are rendered in this process.
+    ar_scale : str (optional)
+        The scale of the scenes in AR mode.
+    environment : str (optional)
+        Environment of the scenes.
+    max_elements : int (optional)
+        Budget of elements of each scene (see TopLevelMixin.iter_html()).
+
+    Returns
+    -------
+    list
+        The HTML of each scene, in the order of the charts. If a chart cannot be rendered, the error raised is
+        returned in its place (the rest of the charts are rendered).
+
+    Examples
+    --------
+    >>> import aframexr
+    >>> data = aframexr.UrlData('./data.json')
+    >>> charts = [aframexr.Chart(data).mark_bar().encode(x='model', y=y) for y in ('sales', 'price')]
+    >>> #scenes = aframexr.render_many(charts, workers=2)
+    """
+    scene_options = {'ar_scale': ar_scale, 'environment': environment, 'max_elements': max_elements}
+    return _run_batch(_render_scene, charts, [()] * len(charts), workers, scene_options)
+
+
+def save_many(charts: list, paths: list, workers: int = None, ar_scale: str = None, environment: Literal['default',
+'contact', 'egypt', 'checkerboard', 'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison',
+'tron', 'japan', 'dream', 'volcano', 'starry', 'osiris'] = 'default', max_elements: int = None) -> dict[str, Exception]:
+    """
+    Saves the HTML scene of each chart into its file, rendered (and written) by a pool of processes.
+
+    Parameters
+    ----------
+    charts : list
+        Charts (or concatenations of charts) to save.
+    paths : list
+        Path of the HTML file of each chart.
+    workers : int (optional)
+        Number of processes. If not defined, using the number of CPUs. If 1, the charts are saved in this process.
+    ar_scale : str (optional)
+        The scale of the scenes in AR mode.
+    environment : str (optional)
+        Environment of the scenes.
+    max_elements : int (optional)
+        Budget of elements of each scene (see TopLevelMixin.iter_html()).
+
+    Returns
+    -------
+    dict
+        The error raised for each path whose chart could not be saved (empty if all the charts were saved). The
+        failures do not abort the batch, and no partial file is kept for them.
+
+    Raises
+    ------
+    ValueError
+        If the number of charts and paths is different, or a path is repeated.
+
+    Notes
+    -----
+    Each worker streams the scene into its file, so the HTML documents are neither stored in memory nor sent back.
+    """
+    AframeXRValidator.validate_type('charts', charts, list)
+    AframeXRValidator.validate_type('paths', paths, list)
+    if len(charts) != len(paths):
+        raise ValueError(f'Expected one path per chart, got {len(charts)} charts and {len(paths)} paths.')
+    for fp in paths:
+        AframeXRValidator.validate_type('fp', fp, str)
+    files = [os.path.abspath(fp) for fp in paths]  # The same file could be written with different paths
+    files_count = Counter(files)
+    if len(files_count) != len(files):
+        repeated_paths = sorted({fp for fp, file in zip(paths, files) if files_count[file] > 1})
+        raise ValueError(f'Expected one file per chart, got repeated paths: {repeated_paths}.')
+
+    scene_options = {'ar_scale': ar_scale, 'environment': environment, 'max_elements': max_elements}
+    results = _run_batch(_save_scene, charts, [(fp,) for fp in paths], workers, scene_options)
+    return {fp: error for fp, error in zip(paths, results) if error is not None}
@@ -0,0 +1,92 @@
+import polars as pl
+from polars import DataFrame, LazyFrame
+
+from ..utils.constants import DEFAULT_MAXBINS
+from ..utils.validators import AframeXRValidator
+
+
+class BinFieldDef:
+    """
+    Binned field definition.
+
+    Parameters
+    ----------
+    field : str
+        The data field to bin (must be quantitative).
+    as_field : str (optional)
+        The field storing the start of the bin of each value. The end of the bin is stored in "<as_field>_end". If not
+        defined, the start of the bin replaces the field (and the end is not stored).
+    maxbins : int (optional)
+        The maximum number of bins. Ignored if step is defined. If not defined, using DEFAULT_MAXBINS.
+    step : float (optional)
+        The exact size of the bins.
+
+    Notes
+    -----
+    The size of the bins is the smallest "nice" number (1, 2 or 5 times a power of 10) that splits the extent of the
+    field in maxbins bins, and the bins start at multiples of the size (so the extremes of the field can add one more
+    bin). Everything is computed by polars expressions, so the bins are computed inside the query of the chart
+    (without collecting the extent of the field first).
+    """
+
+    def __init__(self, field: str, as_field: str = '', maxbins: int = DEFAULT_MAXBINS, step: float | None = None):
+        AframeXRValidator.validate_type('field', field, str)
+        AframeXRValidator.validate_type('as_field', as_field, str)
+        AframeXRValidator.validate_type('maxbins', maxbins, int)
+        AframeXRValidator.validate_positive_number('maxbins', maxbins)
+        if step is not None:
+            AframeXRValidator.validate_positive_number('step', step)
+        if not field:
+            raise ValueError('Parameter "field" cannot be empty using bin.')
+
+        self.field = field
+        self.as_field = as_field
+        self.maxbins = maxbins
+        self.step = step
+
+    # Import
+    @staticmethod
+    def from_dict(bin_specs: dict, field: str = '', as_field: str = ''):
+        """
+        Creates a BinFieldDef object from the bin specifications ({"maxbins": ...} or {"step": ...}), or True to use
+        the default bins.
+        """
+        if bin_specs is True:
+            bin_specs = {}
+        AframeXRValidator.validate_type('bin specifications', bin_specs, dict)
+        return BinFieldDef(field, as_field, bin_specs.get('maxbins', DEFAULT_MAXBINS), bin_specs.get('step'))
+
+    # Export
+    def to_dict(self) -> dict:
+        """Returns the dictionary representation for chart specifications of the bin parameters."""
+        if self.step is not None:
+            return {'step': self.step}
+        return {'maxbins': self.maxbins}
+
+    # Utils
+    def get_step_expression(self) -> pl.Expr:
+        """Returns the polars expression of the size of the bins."""
+        if self.step is not None:
+            return pl.lit(self.step, dtype=pl.Float64)
+
+        column = pl.col(self.field).cast(pl.Float64)
+        raw_step = (column.max() - column.min()) / self.maxbins
+        magnitude = pl.lit(10.0).pow(raw_step.log10().floor())
+        normalized_step = raw_step / magnitude
+        nice_step = pl.when(normalized_step <= 1).then(1.0).when(normalized_step <= 2).then(2.0) \
+            .when(normalized_step <= 5).then(5.0).otherwise(10.0) * magnitude
+        return pl.when(raw_step > 0).then(nice_step).otherwise(1.0)  # All the values are in the same bin
+
+    def get_expressions(self) -> list[pl.Expr]:
+        """Returns the polars expressions of the start (and the end, if as_field is defined) of the bins."""
+        step = self.get_step_expression()
+        start = (pl.col(self.field).cast(pl.Float64) / step).floor() * step
+        if not self.as_field:
+            return [start.alias(self.field)]
+        return [start.alias(self.as_field), (start + step).alias(f'{self.as_field}_end')]
+
+    def get_binned_data(self, data: DataFrame | LazyFrame) -> DataFrame | LazyFrame:
+        """Returns the data with the bins of the field (LazyFrames are binned lazily)."""
+        if self.field not in data.collect_schema():
+            raise KeyError(f'Data has no field "{self.field}".')
+        return data.with_columns(self.get_expressions())
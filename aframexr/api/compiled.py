@@ -0,0 +1,174 @@
+import json
+import os
+
+import polars as pl
+
+try:
+    from pandas import DataFrame
+except ImportError:
+    DataFrame = object
+
+try:
+    from pyarrow import Table
+except ImportError:
+    Table = object
+
+from typing import Iterator, Literal
+
+from .components import _materialize_data
+from .data import Data, UrlData
+from ..utils.constants import ERROR_MESSAGES
+from ..utils.entities_html_creator import ChartPlan, _get_scene_params_map
+from ..utils.glb_creator import GLBCreator
+from ..utils.scene_creator import SceneCreator
+from ..utils.validators import AframeXRValidator
+
+_SCENE_OPTIONS = ('ar_scale', 'environment', 'max_elements', 'workers')  # Options of the scene (not of the charts)
+
+
+class CompiledChart:
+    """
+    Compiled scene: the validated plan of its charts, rendered with different data (see TopLevelMixin.compile()).
+
+    Parameters
+    ----------
+    specs : dict
+        Specifications of the scene (with the options of the scene), not validated.
+
+    Notes
+    -----
+    The specifications are validated, the filter equations are parsed, the bins and aggregates are created and the
+    creator classes of the marks are resolved once, when compiling the scene (see ChartPlan). Rendering the compiled
+    scene only does the data-dependent work: the query of each chart is built for the schema of the data and collected,
+    and the charts are created.
+
+    The data of the compiled scene is not kept. The compiled scene can be pickled (for example, to render it in
+    processes).
+
+    Examples
+    --------
+    >>> import aframexr
+    >>> import polars as pl
+    >>> compiled_chart = aframexr.Chart().mark_bar().encode(x='model', y='sales').compile()
+    >>> for customer_data in [pl.DataFrame({'model': ['A', 'B'], 'sales': [20, 30]})]:
+    ...     html = compiled_chart.render(customer_data)
+    """
+
+    def __init__(self, specs: dict):
+        def validation_specs(chart_specs: dict) -> dict:  # Charts without data are validated with empty data
+            if 'mark' in chart_specs and 'data' not in chart_specs:
+                return {**chart_specs, 'data': {'values': []}}
+            return chart_specs
+
+        if 'concat' in specs:
+            AframeXRValidator.validate_type('specs.concat', specs['concat'], list)
+            AframeXRValidator.validate_chart_specs({**specs, 'concat': [validation_specs(s) for s in specs['concat']]})
+        else:
+            AframeXRValidator.validate_chart_specs(validation_specs(specs))
+
+        scene_params_map = _get_scene_params_map(specs)
+
+        def compile_specs(chart_specs: dict) -> dict:
+            if 'mark' not in chart_specs:  # Single element
+                return chart_specs
+            compiled_specs = {key: value for key, value in chart_specs.items() if key != 'data'}
+            compiled_specs['plan'] = ChartPlan(chart_specs, scene_params_map)
+            return compiled_specs
+
+        self._scene_options = {key: specs[key] for key in _SCENE_OPTIONS if key in specs}
+        scene_specs = {key: value for key, value in specs.items() if key not in _SCENE_OPTIONS}
+        if 'concat' in scene_specs:
+            self._specs = {**scene_specs, 'concat': [compile_specs(s) for s in scene_specs['concat']]}
+        else:
+            self._specs = compile_specs(scene_specs)
+        self._charts_count = sum('mark' in s for s in self._specs.get('concat', [self._specs]))
+
+    def _get_specs(self, data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table | list,
+                   columnar: bool = True) -> dict:
+        """
+        Returns the specifications of the scene with the data (the plans are removed if columnar is False, for the
+        JSON specifications).
+        """
+        datasets = data if isinstance(data, list) else [data] * self._charts_count
+        if len(datasets) != self._charts_count:
+            raise ValueError(ERROR_MESSAGES['COMPILED_CHART_DATA'].format(charts=self._charts_count,
+                                                                          datasets=len(datasets)))
+        datasets = iter(datasets)
+
+        def with_data(chart_specs: dict) -> dict:
+            if 'mark' not in chart_specs:  # Single element
+                return chart_specs
+            specs = {key: value for key, value in chart_specs.items() if columnar or key != 'plan'}
+            specs['data'] = _materialize_data(next(datasets), columnar)
+            return specs
+
+        if 'concat' in self._specs:
+            return {**self._specs, 'concat': [with_data(s) for s in self._specs['concat']]}
+        return with_data(self._specs)
+
+    def iter_render(self, data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table | list) \
+            -> Iterator[str]:
+        """Returns an iterator over the chunks of the HTML representation of the scene with the data (see render())."""
+        return SceneCreator.iter_scene({**self._get_specs(data), **self._scene_options})
+
+    def render(self, data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table | list) -> str:
+        """
+        Returns the HTML representation of the scene with the data.
+
+        Parameters
+        ----------
+        data : Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table | list
+            Data of the charts of the scene. If it is a list, it must contain the data of each chart of the scene (in
+            order, ignoring the single elements), otherwise the data is used by all the charts.
+
+        Raises
+        ------
+        TypeError
+            If the data has an invalid type.
+        ValueError
+            If the list of data does not contain the data of each chart.
+        """
+        return ''.join(self.iter_render(data))
+
+    def save(self, data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table | list, fp: str,
+             file_format: Literal['json', 'html', 'glb'] = None):
+        """
+        Saves the scene with the data into a file, supported formats are JSON, HTML and GLB (see render() for data).
+
+        Parameters
+        ----------
+        data : Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table | list
+            Data of the charts of the scene.
+        fp : str
+            File path.
+        file_format : str (optional)
+            Format of the file could be ['html', 'json', 'glb'].
+            If no format is specified, the scene will be saved depending on the file extension.
+
+        Raises
+        ------
+        ValueError
+            If file_format is invalid.
+        """
+        AframeXRValidator.validate_type('fp', fp, str)
+
+        if file_format == 'html' or fp.endswith('.html'):
+            html_chunks = self.iter_render(data)
+            with open(fp, 'w') as file:
+                try:
+                    file.writelines(html_chunks)  # Streaming the chunks (the whole document is never in memory)
+                except BaseException:
+                    file.close()
+                    os.remove(fp)  # Do not keep a partial scene
+                    raise
+        elif file_format == 'json' or fp.endswith('.json'):
+            specs = self._get_specs(data, columnar=False)
+            specs['environment'] = self._scene_options.get('environment', 'default')
+            with open(fp, 'w') as file:
+                json.dump(specs, file, indent=4)
+        elif file_format == 'glb' or fp.endswith('.glb'):
+            glb = GLBCreator.create_glb(self._get_specs(data))  # Created before opening the file
+            with open(fp, 'wb') as file:
+                file.write(glb)
+        else:
+            raise ValueError('Invalid file format. Must be "json", "html" or "glb"')
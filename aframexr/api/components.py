@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-import copy
+import asyncio
 import html
 import json
-import warnings
+import os
+import threading
+import weakref
+
+import polars as pl
 
 try:
     import pandas as pd
@@ -11,30 +15,148 @@ except ImportError:
     DataFrame = object
     pd = None
 
+try:
+    import pyarrow as pa
+    from pyarrow import Table
+except ImportError:
+    Table = object
+    pa = None
+
 from IPython.display import display, HTML
-from typing import Literal
+from typing import Iterator, Literal
 
 from .aggregate import AggregatedFieldDef
+from .binning import BinFieldDef
 from .data import Data, UrlData
 from .encoding import Encoding, X, Y, Z
 from .filters import FilterTransform
 from .parameter import Parameter
+from ..utils.constants import DEFAULT_MAXBINS, ERROR_MESSAGES
+from ..utils.glb_creator import GLBCreator
 from ..utils.scene_creator import SceneCreator
 from ..utils.validators import AframeXRValidator
 
 
+def _copy_specs(specs):
+    """
+    Returns a copy of the containers (dictionaries and lists) of the specifications.
+
+    Notes
+    -----
+    The data of the charts ("data" and "data_ref" fields) is not copied, it is kept as a reference.
+    """
+    if isinstance(specs, dict):
+        return {key: value if key in ('data', 'data_ref') else _copy_specs(value) for key, value in specs.items()}
+    if isinstance(specs, list):
+        return [_copy_specs(value) for value in specs]
+    return specs
+
+
+def _pandas_to_polars(data: DataFrame) -> pl.DataFrame:
+    """
+    Converts a pandas DataFrame into a polars DataFrame without creating Python objects per row.
+
+    Notes
+    -----
+    Using Arrow (zero-copy when possible) if pyarrow is installed, otherwise converting column by column from numpy.
+    """
+    if pa is not None:
+        return pl.from_pandas(data, nan_to_null=False)  # type: ignore[arg-type] --> DataFrame
+    return pl.DataFrame({str(name): column.to_numpy() for name, column in data.items()})  # type: ignore
+
+
+_ingested_data: dict[int, tuple[weakref.ref, pl.DataFrame]] = {}  # Conversion of each pandas DataFrame (by id)
+_ingested_data_lock = threading.Lock()
+
+
+def _ingest_pandas_data(data: DataFrame) -> pl.DataFrame:
+    """
+    Returns the conversion of the pandas DataFrame into a polars DataFrame, cached while the DataFrame exists.
+
+    Notes
+    -----
+    The cache is keyed on the DataFrame itself (the data reference shared by the specifications of the charts derived
+    from each other), so the conversion is reused by all of them.
+    """
+    key = id(data)
+    with _ingested_data_lock:
+        entry = _ingested_data.get(key)
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+
+    converted_data = _pandas_to_polars(data)  # Converted without the lock (concurrent conversions are not blocked)
+    with _ingested_data_lock:
+        entry = _ingested_data.get(key)
+        if entry is None or entry[0]() is not data:
+            entry = _ingested_data[key] = (weakref.ref(data), converted_data)
+            weakref.finalize(data, _ingested_data.pop, key, None)  # Removed with the DataFrame (before reusing its id)
+    return entry[1]
+
+
+def _materialize_data(data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table,
+                      columnar: bool = False) -> dict:
+    """
+    Returns the data field of the specifications for the data of a chart.
+
+    Parameters
+    ----------
+    data : Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table
+        Data of the chart.
+    columnar : bool (optional)
+        If True, DataFrames are kept as polars DataFrames (for rendering), otherwise they are exported as a list of
+        dictionaries (for the JSON specifications).
+    """
+    AframeXRValidator.validate_type(
+        'data', data, (Data, UrlData, DataFrame, pl.DataFrame, pl.LazyFrame, Table)  # type: ignore[arg-type]
+    )
+
+    if isinstance(data, Data):
+        return {'values': data.values}
+    elif isinstance(data, UrlData):
+        return {'url': data.url}
+    elif isinstance(data, pl.DataFrame):
+        return {'values': data if columnar else data.to_dicts()}
+    elif isinstance(data, pl.LazyFrame):
+        return {'values': data if columnar else data.collect().to_dicts()}  # Collected only for exporting
+    elif pd is not None and isinstance(data, pd.DataFrame):
+        return _materialize_data(_pandas_to_polars(data), columnar)
+    elif pa is not None and isinstance(data, pa.Table):
+        return _materialize_data(pl.from_arrow(data), columnar)
+    else:  # pragma: no cover (AframeXRValidator.validate_type() should have validate data type)
+        raise RuntimeError('Unreachable code: AframeXRValidator.validate_type() should have validate data type')
+
+
 class TopLevelMixin:
-    """Top level chart class."""
+    """
+    Top level chart class.
+
+    Notes
+    -----
+    The specifications are never modified in place (every method that modifies the chart returns a new chart, with
+    new containers only for the modified fields). So the charts share the unchanged fields and the data references,
+    instead of copying them.
+    """
 
     def __init__(self, specs: dict):
         self._specifications = specs
 
+    def _with_specs(self, specs: dict):
+        """Returns a new chart (of the same class) with the given specifications."""
+        new = self.__class__.__new__(self.__class__)
+        new._specifications = specs
+        return new
+
+    def _evolve(self, **fields):
+        """Returns a new chart with the given fields of the specifications replaced (the rest are shared)."""
+        return self._with_specs({**self._specifications, **fields})
+
     def _generate_iframe_html(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt',
     'checkerboard', 'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan',
-    'dream', 'volcano', 'starry', 'osiris'] = 'default'):
+    'dream', 'volcano', 'starry', 'osiris'] = 'default', max_elements: int = None):
+        scene_html = self.to_html(ar_scale=ar_scale, environment=environment, max_elements=max_elements)
         return (
             '<iframe '
-            f'srcdoc="{html.escape(self.to_html(ar_scale=ar_scale, environment=environment), quote=True)}" '  # Raw HTML
+            f'srcdoc="{html.escape(scene_html, quote=True)}" '  # Raw HTML
             'width="100%" '  # Adjust to maximum width
             'height="400" '  # Height of the iframe
             'style="border:none;" '
@@ -43,32 +165,99 @@ class TopLevelMixin:
             '></iframe>'
         )
 
-    def _resolve_data(self):
-        """Resolves the data reference of the specifications."""
-        def materialize_data(data):
-            AframeXRValidator.validate_type(
-                'data', data, (Data, UrlData, DataFrame)  # type: ignore[arg-type] --> DataFrame
-            )
-
-            if isinstance(data, Data):
-                return {'values': data.values}
-            elif isinstance(data, UrlData):
-                return {'url': data.url}
-            elif pd is not None and isinstance(data, pd.DataFrame):
-                arr = data.to_numpy()  # type: ignore --> because of DataFrame
-                cols = data.columns.tolist()  # type: ignore --> because of DataFrame
-                return {'values': [dict(zip(cols, row)) for row in arr]}
-            else:  # pragma: no cover (AframeXRValidator.validate_type() should have validate data type)
-                raise RuntimeError('Unreachable code: AframeXRValidator.validate_type() should have validate data type')
-
-        for specs in self._specifications.get('concat', [self._specifications]):
+    def _ingest_data(self, data):
+        """
+        Returns the data of the chart, with pandas DataFrames and pyarrow Tables converted into polars DataFrames.
+
+        Notes
+        -----
+        The conversion of each pandas DataFrame is cached for the DataFrame (outside the specifications, which are
+        never modified), so it is done only once for the chart and the charts derived from it (and not in every call
+        to show(), to_html(), save(), encode(), ...). The DataFrame is not copied (the columns are shared when
+        possible), so it must not be modified in place once the chart is exported: pass the modified data as a new
+        DataFrame (for example, properties(data=df.copy())).
+
+        pyarrow Tables are immutable, so they are converted without copy in every call. Polars LazyFrames are kept lazy
+        until the transform stage.
+        """
+        if pd is not None and isinstance(data, pd.DataFrame):
+            return _ingest_pandas_data(data)
+        elif pa is not None and isinstance(data, pa.Table):
+            return pl.from_arrow(data)  # Zero-copy
+        return data
+
+    def _resolve_data(self, columnar: bool = False) -> dict:
+        """
+        Returns the specifications with the data reference resolved (the specifications of the chart are not modified).
+
+        Parameters
+        ----------
+        columnar : bool (optional)
+            If True, DataFrames are kept as polars DataFrames (for rendering), otherwise they are exported as a list
+            of dictionaries (for the JSON specifications).
+        """
+        def resolve_specs(specs: dict) -> dict:
+            resolved = {key: value for key, value in specs.items() if key != 'data_ref'}
             if 'data_ref' in specs:
-                specs['data'] = materialize_data(specs.pop('data_ref'))
+                resolved['data'] = _materialize_data(self._ingest_data(specs['data_ref']), columnar)
+            return resolved
+
+        if 'concat' in self._specifications:
+            return {**self._specifications, 'concat': [resolve_specs(s) for s in self._specifications['concat']]}
+        return resolve_specs(self._specifications)
+
+    def _get_scene_specs(self, ar_scale: str = None, environment: str = 'default', max_elements: int = None,
+                         workers: int = None) -> dict:
+        """Returns the (not validated) specifications of the scene, with the data of the charts in columnar format."""
+        specs = {**self._resolve_data(columnar=True), 'environment': environment}
+
+        if ar_scale is not None: specs['ar_scale'] = ar_scale
+        if max_elements is not None: specs['max_elements'] = max_elements
+        if workers is not None: specs['workers'] = workers
+        return specs
 
     def _repr_html_(self):  # pragma: no cover (as this method is called in notebooks)
         """Returns the iframe HTML for showing the scene in the notebook."""
         return self._generate_iframe_html()
 
+    # Compiling the chart
+    def compile(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt', 'checkerboard',
+    'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano',
+    'starry', 'osiris'] = 'default', max_elements: int = None, workers: int = None) -> 'CompiledChart':
+        """
+        Returns the compiled scene, which can be rendered with different data (see CompiledChart).
+
+        Parameters
+        ----------
+        ar_scale : str (optional)
+            The scale of the scene in AR mode.
+        environment : str (optional)
+            Environment of the scene.
+        max_elements : int (optional)
+            Budget of elements of the scene (see iter_html()).
+        workers : int (optional)
+            Number of threads creating the concatenated charts (see iter_html()).
+
+        Raises
+        ------
+        TypeError
+            If the specifications of the scene have an invalid type.
+        ValueError
+            If the specifications of the scene are invalid.
+
+        Examples
+        --------
+        >>> import aframexr
+        >>> import polars as pl
+        >>> chart = aframexr.Chart().mark_bar().encode(x='model', y='sales').transform_filter('datum.sales > 10')
+        >>> compiled_chart = chart.compile()
+        >>> html = compiled_chart.render(pl.DataFrame({'model': ['A', 'B'], 'sales': [20, 30]}))
+        """
+        from .compiled import CompiledChart  # To avoid circular import error
+
+        return CompiledChart(self._get_scene_specs(ar_scale=ar_scale, environment=environment,
+                                                   max_elements=max_elements, workers=workers))
+
     # Concatenating charts
     def __add__(self, other):
         """
@@ -78,38 +267,22 @@ class TopLevelMixin:
         if not isinstance(other, TopLevelMixin):
             raise TypeError(f"Cannot add {type(other).__name__} to {type(self).__name__}.")
 
-        self_specs_list = copy.deepcopy(self._specifications.get('concat', [self._specifications]))
-        other_specs_list = copy.deepcopy(other._specifications.get('concat', [other._specifications]))
+        self_specs_list = self._specifications.get('concat', [self._specifications])
+        other_specs_list = other._specifications.get('concat', [other._specifications])
 
-        new = self.copy()  # Create a copy to modify
-        new._specifications = {'concat': self_specs_list + other_specs_list}
-        return new
+        return self._with_specs({'concat': self_specs_list + other_specs_list})  # Specifications are shared
 
     # Copy of the chart
-    def __deepcopy__(self, memo):
-        """Optimized deepcopy avoiding copying large data values."""
-        if id(self) in memo:  # Avoid copying several times the same object
-            return memo[id(self)]
-
-        new_instance = self.__class__.__new__(self.__class__)
-        memo[id(self)] = new_instance
-
-        # Separate data reference from the rest of the specifications
-        specs_copy = self._specifications.copy()  # Shallow copy
-        data_ref = specs_copy.pop('data_ref', None)
-
-        # Deep copy of the rest
-        new_instance._specifications = copy.deepcopy(specs_copy, memo)
-
-        # Restore data reference
-        if data_ref is not None:
-            new_instance._specifications['data_ref'] = data_ref
+    def __copy__(self):
+        return self._evolve()
 
-        return new_instance
+    def __deepcopy__(self, memo):
+        """The specifications are never modified in place, so they are shared instead of copied."""
+        return self._evolve()
 
     def copy(self):
-        """Return a deep copy of the chart while keeping large data as reference."""
-        return copy.deepcopy(self)
+        """Return a copy of the chart (the specifications and data are shared, as they are never modified in place)."""
+        return self._evolve()
 
     # Importing charts
     @staticmethod
@@ -129,7 +302,7 @@ class TopLevelMixin:
         """
         AframeXRValidator.validate_type('specs', specs, dict)
         chart = Chart()
-        chart._specifications = copy.deepcopy(specs)
+        chart._specifications = _copy_specs(specs)  # Not sharing the containers of specs (could be modified outside)
         return chart
 
     @staticmethod
@@ -151,7 +324,7 @@ class TopLevelMixin:
         """
         AframeXRValidator.validate_type('specs', specs, str)
         chart = Chart()
-        chart._specifications = copy.deepcopy(json.loads(specs))
+        chart._specifications = json.loads(specs)
         AframeXRValidator.validate_chart_specs(chart._specifications)
         return chart
 
@@ -162,19 +335,18 @@ class TopLevelMixin:
 
         Concatenated charts cannot be movable, each chart must be defined as movable before concatenating.
         """
-        self_copy = self.copy()
-        if 'concat' in self_copy._specifications:
+        if 'concat' in self._specifications:
             raise ValueError('Concatenated charts cannot be movable.')
 
-        self_copy._specifications['movable'] = True
-        return self_copy
+        return self._evolve(movable=True)
 
     # Exporting charts
-    def save(self, fp: str, ar_scale: str = None, file_format: Literal['json', 'html'] = None, environment:
+    def save(self, fp: str, ar_scale: str = None, file_format: Literal['json', 'html', 'glb'] = None, environment:
     Literal['default', 'contact', 'egypt', 'checkerboard', 'forest', 'goaland', 'yavapai', 'goldmine', 'arches',
-    'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano', 'starry', 'osiris'] = 'default'):
+    'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano', 'starry', 'osiris'] = 'default',
+             max_elements: int = None, workers: int = None):
         """
-        Saves the chart into a file, supported formats are JSON and HTML.
+        Saves the chart into a file, supported formats are JSON, HTML and GLB (binary glTF, see to_glb()).
 
         Parameters
         ----------
@@ -184,10 +356,14 @@ class TopLevelMixin:
             The scale of the scene in AR mode.
             If not specified, the scene will use the default scale of the JavaScript's component.
         file_format : str (optional)
-            Format of the file could be ['html', 'json'].
+            Format of the file could be ['html', 'json', 'glb'].
             If no format is specified, the chart will be saved depending on the file extension.
         environment : str (optional)
             Environment of the scene.
+        max_elements : int (optional)
+            Budget of elements of the HTML scene (see iter_html()).
+        workers : int (optional)
+            Number of threads creating the concatenated charts of the HTML scene (see iter_html()).
 
         Raises
         ------
@@ -195,60 +371,184 @@ class TopLevelMixin:
             If file_format is invalid.
         """
         AframeXRValidator.validate_type('fp', fp, str)
-        self_copy = self.copy()
 
         if file_format == 'html' or fp.endswith('.html'):
+            html_chunks = self.iter_html(ar_scale=ar_scale, environment=environment,  # Validated before writing
+                                         max_elements=max_elements, workers=workers)
             with open(fp, 'w') as file:
-                file.write(self_copy.to_html(ar_scale=ar_scale, environment=environment))
+                try:
+                    file.writelines(html_chunks)  # Streaming the chunks (the whole document is never in memory)
+                except BaseException:
+                    file.close()
+                    os.remove(fp)  # Do not keep a partial scene
+                    raise
         elif file_format == 'json' or fp.endswith('.json'):
             with open(fp, 'w') as file:
-                specs = self_copy.to_dict()
+                specs = self.to_dict()
                 specs['environment'] = environment
                 AframeXRValidator.validate_chart_specs(specs)
                 json.dump(specs, file, indent=4)
+        elif file_format == 'glb' or fp.endswith('.glb'):
+            glb = self.to_glb()  # Created before opening the file, so errors do not leave a partial file
+            with open(fp, 'wb') as file:
+                file.write(glb)
         else:
-            raise ValueError('Invalid file format. Must be "json" or "html"')
+            raise ValueError('Invalid file format. Must be "json", "html" or "glb"')
 
-    # Showing the scene
-    def show(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt', 'checkerboard', 'forest',
-    'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano', 'starry',
-    'osiris'] = 'default'):
-        """Show the scene in the notebook."""
-        with warnings.catch_warnings():
-            # Do not show the warning --> UserWarning: Consider using IPython.display.IFrame instead
-            warnings.filterwarnings('ignore', message='Consider using IPython.display.IFrame instead')
+    async def save_async(self, fp: str, ar_scale: str = None, file_format: Literal['json', 'html', 'glb'] = None,
+    environment: Literal['default', 'contact', 'egypt', 'checkerboard', 'forest', 'goaland', 'yavapai', 'goldmine',
+    'arches', 'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano', 'starry', 'osiris'] = 'default',
+                         max_elements: int = None, workers: int = None):
+        """
+        Asynchronous version of save(), not blocking the event loop.
 
-            self_copy = self.copy()
-            self_copy._resolve_data()
+        Notes
+        -----
+        HTML scenes are created as in to_html_async(), writing each chunk in a worker thread. If the task is cancelled
+        (or fails), the partial file is removed. JSON and GLB files are saved in a worker thread.
 
-            html_obj = HTML(self_copy._generate_iframe_html(
-                ar_scale=ar_scale,
-                environment=environment
-            ))
+        Examples
+        --------
+        >>> import aframexr
+        >>> chart = aframexr.Chart(aframexr.UrlData('./data.json')).mark_bar().encode(x='model', y='sales')
+        >>> #await chart.save_async('chart.html')
+        """
+        AframeXRValidator.validate_type('fp', fp, str)
 
-            display(html_obj)
-            return html_obj
+        if file_format == 'html' or fp.endswith('.html'):
+            specs = self._get_scene_specs(ar_scale=ar_scale, environment=environment, max_elements=max_elements,
+                                          workers=workers)
+            AframeXRValidator.validate_chart_specs(specs)  # Validated before writing
+            file = await asyncio.to_thread(open, fp, 'w')
+            try:
+                async for chunk in SceneCreator.iter_scene_async(specs):
+                    await asyncio.to_thread(file.write, chunk)
+            except BaseException:
+                file.close()
+                os.remove(fp)  # Do not keep a partial scene
+                raise
+            await asyncio.to_thread(file.close)
+        else:
+            await asyncio.to_thread(self.save, fp, ar_scale=ar_scale, file_format=file_format,
+                                    environment=environment, max_elements=max_elements, workers=workers)
+
+    # Showing the scene
+    def show(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt', 'checkerboard', 'forest',
+    'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano', 'starry',
+    'osiris'] = 'default', max_elements: int = None):
+        """Show the scene in the notebook (see iter_html() for max_elements)."""
+        # Wrapped in a div, so IPython does not warn "Consider using IPython.display.IFrame instead" (the warning is not
+        # ignored with warnings.catch_warnings(), as it modifies the warnings of the whole process)
+        html_obj = HTML('<div>' + self._generate_iframe_html(
+            ar_scale=ar_scale,
+            environment=environment,
+            max_elements=max_elements
+        ) + '</div>')
+
+        display(html_obj)
+        return html_obj
 
     # Chart formats
     def to_dict(self) -> dict:
         """Returns the scene specifications as a dictionary."""
-        self_copy = self.copy()
-        self_copy._resolve_data()
+        specs = _copy_specs(self._resolve_data())  # Not sharing the containers (could be modified outside)
+
+        AframeXRValidator.validate_chart_specs(specs)
+        return specs
 
-        AframeXRValidator.validate_chart_specs(self_copy._specifications)
-        return self_copy._specifications
+    def iter_html(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt', 'checkerboard',
+    'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano',
+    'starry', 'osiris'] = 'default', max_elements: int = None, workers: int = None) -> Iterator[str]:
+        """
+        Returns an iterator over the chunks of the HTML representation of the scene.
+
+        Parameters
+        ----------
+        ar_scale : str (optional)
+            The scale of the scene in AR mode.
+        environment : str (optional)
+            Environment of the scene.
+        max_elements : int (optional)
+            Budget of elements of the scene, split equally between the charts. Before the layout, the charts exceeding
+            their budget are reduced (warning about the reduction): points are aggregated into a voxel grid, lines
+            are downsampled (LTTB) and the largest bars and arcs are kept, adding the rest into one element. If not
+            defined, the charts are not reduced.
+        workers : int (optional)
+            Number of threads creating the concatenated charts. The output (and the order of the warnings) is the same
+            as creating them one after another, but the HTML of the charts is kept in memory until all of them are
+            created. If not defined, the charts are created one after another (streaming each chart).
+
+        Notes
+        -----
+        The specifications are validated when calling this method, but the charts are created while iterating, so
+        the whole document is never stored in memory.
+
+        Rendering is thread-safe: the same or different charts can be rendered concurrently from several threads
+        (with the same output as rendering them one after another). The specifications of the charts are not modified
+        while rendering, the caches of the data are protected by locks, and the warnings are not handled through the
+        process-global state of warnings.catch_warnings().
+
+        Examples
+        --------
+        >>> import aframexr
+        >>> chart = aframexr.Chart(aframexr.UrlData('./data.json')).mark_bar().encode(x='model', y='sales')
+        >>> #with open('chart.html', 'w') as file:
+        >>> #    file.writelines(chart.iter_html())
+        """
+        specs = self._get_scene_specs(ar_scale=ar_scale, environment=environment, max_elements=max_elements,
+                                      workers=workers)
+        AframeXRValidator.validate_chart_specs(specs)
+        return SceneCreator.iter_scene(specs)
 
     def to_html(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt', 'checkerboard',
     'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan', 'dream', 'volcano',
-    'starry', 'osiris'] = 'default') -> str:
-        """Returns the HTML representation of the scene."""
-        self_copy = self.copy()
-        self_copy._resolve_data()
+    'starry', 'osiris'] = 'default', max_elements: int = None, workers: int = None) -> str:
+        """Returns the HTML representation of the scene (see iter_html() for max_elements and workers)."""
+        return ''.join(self.iter_html(ar_scale=ar_scale, environment=environment, max_elements=max_elements,
+                                      workers=workers))
+
+    async def to_html_async(self, ar_scale: str = None, environment: Literal['default', 'contact', 'egypt',
+    'checkerboard', 'forest', 'goaland', 'yavapai', 'goldmine', 'arches', 'threetowers', 'poison', 'tron', 'japan',
+    'dream', 'volcano', 'starry', 'osiris'] = 'default', max_elements: int = None, workers: int = None) -> str:
+        """
+        Asynchronous version of to_html(), not blocking the event loop (see iter_html() for max_elements and workers).
+
+        Notes
+        -----
+        The data of the charts is loaded in worker threads (all the URLs concurrently, using the HTTP cache for the
+        remote data). Then, the scene is created chunk by chunk in a worker thread, so the event loop keeps serving
+        other tasks and the task can be cancelled between chunks.
+
+        Examples
+        --------
+        >>> import aframexr
+        >>> chart = aframexr.Chart(aframexr.UrlData('./data.json')).mark_bar().encode(x='model', y='sales')
+        >>> #html = await chart.to_html_async()
+        """
+        specs = self._get_scene_specs(ar_scale=ar_scale, environment=environment, max_elements=max_elements,
+                                      workers=workers)
+        AframeXRValidator.validate_chart_specs(specs)
+        return ''.join([chunk async for chunk in SceneCreator.iter_scene_async(specs)])
+
+    def to_glb(self) -> bytes:
+        """
+        Returns the binary glTF (GLB) of the geometry of the scene.
+
+        Notes
+        -----
+        The elements of each chart are merged into one mesh, with one primitive per color, so the scene can be loaded
+        in one request (for example, with a GLTF element). Texts (labels, titles and legends) and single elements are
+        not exported, and charts filtered by params are exported with all their data.
 
-        if ar_scale is not None: self_copy._specifications['ar_scale'] = ar_scale
-        self_copy._specifications['environment'] = environment
-        AframeXRValidator.validate_chart_specs(self_copy._specifications)
-        return SceneCreator.create_scene(self_copy._specifications)
+        Examples
+        --------
+        >>> import aframexr
+        >>> chart = aframexr.Chart(aframexr.UrlData('./data.json')).mark_bar().encode(x='model', y='sales')
+        >>> #chart.save('chart.glb')
+        """
+        specs = self._resolve_data(columnar=True)
+        AframeXRValidator.validate_chart_specs(specs)
+        return GLBCreator.create_glb(specs)
 
     def to_json(self) -> str:
         """Returns the JSON string of the scene."""
@@ -261,8 +561,9 @@ class Chart(TopLevelMixin):
 
     Parameters
     ----------
-    data : Data | UrlData | DataFrame
-        Data, UrlData object or pandas DataFrame of the data.
+    data : Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table
+        Data, UrlData object, pandas DataFrame, polars DataFrame or LazyFrame, or pyarrow Table of the data.
+        LazyFrames are kept lazy until the transformations of the chart are applied.
     depth : float (optional)
         Depth of the chart. If not defined, using DEFAULT_CHART_DEPTH.
     height : float (optional)
@@ -283,8 +584,9 @@ class Chart(TopLevelMixin):
     ValueError
         If depth, height, position, rotation or width is invalid.
     """
-    def __init__(self, data: Data | UrlData | DataFrame = None, depth: float = None, height: float = None,
-                 title: str = None, position: str = None, rotation: str = None, width: float = None):
+    def __init__(self, data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table = None,
+                 depth: float = None, height: float = None, title: str = None, position: str = None,
+                 rotation: str = None, width: float = None):
         super().__init__({})  # Initiate specifications
 
         if data is not None: self._specifications['data_ref'] = data
@@ -297,19 +599,10 @@ class Chart(TopLevelMixin):
 
     # Parameters
     def add_params(self, *params: Parameter):
-        self_copy = self.copy()
-
         for p in params:
             AframeXRValidator.validate_type('params', p, Parameter)
 
-        if 'params' not in self_copy._specifications:
-            self_copy._specifications['params'] = []
-
-        self_copy._specifications['params'].extend(
-            [p.to_specs() for p in params]
-        )
-
-        return self_copy
+        return self._evolve(params=self._specifications.get('params', []) + [p.to_specs() for p in params])
 
     # Types of charts
     def mark_arc(self, radius: float = None):
@@ -321,17 +614,15 @@ class Chart(TopLevelMixin):
         radius : float (optional)
             Outer radius of the pie chart. If not specified, using DEFAULT_PIE_RADIUS. Must be greater than 0.
         """
-        self_copy = self.copy()
-
-        self_copy._specifications['mark'] = {'type': 'arc'}
+        mark = {'type': 'arc'}
 
         if radius is not None:
             AframeXRValidator.validate_positive_number('radius', radius)
-            self_copy._specifications['mark']['radius'] = radius
+            mark['radius'] = radius
 
-        return self_copy
+        return self._evolve(mark=mark)
 
-    def mark_bar(self, color: str = None, size: float = None):
+    def mark_bar(self, color: str = None, size: float = None, instanced: bool = None):
         """
         Bars chart.
 
@@ -341,27 +632,32 @@ class Chart(TopLevelMixin):
             Color of the bars. If not defined, using DEFAULT_ELEMENTS_COLOR_IN_CHART.
         size : float (optional)
             Width of the bars. If not specified, bars will be adjusted automatically. Must be greater than 0.
+        instanced : bool (optional)
+            Either if render all the bars as one instanced mesh (one draw call, for large data) or one entity per bar.
+            If not defined, using DEFAULT_INSTANCED_RENDERING.
 
         Raises
         ------
         ValueError
             If defined size is not greater than 0.
         """
-        self_copy = self.copy()
-
-        self_copy._specifications['mark'] = {'type': 'bar'}
+        mark = {'type': 'bar'}
 
         if color is not None:
             AframeXRValidator.validate_type('color', color, str)
-            self_copy._specifications['mark']['color'] = color
+            mark['color'] = color
 
         if size is not None:
             AframeXRValidator.validate_positive_number('size', size)
-            self_copy._specifications['mark']['size'] = size
+            mark['size'] = size
+
+        if instanced is not None:
+            AframeXRValidator.validate_type('instanced', instanced, bool)
+            mark['instanced'] = instanced
 
-        return self_copy
+        return self._evolve(mark=mark)
 
-    def mark_line(self, color: str = None, point: bool = None):
+    def mark_line(self, color: str = None, point: bool = None, polyline: bool = None, max_points: int = None):
         """
         Line chart.
 
@@ -371,22 +667,43 @@ class Chart(TopLevelMixin):
             Color of the line. If not defined, using DEFAULT_ELEMENTS_COLOR_IN_CHART.
         point : bool (optional)
             Either if add points in vertices or not. If not defined, markers will not be added.
-        """
-        self_copy = self.copy()
+        polyline : bool (optional)
+            Either if render each series (color) of the line as one entity with all its vertices (for large data, the
+            markers are rendered as one instanced mesh) or one entity per segment. If not defined, using
+            DEFAULT_POLYLINE_RENDERING.
+        max_points : int (optional)
+            Maximum number of vertices of each series (color) of the line. Longer series are downsampled with the
+            Largest-Triangle-Three-Buckets algorithm, keeping the visual shape. If not defined, all the vertices are
+            drawn. Must be greater than 2.
 
-        self_copy._specifications['mark'] = {'type': 'line'}
+        Raises
+        ------
+        ValueError
+            If max_points is not greater than 2.
+        """
+        mark = {'type': 'line'}
 
         if color is not None:
             AframeXRValidator.validate_type('color', color, str)
-            self_copy._specifications['mark']['color'] = color
+            mark['color'] = color
 
         if point is not None:
             AframeXRValidator.validate_type('point', point, bool)
-            self_copy._specifications['mark']['point'] = point
+            mark['point'] = point
+
+        if polyline is not None:
+            AframeXRValidator.validate_type('polyline', polyline, bool)
+            mark['polyline'] = polyline
+
+        if max_points is not None:
+            AframeXRValidator.validate_type('max_points', max_points, int)
+            if max_points < 3:  # First and last vertices, and at least one bucket
+                raise ValueError(ERROR_MESSAGES['MAX_POINTS'].format(max_points=max_points))
+            mark['max_points'] = max_points
 
-        return self_copy
+        return self._evolve(mark=mark)
 
-    def mark_point(self, color: str = None, size: float = None):
+    def mark_point(self, color: str = None, size: float = None, instanced: bool = None, cloud: bool = None):
         """
         Scatter plot and bubble chart.
 
@@ -396,25 +713,38 @@ class Chart(TopLevelMixin):
             Color of the spheres. If not defined, using DEFAULT_ELEMENTS_COLOR_IN_CHART.
         size : float (optional)
             Maximum volume of the point. If not specified, using DEFAULT_POINT_VOLUME. Must be greater than 0.
+        instanced : bool (optional)
+            Either if render all the points as one instanced mesh (one draw call, for large data) or one entity per
+            point. If not defined, using DEFAULT_INSTANCED_RENDERING.
+        cloud : bool (optional)
+            Either if render all the points as a point cloud (for millions of points, without information display) or
+            not. The point cloud takes precedence over the instanced mesh. If not defined, using
+            DEFAULT_POINT_CLOUD_RENDERING.
 
         Raises
         ------
         ValueError
             If size is not greater than 0.
         """
-        self_copy = self.copy()
-
-        self_copy._specifications['mark'] = {'type': 'point'}
+        mark = {'type': 'point'}
 
         if color is not None:
             AframeXRValidator.validate_type('color', color, str)
-            self_copy._specifications['mark']['color'] = color
+            mark['color'] = color
 
         if size is not None:
             AframeXRValidator.validate_positive_number('size', size)
-            self_copy._specifications['mark']['size'] = size
+            mark['size'] = size
+
+        if instanced is not None:
+            AframeXRValidator.validate_type('instanced', instanced, bool)
+            mark['instanced'] = instanced
+
+        if cloud is not None:
+            AframeXRValidator.validate_type('cloud', cloud, bool)
+            mark['cloud'] = cloud
 
-        return self_copy
+        return self._evolve(mark=mark)
 
     # Parameters of the chart
     def encode(self, color: str = None, size: str = None, theta: str = None, x: str | X = None, y: str | Y = None,
@@ -467,9 +797,7 @@ class Chart(TopLevelMixin):
             filled_params['z'] = z
 
         # Do the encoding
-        self_copy = self.copy()
-
-        encoding = self_copy._specifications.setdefault('encoding', {})  # For merging possible further encodings
+        encoding = dict(self._specifications.get('encoding', {}))  # For merging possible further encodings
         for param_key in filled_params:
             param_value = filled_params[param_key]
             if isinstance(param_value, Encoding):
@@ -483,22 +811,23 @@ class Chart(TopLevelMixin):
                 if encoding_type:
                     encoding[param_key]['type'] = encoding_type
 
-        return self_copy
+        return self._evolve(encoding=encoding)
 
-    def properties(self, data: Data | UrlData | DataFrame = None, depth: float = None, height: float = None,
-                   position: str = None, rotation: str = None, title: str = None, width: float = None):
+    def properties(self, data: Data | UrlData | DataFrame | pl.DataFrame | pl.LazyFrame | Table = None,
+                   depth: float = None, height: float = None, position: str = None, rotation: str = None,
+                   title: str = None, width: float = None):
         """Modify general properties of the chart."""
-        self_copy = self.copy()
+        properties = {}
 
-        if data is not None: self_copy._specifications['data_ref'] = data
-        if position is not None: self_copy._specifications['position'] = position
-        if rotation is not None: self_copy._specifications['rotation'] = rotation
-        if depth is not None: self_copy._specifications['depth'] = depth
-        if height is not None: self_copy._specifications['height'] = height
-        if width is not None: self_copy._specifications['width'] = width
-        if title is not None: self_copy._specifications['title'] = title
+        if data is not None: properties['data_ref'] = data
+        if position is not None: properties['position'] = position
+        if rotation is not None: properties['rotation'] = rotation
+        if depth is not None: properties['depth'] = depth
+        if height is not None: properties['height'] = height
+        if width is not None: properties['width'] = width
+        if title is not None: properties['title'] = title
 
-        return self_copy
+        return self._evolve(**properties)
 
     # Modifying data
     def transform_aggregate(self, groupby: list = None, **kwargs):
@@ -514,9 +843,6 @@ class Chart(TopLevelMixin):
         """
         AframeXRValidator.validate_type('groupby', groupby, (list, type(None)))
 
-        # Create a copy of the chart (in case of assignation, to preserve the main chart)
-        aggreg_chart = self.copy()
-
         aggregates_to_dict = []
         for as_field, aggregate_formula in kwargs.items():
             field, aggregate_op = AggregatedFieldDef.split_operator_field(str(aggregate_formula))
@@ -527,11 +853,44 @@ class Chart(TopLevelMixin):
         if groupby:
             aggregate_specs['groupby'] = groupby
 
-        if not aggreg_chart._specifications.get('transform'):  # First time filtering the chart (create field)
-            aggreg_chart._specifications['transform'] = [aggregate_specs]
-        else:  # Not the first filter of the chart (add to aggregates)
-            aggreg_chart._specifications['transform'].append(aggregate_specs)
-        return aggreg_chart
+        # Return a new chart (in case of assignation, to preserve the main chart)
+        return self._evolve(transform=(self._specifications.get('transform') or []) + [aggregate_specs])
+
+    def transform_bin(self, as_field: str, field: str, maxbins: int = DEFAULT_MAXBINS, step: float = None):
+        """
+        Bins the values of the field, storing the start and the end of their bins.
+
+        Parameters
+        ----------
+        as_field : str
+            Field storing the start of the bin of each value. The end of the bin is stored in "<as_field>_end".
+        field : str
+            Data field that will be binned (must be quantitative).
+        maxbins : int (optional)
+            Maximum number of bins. Ignored if step is defined. If not defined, using DEFAULT_MAXBINS.
+        step : float (optional)
+            Exact size of the bins.
+
+        Notes
+        -----
+        The bins are computed by polars inside the query of the chart, so it can be followed by an aggregate (see
+        Examples) to reduce a large column into a few bars.
+
+        Examples
+        --------
+        >>> import aframexr
+        >>> import polars as pl
+        >>> data = pl.DataFrame({'value': [0.5, 1.2, 1.7, 3.1, 4.9]})
+        >>> histogram = (aframexr.Chart(data).mark_bar().encode(x='binned', y='count')
+        ...              .transform_bin('binned', 'value', maxbins=5).transform_aggregate(count='count()'))
+        >>> #histogram.show()
+        """
+        bin_object = BinFieldDef(field, as_field, maxbins, step)
+        if not as_field:
+            raise ValueError('Parameter "as_field" cannot be empty using bin.')
+
+        bin_specs = {'bin': bin_object.to_dict(), 'field': field, 'as': as_field}
+        return self._evolve(transform=(self._specifications.get('transform') or []) + [bin_specs])
 
     def transform_filter(self, equation_filter: str | FilterTransform | Parameter):
         """
@@ -582,15 +941,9 @@ class Chart(TopLevelMixin):
         else:  # pragma: no cover
             raise RuntimeError('Unreachable code. Parameter should have been validated before')
 
-        # Create a copy of the chart (in case of assignation, to preserve the main chart)
-        filt_chart = self.copy()
-
-        # Add the information of the filter object to the specifications
-        if not filt_chart._specifications.get('transform'):  # First time filtering the chart
-            filt_chart._specifications['transform'] = [{'filter': filter_transform.to_dict()}]
-        else:  # Not the first filter of the chart
-            filt_chart._specifications['transform'].append({'filter': filter_transform.to_dict()})
-        return filt_chart  # Returns the copy of the chart
+        # Add the information of the filter object to the specifications of a new chart (to preserve the main chart)
+        transform = (self._specifications.get('transform') or []) + [{'filter': filter_transform.to_dict()}]
+        return self._evolve(transform=transform)
 
 
 class Element(TopLevelMixin, ABC):
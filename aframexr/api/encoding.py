@@ -17,16 +17,23 @@ class Encoding(ABC):
         The encoding type.
     groupby: list | None (optional)
         The fields of the aggrupation.
+    bin: bool | int | None (optional)
+        If the values of the field are binned (replaced by the start of their bins). If it is an integer, it is the
+        maximum number of bins (if True, using DEFAULT_MAXBINS).
     """
 
     @abstractmethod
     def __init__(self, field: str | None = None, aggregate: str | None = None, axis: bool | None = True,
-                 encoding_type: str | None = None, groupby: list | None = None):
+                 encoding_type: str | None = None, groupby: list | None = None, bin: bool | int | None = None):
+        AframeXRValidator.validate_type('bin', bin, (bool, int, type(None)))
+        if bin is not None and not isinstance(bin, bool):
+            AframeXRValidator.validate_positive_number('bin', bin)
         self._field = field
         self._aggregate = aggregate
         self._axis = axis
         self._encoding_type = encoding_type
         self._groupby = groupby
+        self._bin = bin
 
     # Export
     def to_dict(self):
@@ -42,6 +49,10 @@ class Encoding(ABC):
             spec_dict.update({'encoding_type': self._encoding_type})
         if self._groupby:
             spec_dict.update({'group_by': self._groupby})
+        if self._bin is True:
+            spec_dict.update({'bin': True})
+        elif self._bin:  # Maximum number of bins
+            spec_dict.update({'bin': {'maxbins': self._bin}})
 
         return {f'{self.__class__.__name__.lower()}': spec_dict}
 
@@ -74,17 +85,20 @@ class Encoding(ABC):
 
 class X(Encoding):
     def __init__(self, field: str | None = None, aggregate: str | None = None,
-                 axis: bool | None = True, encoding_type: str | None = None, groupby: list | None = None):
-        super().__init__(field, aggregate, axis, encoding_type, groupby)
+                 axis: bool | None = True, encoding_type: str | None = None, groupby: list | None = None,
+                 bin: bool | int | None = None):
+        super().__init__(field, aggregate, axis, encoding_type, groupby, bin)
 
 
 class Y(Encoding):
     def __init__(self, field: str | None = None, aggregate: str | None = None,
-                 axis: bool | None = True, encoding_type: str | None = None, groupby: list | None = None):
-        super().__init__(field, aggregate, axis, encoding_type, groupby)
+                 axis: bool | None = True, encoding_type: str | None = None, groupby: list | None = None,
+                 bin: bool | int | None = None):
+        super().__init__(field, aggregate, axis, encoding_type, groupby, bin)
 
 
 class Z(Encoding):
     def __init__(self, field: str | None = None, aggregate: str | None = None,
-                 axis: bool | None = True, encoding_type: str | None = None, groupby: list | None = None):
-        super().__init__(field, aggregate, axis, encoding_type, groupby)
+                 axis: bool | None = True, encoding_type: str | None = None, groupby: list | None = None,
+                 bin: bool | int | None = None):
+        super().__init__(field, aggregate, axis, encoding_type, groupby, bin)
@@ -1,7 +1,6 @@
 import polars as pl
 import shlex
 from abc import ABC, abstractmethod
-from polars import DataFrame
 
 from ..utils.validators import AframeXRValidator
 
@@ -93,20 +92,47 @@ class FilterTransform(ABC):
             raise ValueError(f'There is no filter for specifications: {filter_specs}')
 
     # Filter data
-    def get_filtered_data(self, data: DataFrame) -> DataFrame:
-        """Filters and returns the data."""
+    def get_condition(self, schema: pl.Schema) -> pl.Expr:
+        """
+        Returns the polars expression of the filter.
+
+        Raises
+        ------
+        KeyError
+            If the field is not in the schema of the data.
+        TypeError
+            If the type of the value does not match the type of the field.
+        ValueError
+            If the field is an Enum and the value is not one of its categories (except for equality).
+
+        Notes
+        -----
+        String, Categorical and Enum fields are compared with strings, and numeric and Boolean fields with numbers.
+        Other fields (temporal, nested, binary, ...) cannot be filtered.
+        """
         if not self._magic_method:  # pragma: no cover
             raise RuntimeError(f'Unreachable code. Magic method was not defined in {self.__class__.__name__} class')
 
-        try:
-            condition = getattr(pl.col(self.field), self._magic_method)(self.value)
-            filtered_data = data.filter(condition)
-        except pl.exceptions.ColumnNotFoundError:
+        if self.field not in schema:
             raise KeyError(f'Data has no field "{self.field}".')
-        except pl.exceptions.ComputeError as e:
-            raise TypeError(f'Type mismatch: column "{self.field}" has type {data[self.field].dtype} '
-                            f'but value is of type {type(self.value).__name__}') from e
-        return filtered_data
+
+        dtype = schema[self.field]
+        if dtype in (pl.String, pl.Categorical, pl.Enum):
+            is_compatible = isinstance(self.value, str)
+        elif dtype.is_numeric() or dtype == pl.Boolean:
+            is_compatible = not isinstance(self.value, str)
+        elif dtype == pl.Null:  # Column without values (nothing passes the filter)
+            is_compatible = True
+        else:
+            is_compatible = False
+        if not is_compatible:
+            raise TypeError(f'Type mismatch: column "{self.field}" has type {dtype} '
+                            f'but value is of type {type(self.value).__name__}')
+
+        if dtype == pl.Enum and self._operator != '==' and self.value not in dtype.categories:
+            raise ValueError(f'Value "{self.value}" is not a category of column "{self.field}" (type {dtype}).')
+
+        return getattr(pl.col(self.field), self._magic_method)(self.value)
 
 
 class FieldEqualPredicate(FilterTransform):
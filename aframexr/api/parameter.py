@@ -1,12 +1,39 @@
+from typing import Literal
+
+from ..utils.constants import AVAILABLE_PARAM_VIEWS, DEFAULT_PARAM_VIEWS, ERROR_MESSAGES
 from ..utils.validators import AframeXRValidator
 
 # Selections
-def selection_point(name: str, fields: list) -> 'Parameter':
-    """Add selection to the chart."""
+def selection_point(name: str, fields: list, views: Literal['charts', 'elements'] = DEFAULT_PARAM_VIEWS) -> 'Parameter':
+    """
+    Add selection to the chart.
+
+    Parameters
+    ----------
+    name : str
+        Name of the param.
+    fields : list
+        Data fields of the selection.
+    views : str (optional)
+        How the charts filtered by the param are rendered. Using "charts", one chart (elements, axes, title and
+        legend) is created per combination of the values of the fields. Using "elements", only one chart is created
+        (with shared axes, title and legend), and each element is shown when its combination is selected. If not
+        defined, using DEFAULT_PARAM_VIEWS.
+
+    Raises
+    ------
+    ValueError
+        If views is invalid.
+    """
     AframeXRValidator.validate_type('name', name, str)
     AframeXRValidator.validate_type('fields', fields, list)
+    AframeXRValidator.validate_type('views', views, str)
+    if views not in AVAILABLE_PARAM_VIEWS:
+        raise ValueError(ERROR_MESSAGES['PARAM_VIEWS'].format(views=views))
 
     select_config = {'type': 'point', 'fields': fields}
+    if views != DEFAULT_PARAM_VIEWS:
+        select_config['views'] = views
     return Parameter(name=name, select=select_config)
 
 
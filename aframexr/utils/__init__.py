@@ -3,7 +3,10 @@
 from .axis_creator import *
 from .chart_creator import *
 from .constants import *
+from .data_cache import *
 from .entities_html_creator import *
+from .glb_creator import *
+from .http_cache import *
 from .chart_creator import *
 from .scene_creator import *
 from .validators import *
@@ -1,16 +1,24 @@
+import base64
+import html
+import json
 import polars as pl
+import sys
 import warnings
 
-from itertools import cycle, islice
+from array import array
+from itertools import chain, cycle, islice
 from polars import DataFrame, Series
 from polars.datatypes.group import NUMERIC_DTYPES
 from typing import Literal
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .axis_creator import AxisCreator
 from .constants import *
-from .element_creator import (
-    BoxCreator, CylinderCreator, ElementCreator, PlaneCreator, SphereCreator, TextCreator, LineCreator
-)
+from .element_creator import ElementCreator, ElementsBatchCreator, PlaneCreator, TextCreator
 
 CREATOR_MAP: dict[str, type['ChartCreator']] = {}  # Creator map of charts, classes are added at the end of this file
 
@@ -19,12 +27,104 @@ def _calculate_point_radius(point_volume: float) -> float:
     return (3 * point_volume / (4 * 3.1416)) ** (1 / 3)
 
 
+def _selection_key_expr(param_name: str, fields: list) -> pl.Expr:
+    """Returns the expression of the selection key ({param_name}__{values}) of each row of the data."""
+    expressions = [pl.lit(param_name)] + [pl.col(f).cast(pl.Utf8).fill_null('') for f in fields]
+    return pl.concat_str(expressions, separator='__')
+
+
+_TYPED_ARRAY_CODES = {pl.Float32: 'f', pl.UInt16: 'H', pl.UInt32: 'I'}  # Typecodes (of array module) of typed arrays
+
+
+def _pack_typed_array(dtype: type[pl.DataType], *columns: Series) -> bytes:
+    """
+    Returns the bytes of the columns packed as a little-endian typed array (as expected by JavaScript and glTF).
+
+    Notes
+    -----
+    The values are interleaved by rows (x, y, z of each element). If numpy is installed, the values are packed without
+    converting them to Python objects.
+    """
+    values = pl.DataFrame({str(i): column for i, column in enumerate(columns)}).cast(dtype)
+    if np is not None:
+        packed = values.to_numpy(order='c')
+        return packed.astype(packed.dtype.newbyteorder('<'), copy=False).tobytes()
+
+    packed = array(_TYPED_ARRAY_CODES[dtype], chain.from_iterable(values.iter_rows()))
+    if sys.byteorder == 'big':  # pragma: no cover (typed arrays of the browser are little-endian)
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _encode_typed_array(dtype: type[pl.DataType], *columns: Series) -> str:
+    """Returns the base64 encoding of the columns packed as a little-endian typed array."""
+    return base64.b64encode(_pack_typed_array(dtype, *columns)).decode('ascii')
+
+
+def _get_color_palette(colors: Series) -> tuple[Series, Series]:
+    """Returns a tuple with the unique colors (palette) and the index in the palette of each color."""
+    palette = colors.unique(maintain_order=True)
+    color_indices = colors.replace_strict(palette, pl.int_range(palette.len(), eager=True), return_dtype=pl.UInt16)
+    return palette, color_indices
+
+
+def _get_lttb_indices(x: Series | None, y: Series, series: Series | None, max_points: int) -> Series:
+    """
+    Returns the sorted indices of the rows kept by the Largest-Triangle-Three-Buckets downsampling of each series.
+
+    Parameters
+    ----------
+    x : Series | None
+        Quantitative values of the x-axis. If None, the position of each row in its series is used.
+    y : Series
+        Quantitative values of the y-axis.
+    series : Series | None
+        Series (color) of each row. If None, all the rows are one series.
+    max_points : int
+        Maximum number of rows of each series (greater than 2).
+
+    Notes
+    -----
+    The first and last rows of each series are kept, and the rest are split into max_points - 2 buckets. Of each
+    bucket, the row forming the largest triangle with the averages of the previous and next buckets is kept (using
+    the average of the previous bucket instead of its kept row, so all the buckets are computed at once by polars).
+    """
+    rows = pl.DataFrame({
+        'series': series.rank('dense').fill_null(0) if series is not None else pl.repeat(0, y.len(), eager=True),
+        'y': y.cast(pl.Float64),
+    }).with_row_index('row').with_columns(
+        i=pl.int_range(pl.len()).over('series'),
+        m=pl.len().over('series'),
+    ).with_columns(
+        x=x.cast(pl.Float64) if x is not None else pl.col('i').cast(pl.Float64),
+        bucket=pl.when(pl.col('m') <= max_points).then(pl.col('i'))  # Short series are kept
+        .when(pl.col('i') == 0).then(-1)  # First row
+        .when(pl.col('i') == pl.col('m') - 1).then(max_points - 2)  # Last row
+        .otherwise((pl.col('i') - 1) * (max_points - 2) // (pl.col('m') - 2)),
+    )
+
+    averages = rows.group_by('series', 'bucket').agg(pl.col('x').mean(), pl.col('y').mean())
+    previous = averages.select('series', pl.col('bucket') + 1, previous_x='x', previous_y='y')
+    following = averages.select('series', pl.col('bucket') - 1, next_x='x', next_y='y')
+    area = (  # Twice the area of the triangle (previous average, row, next average)
+        (pl.col('previous_x') - pl.col('next_x')) * (pl.col('y') - pl.col('previous_y'))
+        - (pl.col('previous_x') - pl.col('x')) * (pl.col('next_y') - pl.col('previous_y'))
+    ).abs().fill_null(0)
+
+    return (
+        rows.join(previous, on=['series', 'bucket'], how='left')
+        .join(following, on=['series', 'bucket'], how='left')
+        .group_by('series', 'bucket').agg(pl.col('row').sort_by(area, descending=True).first())
+        .get_column('row').sort()
+    )
+
+
 def _translate_dtype_into_encoding(dtype: pl.DataType) -> str:
     """Translates and returns the encoding for a given data type."""
 
     if dtype in NUMERIC_DTYPES:
         encoding_type = 'quantitative'
-    elif dtype in (pl.String, pl.Categorical):
+    elif dtype in (pl.String, pl.Categorical, pl.Enum):
         encoding_type = 'nominal'
     else:
         raise ValueError(f'Unknown dtype: {dtype}.')
@@ -34,7 +134,7 @@ def _translate_dtype_into_encoding(dtype: pl.DataType) -> str:
 class ChartCreator:
     """Chart creator base class"""
 
-    def __init__(self, chart_specs: dict):
+    def __init__(self, chart_specs: dict, raw_data: DataFrame | None = None, filtering_param: dict | None = None):
         base_position = chart_specs.get('position', DEFAULT_CHART_POS)
         [self._base_x, self._base_y, self._base_z] = [float(pos) for pos in base_position.split()]  # Base position
         self._encoding = chart_specs.get('encoding')  # Encoding and parameters of the chart
@@ -42,7 +142,7 @@ class ChartCreator:
         [self._x_rotation, self._y_rotation, self._z_rotation] = [float(rot) for rot in rotation.split()]
         self._params = chart_specs.get('params', [])  # Metadata parameters
         self._process_params()
-        self._raw_data = DataFrame(chart_specs['data']['values'])
+        self._raw_data = raw_data if raw_data is not None else DataFrame(chart_specs['data']['values'])
 
         self._elements_colors_all = chart_specs['mark'].get('color', DEFAULT_ELEMENTS_COLOR_IN_CHART) \
             if isinstance(chart_specs['mark'], dict) else DEFAULT_ELEMENTS_COLOR_IN_CHART
@@ -52,8 +152,84 @@ class ChartCreator:
         self._chart_depth = chart_specs.get('depth')  # Maximum depth of the chart
 
         self._title = chart_specs.get('title')
+        self._filtering_param = filtering_param  # Param whose views are rendered as tags of the elements
+        self._max_elements: int | None = chart_specs.get('max_elements')  # Budget of elements of the chart
         # Each self._{channel} attributes must be named by child classes
 
+    def _apply_elements_budget(self, *channels_name: str) -> None:
+        """
+        Reduces the rows of the data if they exceed the budget of elements of the chart, warning about the reduction.
+        Must be called by child classes before the layout, giving the channels to process again after the reduction.
+        """
+        if self._max_elements is None:
+            return
+        elements = self._count_elements()
+        if elements <= self._max_elements:
+            return
+
+        reduction = self._reduce_elements(self._max_elements)
+        self._process_channels(*channels_name)  # Process the channels of the reduced data
+        warnings.warn(f'Chart has {elements} elements, exceeding the budget of {self._max_elements} elements: '
+                      f'{reduction} ({self._count_elements()} elements).')
+
+    def _count_elements(self) -> int:
+        """Returns the number of elements of the chart counted by the budget (one per row, by default)."""
+        return self._raw_data.height
+
+    def _reduce_elements(self, max_elements: int) -> str:  # pragma: no cover
+        raise RuntimeError('Unreachable code. Method _reduce_elements() must be implemented by child classes')
+
+    def _keep_top_elements(self, value_channel: str, max_elements: int) -> str:
+        """
+        Keeps the elements with the largest (absolute) values of the channel, adding the rest into one element if the
+        other encoded channels are nominal. The encoded fields of that element are OTHER_ELEMENTS_LABEL (as strings)
+        and the fields that are not encoded are null. Returns the reduction applied.
+        """
+        value_data: Series | None = getattr(self, f'_{value_channel}_data')
+        if value_data is None or getattr(self, f'_{value_channel}_encoding') != 'quantitative':
+            self._raw_data = self._raw_data.head(max_elements)
+            return f'kept the first {max_elements} elements'
+
+        value_field = self._encoding[value_channel]['field']
+        encoded_channels = {channel: channel_specs['field'] for channel, channel_specs in self._encoding.items()
+                            if channel_specs.get('field') and channel_specs['field'] != value_field}
+        add_other = all(getattr(self, f'_{channel}_encoding', None) == 'nominal' for channel in encoded_channels)
+        kept = max_elements - 1 if add_other else max_elements
+
+        order = value_data.abs().arg_sort(descending=True, nulls_last=True)
+        if not add_other:
+            self._raw_data = self._raw_data[order[:kept].sort()]  # Keep the order of the data
+            return f'kept the {kept} largest elements by "{value_field}"'
+
+        nominal_fields = set(encoded_channels.values())
+        data = self._raw_data.with_columns(pl.col(*nominal_fields).cast(pl.String)) if nominal_fields \
+            else self._raw_data  # Categorical and enum fields cannot store the label of the element
+        other_data = data[order[kept:]].select(
+            *(pl.lit(OTHER_ELEMENTS_LABEL if field in nominal_fields else None, dtype=data.schema[field]).alias(field)
+              for field in data.columns if field != value_field),
+            pl.col(value_field).sum().cast(data.schema[value_field]),
+        ).select(data.columns)
+        self._raw_data = pl.concat([data[order[:kept].sort()], other_data])
+        return f'kept the {kept} largest elements by "{value_field}", adding the rest as "{OTHER_ELEMENTS_LABEL}"'
+
+    def _get_param_keys(self) -> Series | None:
+        """Returns a Series of the selection key of the filtering param for each row, or None if not filtered."""
+        if self._filtering_param is None:
+            return None
+
+        param_name = self._filtering_param['name']
+        fields = self._filtering_param['select'].get('fields', [])
+        return self._raw_data.select(_selection_key_expr(param_name, fields).alias('param_key')).to_series()
+
+    def _add_param_keys_to_specs(self, specs: dict) -> None:
+        """Adds the selection key of the filtering param to the elements, which are hidden until it is selected."""
+        param_keys = self._get_param_keys()
+        if param_keys is None:
+            return
+
+        specs['param_key'] = param_keys
+        specs['visible'] = pl.repeat('false', n=param_keys.len(), eager=True)
+
     def _add_selection_to_specs(self, specs: dict) -> None:
         if not getattr(self, "_selection", None):
             return
@@ -61,12 +237,8 @@ class ChartCreator:
         param_name = self._selection['name']
         select_fields = self._selection['fields']
 
-        expressions = [pl.lit(param_name)] + [
-            pl.col(f).cast(pl.Utf8).fill_null("")
-            for f in select_fields
-        ]
         specs['activates_param'] = self._raw_data.select(
-            pl.concat_str(expressions, separator="__")
+            _selection_key_expr(param_name, select_fields)
         ).to_series().to_list()
 
     def _process_channels(self, *channels_name: str):
@@ -141,13 +313,32 @@ class ChartCreator:
         return info
 
     @staticmethod
-    def create_object(chart_type: str, chart_specs: dict):
-        """Returns a ChartCreator instance of the specific chart type."""
+    def create_object(chart_type: str, chart_specs: dict, raw_data: DataFrame | None = None,
+                      filtering_param: dict | None = None):
+        """
+        Returns a ChartCreator instance of the specific chart type.
+
+        Parameters
+        ----------
+        chart_type : str
+            Type of the chart (mark type).
+        chart_specs : dict
+            Chart specifications.
+        raw_data : DataFrame (optional)
+            Already transformed data of the chart. If not defined, data is taken from chart_specs['data']['values'].
+        filtering_param : dict (optional)
+            Specifications of the param filtering the chart. If defined, each element is tagged with its selection key
+            (and hidden until the selection), instead of creating one chart per combination of the param.
+        """
+        return ChartCreator.get_creator(chart_type)(chart_specs, raw_data, filtering_param)
+
+    @staticmethod
+    def get_creator(chart_type: str) -> type['ChartCreator']:
+        """Returns the ChartCreator class of the specific chart type."""
         try:
-            creator = CREATOR_MAP[chart_type]
+            return CREATOR_MAP[chart_type]
         except KeyError:  # pragma: no cover (creator classes should be added at the end of this file)
             raise RuntimeError(f'Class for {chart_type} was not added to CREATOR_MAP')
-        return creator(chart_specs)
 
     def get_relative_bottom_left_corner_position(self) -> str:
         """Returns the relative position for the bottom left corner of the chart."""
@@ -157,7 +348,7 @@ class ChartCreator:
     def get_axes_specs(self):  # pragma: no cover (get_axes_specs() must be implemented by child classes)
         raise RuntimeError('Unreachable code. Method get_axes_specs() must be implemented by child classes')
 
-    def get_elements(self, filtered_by_params: bool) -> list[ElementCreator]:  # pragma: no cover
+    def get_elements(self, filtered_by_params: bool) -> list[ElementsBatchCreator]:  # pragma: no cover
         raise RuntimeError('Unreachable code. Method get_elements() must be implemented by child classes')
 
     def get_group_specs(self) -> dict:
@@ -218,8 +409,8 @@ class XYZAxisChannelChartCreator(ChartCreator):
 
     _AXIS_SIZE_MAP = {'x': 'width', 'y': 'height', 'z': 'depth'}
 
-    def __init__(self, chart_specs: dict):
-        super().__init__(chart_specs)
+    def __init__(self, chart_specs: dict, raw_data: DataFrame | None = None, filtering_param: dict | None = None):
+        super().__init__(chart_specs, raw_data, filtering_param)
         self._chart_height = chart_specs.get('height')  # Maximum height of the chart
         self._chart_width = chart_specs.get('width')  # Maximum width of the chart
 
@@ -316,15 +507,44 @@ class XYZAxisChannelChartCreator(ChartCreator):
 
         return axis_specs
 
+    def _get_instanced_mesh(self, geometry: Literal['box', 'sphere'], specs: dict, scales: tuple[Series, ...],
+                            filtered_by_params: bool) -> ElementsBatchCreator:
+        """
+        Returns a batch with one entity rendering all the elements of the chart as one instanced mesh.
+
+        Notes
+        -----
+        The positions and the scales of the instances are packed as base64 Float32Array (x, y, z of each instance), and
+        the colors as indices (Uint16Array) of a palette. The information and the activated param of each instance are
+        JSON lists. The instanced-mesh component of main.js decodes them, and emits the events of each instance.
+        """
+        palette, color_indices = _get_color_palette(specs['color'])
+        positions = (self._x_elements_coordinates, self._y_elements_coordinates, self._z_elements_coordinates)
+
+        instanced_mesh_specs = {
+            'instanced_mesh': f'geometry: {geometry}; count: {color_indices.len()}',
+            'instances_position': _encode_typed_array(pl.Float32, *positions),
+            'instances_scale': _encode_typed_array(pl.Float32, *scales),
+            'instances_color': html.escape(json.dumps(palette.to_list())),
+            'instances_color_index': _encode_typed_array(pl.UInt16, color_indices),
+            'info': html.escape(json.dumps(specs['info'].to_list())),
+        }
+        if 'activates_param' in specs:
+            instanced_mesh_specs['activates_param'] = html.escape(json.dumps(specs['activates_param']))
+
+        return ElementsBatchCreator('instanced_mesh', pl.DataFrame([instanced_mesh_specs]),
+                                    filtered_by_params=filtered_by_params)
+
     def get_legend_elements(self, filtered_by_params: bool = False) -> list[ElementCreator]:
         """Returns a list for the elements of the legend."""
         if self._color_data is None:
             return []
 
-        color_mapping = {}
         colors = self._set_elements_colors()
-        for m, c in zip(self._color_data, colors):
-            color_mapping.setdefault(m, c)
+        color_mapping = dict(  # First color of each category
+            pl.DataFrame({'category': self._color_data, 'color': colors})
+            .unique(subset='category', keep='first', maintain_order=True).iter_rows()
+        )
 
         center_x_pos = self._chart_width + LEGEND_WIDTH - 1
 
@@ -420,8 +640,8 @@ class NonAxisChannelChartCreator(ChartCreator):
 class ArcChartCreator(NonAxisChannelChartCreator):
     """Arc chart creator class."""
 
-    def __init__(self, chart_specs: dict):
-        super().__init__(chart_specs)
+    def __init__(self, chart_specs: dict, raw_data: DataFrame | None = None, filtering_param: dict | None = None):
+        super().__init__(chart_specs, raw_data, filtering_param)
         self._radius = chart_specs['mark'].get('radius', DEFAULT_PIE_RADIUS) \
             if isinstance(chart_specs['mark'], dict) else DEFAULT_PIE_RADIUS
         self._set_rotation()
@@ -430,6 +650,11 @@ class ArcChartCreator(NonAxisChannelChartCreator):
         self._theta_encoding: str = ''
 
         self._process_channels('color', 'theta')
+        self._apply_elements_budget('color', 'theta')
+
+    def _reduce_elements(self, max_elements: int) -> str:
+        """Keeps the largest arcs, adding the rest into one arc."""
+        return self._keep_top_elements('theta', max_elements)
 
     def _set_rotation(self):
         """Sets the rotation of the pie chart."""
@@ -453,8 +678,8 @@ class ArcChartCreator(NonAxisChannelChartCreator):
         theta_start = theta_length.cum_sum().shift(1).fill_null(0)  # Accumulative sum (first value is 0)
         return theta_start.alias('theta_start'), theta_length.alias('theta_length')
 
-    def get_elements(self, filtered_by_params: bool) -> list[ElementCreator]:
-        """Returns a list of each element composing the chart."""
+    def get_elements(self, filtered_by_params: bool) -> list[ElementsBatchCreator]:
+        """Returns a list with the batches of elements composing the chart."""
         if self._raw_data.is_empty():  # There is no data to display
             return []
 
@@ -504,23 +729,27 @@ class ArcChartCreator(NonAxisChannelChartCreator):
 
         # Selection
         self._add_selection_to_specs(temp_dict)
+        self._add_param_keys_to_specs(temp_dict)
 
-        elements_specs = pl.from_dict(temp_dict).to_dicts()  # Transform into a list of dictionaries
-        return [
-            CylinderCreator(specification, filtered_by_params=filtered_by_params)
-            for specification in elements_specs
-        ]
+        return [ElementsBatchCreator('cylinder', pl.DataFrame(temp_dict), filtered_by_params=filtered_by_params)]
 
 
 class BarChartCreator(XYZAxisChannelChartCreator):
     """Bar chart creator class."""
 
-    def __init__(self, chart_specs: dict):
-        super().__init__(chart_specs)
+    def __init__(self, chart_specs: dict, raw_data: DataFrame | None = None, filtering_param: dict | None = None):
+        super().__init__(chart_specs, raw_data, filtering_param)
         self._bar_size_if_nominal_axis: float | None = chart_specs['mark'].get('size') \
             if isinstance(chart_specs['mark'], dict) else None
+        self._instanced: bool = chart_specs['mark'].get('instanced', DEFAULT_INSTANCED_RENDERING) \
+            if isinstance(chart_specs['mark'], dict) else DEFAULT_INSTANCED_RENDERING
+        self._apply_elements_budget('color', 'x', 'y', 'z')
         self._correct_axes_position(elem_size=self._bar_size_if_nominal_axis)
 
+    def _reduce_elements(self, max_elements: int) -> str:
+        """Keeps the highest bars, adding the rest into one bar."""
+        return self._keep_top_elements('y', max_elements)
+
     def _set_bars_coords_size_in_axis(self, axis_data: Series, axis_name: Literal['x', 'y', 'z'],
                                       encoding_type: str) -> tuple[Series, Series]:
         """
@@ -577,8 +806,8 @@ class BarChartCreator(XYZAxisChannelChartCreator):
                 raise ValueError(f'Invalid encoding type: {encoding_type}.')
         return coordinates.alias(f'{axis_name}_coordinates'), bars_axis_size.alias(bars_size_alias)
 
-    def get_elements(self, filtered_by_params: bool) -> list[ElementCreator]:
-        """Returns a list of each element composing the chart."""
+    def get_elements(self, filtered_by_params: bool) -> list[ElementsBatchCreator]:
+        """Returns a list with the batches of elements composing the chart."""
         if self._raw_data.is_empty():  # There is no data to display
             return []
 
@@ -620,21 +849,80 @@ class BarChartCreator(XYZAxisChannelChartCreator):
         # Selection
         self._add_selection_to_specs(temp_dict)
 
-        elements_specs = pl.from_dict(temp_dict).to_dicts()  # Transform into a list of dictionaries
-        return [
-            BoxCreator(specification, filtered_by_params=filtered_by_params)
-            for specification in elements_specs
-        ]
+        if self._instanced and self._filtering_param is None:  # Elements tagged by a param are rendered one by one
+            bar_sizes = (bar_widths, bar_heights, bar_depths)
+            return [self._get_instanced_mesh('box', temp_dict, bar_sizes, filtered_by_params)]
+
+        self._add_param_keys_to_specs(temp_dict)
+
+        return [ElementsBatchCreator('box', pl.DataFrame(temp_dict), filtered_by_params=filtered_by_params)]
 
 
 class LineChartCreator(XYZAxisChannelChartCreator):
-    def __init__(self, chart_specs: dict):
-        super().__init__(chart_specs)
-        self._correct_axes_position(elem_size=DEFAULT_VERTICES_SPACING)
+    def __init__(self, chart_specs: dict, raw_data: DataFrame | None = None, filtering_param: dict | None = None):
+        super().__init__(chart_specs, raw_data, filtering_param)
+        max_points = chart_specs['mark'].get('max_points') if isinstance(chart_specs['mark'], dict) else None
+        if max_points is not None:
+            self._downsample(max_points)
         self._display_points_in_vertices = chart_specs['mark'].get('point', DEFAULT_VERTICES_POINT_DISPLAY) \
             if isinstance(chart_specs['mark'], dict) else DEFAULT_VERTICES_POINT_DISPLAY
+        self._apply_elements_budget('color', 'x', 'y', 'z')
+        self._correct_axes_position(elem_size=DEFAULT_VERTICES_SPACING)
         self._marker_bbox_size_half = _calculate_point_radius(DEFAULT_VERTICES_POINT_VOLUME) \
             if self._display_points_in_vertices else 0  # Half of the markers bounding box's axes size
+        self._polyline: bool = chart_specs['mark'].get('polyline', DEFAULT_POLYLINE_RENDERING) \
+            if isinstance(chart_specs['mark'], dict) else DEFAULT_POLYLINE_RENDERING
+
+    def _count_elements(self) -> int:
+        """Returns the number of elements of the line: the segments of each line, and the markers of the vertices."""
+        rows = self._raw_data.height
+        series = self._color_data.n_unique() if self._color_data is not None else min(rows, 1)
+        lines = min(series, len(AVAILABLE_COLORS))  # Series sharing a color are drawn as one line
+        return rows - lines + (rows if self._display_points_in_vertices else 0)
+
+    def _reduce_elements(self, max_elements: int) -> str:
+        """
+        Downsamples each series of the line, sharing the budget between the series. If the budget cannot fit the
+        minimum vertices of each series, the longest series are kept.
+        """
+        elements_per_vertex = 2 if self._display_points_in_vertices else 1  # Segment (and marker) of each vertex
+        colors = len(AVAILABLE_COLORS) if self._color_data is not None else 1
+        max_series = max_elements // (3 * elements_per_vertex - 1)  # Series fitting with 3 vertices (LTTB minimum)
+        if max_series > colors:  # Series sharing a color are joined by one more segment
+            max_series = max(colors, (max_elements + colors) // (3 * elements_per_vertex))
+
+        if self._y_data is None or self._y_encoding != 'quantitative' or max_series == 0:
+            vertices = (max_elements + 1) // elements_per_vertex  # A line of n vertices has n - 1 segments
+            self._raw_data = self._raw_data.head(vertices)
+            return f'kept the first {vertices} vertices'
+
+        reduction = ''
+        series = self._color_data.n_unique() if self._color_data is not None else 1
+        if series > max_series:  # Keep the longest series
+            series_lengths = self._color_data.alias('series').to_frame().group_by('series', maintain_order=True).len()
+            longest_series = series_lengths.sort('len', descending=True, maintain_order=True).head(max_series)
+            self._raw_data = self._raw_data.filter(
+                self._color_data.is_in(longest_series.get_column('series').implode(), nulls_equal=True)
+            )
+            self._process_channels('color', 'x', 'y', 'z')  # Process the channels of the kept rows
+            reduction, series = f'kept the {max_series} longest series, ', max_series
+
+        lines = min(series, colors)
+        max_points = (max_elements + lines) // (elements_per_vertex * series)  # At least 3, as series <= max_series
+        self._downsample(max_points)
+        return reduction + f'downsampled each series to {max_points} vertices (LTTB)'
+
+    def _downsample(self, max_points: int) -> None:
+        """Keeps at most max_points rows of each series (color) of the line, using LTTB downsampling."""
+        if self._raw_data.height <= max_points:
+            return
+        if self._y_data is None or self._y_encoding != 'quantitative':
+            warnings.warn('Line is not downsampled, as y-channel is not quantitative.')
+            return
+
+        x_data = self._x_data if self._x_encoding == 'quantitative' else None  # Nominal values are in order
+        self._raw_data = self._raw_data[_get_lttb_indices(x_data, self._y_data, self._color_data, max_points)]
+        self._process_channels('color', 'x', 'y', 'z')  # Process the channels of the kept rows
 
     def _set_extremes_coords_in_axis(self, axis_data: Series, axis_name: Literal['x', 'y', 'z'],
                                      encoding_type: str) -> Series:
@@ -667,8 +955,33 @@ class LineChartCreator(XYZAxisChannelChartCreator):
                 raise ValueError(f'Invalid encoding type: {encoding_type}.')
         return coordinates.alias(f'{axis_name}_coordinates')
 
-    def get_elements(self, filtered_by_params: bool) -> list[ElementCreator]:
-        """Returns a list of each element composing the chart."""
+    def _get_line_strips(self, colors: Series, filtered_by_params: bool) -> ElementsBatchCreator:
+        """
+        Returns a batch with one entity per series (color) of the line, drawing all its vertices.
+
+        Notes
+        -----
+        The vertices of each series are packed as base64 Float32Array (x, y, z of each vertex), which the line-strip
+        component of main.js draws as one line.
+        """
+        vertices = pl.DataFrame([
+            colors, self._x_elements_coordinates, self._y_elements_coordinates, self._z_elements_coordinates
+        ])
+
+        line_strips_specs = []
+        for (color,), series in vertices.partition_by('color', maintain_order=True, as_dict=True).items():
+            if series.height < 2:  # There are no segments in the series
+                continue
+            line_strips_specs.append({
+                'line_strip': f'color: {color}; count: {series.height}',
+                'vertices': _encode_typed_array(pl.Float32, *series.drop('color').iter_columns()),
+            })
+
+        line_strips_df = pl.DataFrame(line_strips_specs, schema={'line_strip': pl.String, 'vertices': pl.String})
+        return ElementsBatchCreator('line_strip', line_strips_df, filtered_by_params=filtered_by_params)
+
+    def get_elements(self, filtered_by_params: bool) -> list[ElementsBatchCreator]:
+        """Returns a list with the batches of elements composing the chart."""
         if self._raw_data.is_empty():  # There is no data to display
             return []
 
@@ -684,6 +997,19 @@ class LineChartCreator(XYZAxisChannelChartCreator):
         # Colors
         colors = self._set_elements_colors()
 
+        if self._polyline and self._filtering_param is None:  # Elements tagged by a param are rendered one by one
+            elements = [self._get_line_strips(colors, filtered_by_params)]
+            if self._display_points_in_vertices:
+                markers_specs = {'info': self._set_info(self._x_data, self._y_data, self._z_data), 'color': colors}
+                self._add_selection_to_specs(markers_specs)
+                markers_radius = pl.repeat(
+                    _calculate_point_radius(DEFAULT_VERTICES_POINT_VOLUME), n=self._raw_data.height, eager=True
+                )
+                elements.append(self._get_instanced_mesh(
+                    'sphere', markers_specs, (markers_radius, markers_radius, markers_radius), filtered_by_params
+                ))
+            return elements
+
         # Positions
         positions = pl.select(pl.concat_str(
             [self._x_elements_coordinates, self._y_elements_coordinates, self._z_elements_coordinates],
@@ -691,16 +1017,19 @@ class LineChartCreator(XYZAxisChannelChartCreator):
         ).alias('position')).to_series()
 
         # Lines
+        lines_specs = {'start': positions, 'color': colors}
+        self._add_param_keys_to_specs(lines_specs)
+        series_columns = ['color', 'param_key'] if 'param_key' in lines_specs else 'color'  # Lines of each series
         lines_df = (
-            pl.DataFrame({'start': positions, 'color': colors})
-            .with_columns(pl.col('start').shift(-1).over('color').alias('end'))  # Shift one position up (of same color)
+            pl.DataFrame(lines_specs)
+            .with_columns(pl.col('start').shift(-1).over(series_columns).alias('end'))  # Shift one position up
             .drop_nulls('end')  # Remove last row (NULL value)
         )
 
         # Points
         info = self._set_info(self._x_data, self._y_data, self._z_data)
 
-        points_df = pl.DataFrame({
+        points_specs = {
             'position': positions,
             'info': info,
             'color': colors,
@@ -709,36 +1038,70 @@ class LineChartCreator(XYZAxisChannelChartCreator):
                 n=self._raw_data.height,
                 eager=True
             )
-        })
-
-        # Selection
-        for df in (lines_df, points_df):
-            self._add_selection_to_specs(df.to_dict(as_series=False))
+        }
+        self._add_selection_to_specs(points_specs)  # Only the points can be selected (lines are not interactive)
+        self._add_param_keys_to_specs(points_specs)
+        points_df = pl.DataFrame(points_specs)
 
         # Return elements
-        elements_lines = [LineCreator(spec, filtered_by_params=filtered_by_params) for spec in lines_df.to_dicts()]
-        elements_points = (
-            [SphereCreator(spec, filtered_by_params=filtered_by_params) for spec in points_df.to_dicts()]
-            if self._display_points_in_vertices
-            else []
-        )
+        elements_lines = ElementsBatchCreator('line', lines_df, filtered_by_params=filtered_by_params)
+        if not self._display_points_in_vertices:
+            return [elements_lines]
 
-        return elements_lines + elements_points
+        return [elements_lines, ElementsBatchCreator('sphere', points_df, filtered_by_params=filtered_by_params)]
 
 class PointChartCreator(XYZAxisChannelChartCreator):
     """Point chart creator class."""
 
-    def __init__(self, chart_specs: dict):
-        super().__init__(chart_specs)
+    def __init__(self, chart_specs: dict, raw_data: DataFrame | None = None, filtering_param: dict | None = None):
+        super().__init__(chart_specs, raw_data, filtering_param)
         max_sphere_volume: float = chart_specs['mark'].get('size', DEFAULT_POINT_VOLUME) \
             if isinstance(chart_specs['mark'], dict) else DEFAULT_POINT_VOLUME
         self._max_radius = _calculate_point_radius(max_sphere_volume)
-        self._correct_axes_position(elem_size=self._max_radius * 2)
+        self._instanced: bool = chart_specs['mark'].get('instanced', DEFAULT_INSTANCED_RENDERING) \
+            if isinstance(chart_specs['mark'], dict) else DEFAULT_INSTANCED_RENDERING
+        self._cloud: bool = chart_specs['mark'].get('cloud', DEFAULT_POINT_CLOUD_RENDERING) \
+            if isinstance(chart_specs['mark'], dict) else DEFAULT_POINT_CLOUD_RENDERING
 
         self._size_data: Series | None = None
         self._size_encoding: str = ''
 
         self._process_channels('size')  # Process and set self._{ch} attributes
+        self._apply_elements_budget('color', 'x', 'y', 'z', 'size')
+        self._correct_axes_position(elem_size=self._max_radius * 2)
+
+    def _reduce_elements(self, max_elements: int) -> str:
+        """Aggregates the points into a voxel grid (one point per cell, in the mean position of its points)."""
+        positions_fields = list(dict.fromkeys(
+            self._encoding[ch]['field'] for ch in ('x', 'y', 'z')
+            if getattr(self, f'_{ch}_data') is not None and getattr(self, f'_{ch}_encoding') == 'quantitative'
+        ))
+        if not positions_fields:
+            self._raw_data = self._raw_data.head(max_elements)
+            return f'kept the first {max_elements} points'
+
+        mean_fields = positions_fields + [self._encoding['size']['field']] \
+            if self._size_data is not None and self._size_encoding == 'quantitative' else positions_fields
+        keys = [field for field in self._raw_data.columns if field not in mean_fields]  # Nominal fields
+        cells_fields = [f'__cell_{field}' for field in positions_fields]
+
+        groups = self._raw_data.select(keys).n_unique() if keys else 1  # Combinations of the nominal fields
+        cells_per_axis = max(int((max_elements / groups) ** (1 / len(positions_fields))), 1)
+        while True:
+            cells = [  # Cell of each point, in each axis
+                ((pl.col(field) - pl.col(field).min()) / (pl.col(field).max() - pl.col(field).min()) * cells_per_axis)
+                .floor().fill_nan(0).clip(upper_bound=cells_per_axis - 1).alias(cell_field)
+                for field, cell_field in zip(positions_fields, cells_fields)
+            ]
+            voxels = (self._raw_data.with_columns(cells).group_by(keys + cells_fields, maintain_order=True)
+                      .agg(pl.col(mean_fields).mean()).select(self._raw_data.columns))
+            if voxels.height <= max_elements or cells_per_axis == 1:
+                break
+            cells_per_axis = max(int(cells_per_axis * 0.8), 1)  # Too many combinations of cells and nominal fields
+
+        self._raw_data = voxels.head(max_elements)
+        grid = ' x '.join([str(cells_per_axis)] * len(positions_fields))
+        return f'aggregated the points into a voxel grid of {grid} cells'
 
     def _set_points_coords_in_axis(self, axis_data: Series, axis_name: Literal['x', 'y', 'z'],
                                    encoding_type: str) -> Series:
@@ -787,8 +1150,31 @@ class PointChartCreator(XYZAxisChannelChartCreator):
             points_radius = (self._size_data / max_value) * self._max_radius
         return points_radius.alias('radius')
 
-    def get_elements(self, filtered_by_params: bool) -> list[ElementCreator]:
-        """Returns a list of each element composing the chart."""
+    def _get_point_cloud(self, colors: Series, radius: Series, filtered_by_params: bool) -> ElementsBatchCreator:
+        """
+        Returns a batch with one entity rendering all the points of the chart as a point cloud.
+
+        Notes
+        -----
+        The positions and the sizes (diameters) of the points are packed as base64 Float32Array, and the colors as
+        indices (Uint16Array) of a palette. The point-cloud component of main.js draws them with THREE.Points. The
+        points do not display information (nor activate params), so the cloud is not raycastable.
+        """
+        palette, color_indices = _get_color_palette(colors)
+        positions = (self._x_elements_coordinates, self._y_elements_coordinates, self._z_elements_coordinates)
+
+        point_cloud_specs = {
+            'point_cloud': f'count: {color_indices.len()}',
+            'points_position': _encode_typed_array(pl.Float32, *positions),
+            'points_size': _encode_typed_array(pl.Float32, 2 * radius),
+            'points_color': html.escape(json.dumps(palette.to_list())),
+            'points_color_index': _encode_typed_array(pl.UInt16, color_indices),
+        }
+        return ElementsBatchCreator('point_cloud', pl.DataFrame([point_cloud_specs]),
+                                    filtered_by_params=filtered_by_params)
+
+    def get_elements(self, filtered_by_params: bool) -> list[ElementsBatchCreator]:
+        """Returns a list with the batches of elements composing the chart."""
         if self._raw_data.is_empty():  # There is no data to display
             return []
 
@@ -811,6 +1197,9 @@ class PointChartCreator(XYZAxisChannelChartCreator):
         )
         self._apply_axis_offset(z_coordinates, 'z', invert=True, extra_offset=self._max_radius)  # Invert (go deep)
 
+        if self._cloud and self._filtering_param is None:  # Elements tagged by a param are rendered one by one
+            return [self._get_point_cloud(colors, radius, filtered_by_params)]
+
         # Information display
         info = self._set_info(self._x_data, self._y_data, self._z_data, self._size_data)
 
@@ -828,11 +1217,12 @@ class PointChartCreator(XYZAxisChannelChartCreator):
         # Selection
         self._add_selection_to_specs(temp_dict)
 
-        elements_specs = pl.from_dict(temp_dict).to_dicts()  # Transform into a list of dictionaries
-        return [
-            SphereCreator(specifications, filtered_by_params=filtered_by_params)
-            for specifications in elements_specs
-        ]
+        if self._instanced and self._filtering_param is None:  # Elements tagged by a param are rendered one by one
+            return [self._get_instanced_mesh('sphere', temp_dict, (radius, radius, radius), filtered_by_params)]
+
+        self._add_param_keys_to_specs(temp_dict)
+
+        return [ElementsBatchCreator('sphere', pl.DataFrame(temp_dict), filtered_by_params=filtered_by_params)]
 
 
 # Add classes to CREATOR_MAP
@@ -10,6 +10,15 @@ AVAILABLE_MARKS = {'arc', 'bar', 'line', 'point'}
 
 ENTITY_IS_MOVABLE = False
 
+GLB_COLORS = {  # Hexadecimal of the color names that can be exported to GLB (CSS colors)
+    'aqua': '#00FFFF', 'black': '#000000', 'blue': '#0000FF', 'brown': '#A52A2A', 'cyan': '#00FFFF',
+    'fuchsia': '#FF00FF', 'gray': '#808080', 'green': '#008000', 'grey': '#808080', 'lime': '#00FF00',
+    'magenta': '#FF00FF', 'maroon': '#800000', 'navy': '#000080', 'olive': '#808000', 'orange': '#FFA500',
+    'pink': '#FFC0CB', 'purple': '#800080', 'red': '#FF0000', 'silver': '#C0C0C0', 'teal': '#008080',
+    'white': '#FFFFFF', 'yellow': '#FFFF00',
+}
+GLB_DEFAULT_COLOR = 'gray'  # Color of the elements whose color cannot be exported to GLB
+
 EPSILON = 1e-5  # To avoid floating problems
 
 START_LABEL_OFFSET = 0.25  # Offset for the start label of the axis
@@ -35,9 +44,22 @@ DEFAULT_CHART_DEPTH = 2  # Default depth of the chart
 DEFAULT_CHART_HEIGHT = 4  # Default height of the chart
 DEFAULT_CHART_WIDTH = 4  # Default width of the chart
 
+DEFAULT_DATA_CACHE_MAX_BYTES = 512 * 2 ** 20  # Default budget (512 MiB) of the cache of data loaded from URLs
+DEFAULT_HTTP_CACHE_MAX_BYTES = 2 ** 30  # Default maximum size (1 GiB) of the on-disk cache of remote data
+DEFAULT_PREFETCH_MAX_WORKERS = 8  # Default maximum number of data sources of a scene loaded concurrently
+DEFAULT_BATCH_START_METHOD = 'spawn'  # Start method of the processes rendering batches (polars is not fork-safe)
+DEFAULT_BATCH_PENDING_TASKS = 4  # Maximum number of charts of a batch submitted to each process at the same time
+HTML_CHUNK_ELEMENTS = 10_000  # Maximum number of elements rendered in each chunk of the streamed HTML
+OTHER_ELEMENTS_LABEL = 'Other'  # Label of the element adding the elements of a chart exceeding its budget
+AVAILABLE_PARAM_VIEWS = ('charts', 'elements')  # Modes of rendering the views of charts filtered by params
+DEFAULT_PARAM_VIEWS = 'charts'  # Default mode (one chart per combination of the values of the param)
+
 DEFAULT_ELEMENTS_COLOR_IN_CHART = 'blue'  # Default elements color in chart
+DEFAULT_INSTANCED_RENDERING = False  # Default rendering of bars and points (one entity per element)
+DEFAULT_POINT_CLOUD_RENDERING = False  # Default rendering of points (one entity per point)
 
 DEFAULT_NUM_OF_TICKS_IF_QUANTITATIVE_AXIS = 5  # Number of ticks in the axis if it is quantitative
+DEFAULT_MAXBINS = 10  # Default maximum number of bins of a binned field
 
 # Bar chart
 DEFAULT_BAR_PADDING = 0.2  # Default padding in bar chart
@@ -46,6 +68,7 @@ DEFAULT_BAR_PADDING = 0.2  # Default padding in bar chart
 DEFAULT_VERTICES_POINT_DISPLAY = False  # Default points' display in line's vertices
 DEFAULT_VERTICES_POINT_VOLUME = 0.002  # Default points' volume in vertices (if displayed)
 DEFAULT_VERTICES_SPACING = 0.5  # Default spacing between vertices of the line
+DEFAULT_POLYLINE_RENDERING = False  # Default rendering of lines (one entity per segment)
 
 # Pie chart
 DEFAULT_PIE_RADIUS = 1  # Default radius of the pie chart
@@ -60,6 +83,7 @@ ERROR_MESSAGES = {
     'AGGREGATE_OPERATION': 'Invalid aggregate operation: {operation}',
     'AGGREGATE_OPERATION_NOT_IN_AGGREGATE': 'Aggregate must contain key "op"',
     'COLOR_ENCODING_NOT_NOMINAL': 'Color encoding type must be nominal, got "{color_encoding}"',
+    'COMPILED_CHART_DATA': 'The compiled scene has {charts} chart(s), got {datasets} dataset(s)',
     'DATA_WITH_VALUES_AND_URL_IN_SPECS': 'Data cannot contain both "values" and "url"; they are mutually exclusive',
     'DATA_WITH_NOT_VALUES_NEITHER_URL_IN_SPECS': 'Data must contain key "values" or "url"',
     'DATA_NOT_IN_SPECS': 'Invalid chart specifications. Must contain key "data"',
@@ -67,14 +91,17 @@ ERROR_MESSAGES = {
     'ENCODING_NOT_IN_SPECS': 'Invalid chart specifications. Must contain key "encoding"',
     'ENCODING_TYPE': 'Invalid encoding type: {encoding_type}',
     'ENVIRONMENT': 'Invalid environment: {environment}',
+    'FIELD_NOT_IN_BIN': 'Bin transform must contain key "field"',
     'LESS_THAN_2_XYZ_ENCODING': 'At least 2 of (x, y, z) must be specified when encoding "mark_bar" or "mark_point"',
     'MARK_AND_ELEMENT_IN_SPECS': 'Specifications cannot contain both "mark" and "element"; they are mutually exclusive',
     'MARK_AND_ELEMENT_NOT_IN_SPECS': 'Invalid chart specifications. Must contain key "mark" or "element"',
     'MARK_TYPE': 'Invalid mark type: {mark_type}',
+    'MAX_POINTS': 'The "max_points" must be greater than 2, got {max_points}.',
     'NAME_NOT_IN_PARAM': 'Param specs must contain key "name"',
     'NOT_3_AXES_POSITION_OR_ROTATION': 'The {pos_or_rot}: {pos_or_rot_value} is not correct. Must be "x y z"',
     'NOT_ALL_DATA_VALUES_ARE_DICT': 'Data field "values" must be a list of dictionaries',
     'NOT_ALL_ENCODINGS_ARE_DICT': 'Encoding channels must be dictionaries',
+    'PARAM_VIEWS': "Invalid param views: {views}. Must be one of ['charts', 'elements']",
     'PARAM_NOT_SPECIFIED_IN_MARK_ARC': 'Parameter "{param}" must be specified in arc chart',
     'POSITIVE_NUMBER': 'The "{param_name}" must be greater than 0.',
     'SIZE_ENCODING_NOT_QUANTITATIVE': 'Size encoding type must be quantitative, got "{size_encoding}"',
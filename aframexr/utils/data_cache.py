@@ -0,0 +1,100 @@
+import threading
+
+from collections import OrderedDict
+from polars import DataFrame
+
+from .constants import DEFAULT_DATA_CACHE_MAX_BYTES
+
+
+class DataCache:
+    """
+    Least recently used cache of the data read from URLs (or local paths), bounded by a budget of bytes.
+
+    Parameters
+    ----------
+    max_bytes : int (optional)
+        Maximum estimated size (in bytes) of the cached data. If not defined, using DEFAULT_DATA_CACHE_MAX_BYTES.
+
+    Notes
+    -----
+    Each entry is stored with a version of the source (modification time and size for local files, ETag and
+    Last-Modified for HTTP), so an entry is invalidated when its source changes. Only DataFrames are cached (local
+    files scanned lazily are not), so every entry counts against the budget. The cache is thread-safe.
+
+    Examples
+    --------
+    >>> import aframexr
+    >>> aframexr.data_cache.max_bytes = 256 * 2 ** 20  # Reduce the budget to 256 MiB
+    >>> aframexr.data_cache.clear()  # Release all the cached data
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_DATA_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[object, DataFrame, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the cache fits in its budget."""
+        while self._size_bytes > self.max_bytes and self._entries:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._size_bytes -= size
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: str, version: object = None) -> DataFrame | None:
+        """Returns the cached data for the key if its version is the same, otherwise None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                if entry is not None:  # Source has changed
+                    self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)  # Most recently used
+            self.hits += 1
+            return entry[1]
+
+    def get_version(self, key: str) -> object:
+        """Returns the version of the cached data for the key (None if it is not cached)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[0]
+
+    def put(self, key: str, data: DataFrame, version: object = None) -> None:
+        """Stores the data for the key (data bigger than the budget is not stored)."""
+        size = data.estimated_size()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (version, data, size)
+            self._size_bytes += size
+            self._evict()
+
+    @property
+    def stats(self) -> dict:
+        """Returns the counters (hits, misses and evictions), the number of entries and the size of the cache."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'entries': len(self._entries), 'size_bytes': self._size_bytes}
+
+
+data_cache = DataCache()  # Cache used when loading UrlData
@@ -1,8 +1,17 @@
-from .constants import ENTITY_IS_MOVABLE
+import polars as pl
+
+from polars import DataFrame
+from typing import Iterator
+
+from .constants import ENTITY_IS_MOVABLE, HTML_CHUNK_ELEMENTS
 
 CREATOR_MAP: dict[str, type['ElementCreator']] = {}  # Creator map of elements, classes are added at the end of the file
 
 
+_IGNORED_ATTRIBUTES = {'element', 'environment', 'movable'}  # Specifications that are not attributes of the element
+_TAG_ATTRIBUTES = ('param_key', 'visible')  # Attributes of batches always rendered as HTML attributes of the tag
+
+
 class ElementCreator:
     _ELEMENT_HTML: str = ''  # Must be defined by child classes
     """
@@ -10,6 +19,7 @@ class ElementCreator:
         * Do NOT add a space before {attributes}.
         * The method get_element_html() automatically adds a leading space if there are attributes.
     """
+    _ATTRIBUTE_FORMAT: str = ' {key}="{value}"'  # Format of each attribute (add space at the beginning, HTML format)
 
     def __init__(self, element_specs: dict, filtered_by_params: bool = False):
         self._filtered_by_params = filtered_by_params
@@ -19,7 +29,7 @@ class ElementCreator:
 
         self._attributes = {
             key: value for key, value in element_specs.items()
-            if value is not None and key not in {'element', 'environment', 'movable'}
+            if value is not None and key not in _IGNORED_ATTRIBUTES
         }
 
     @classmethod
@@ -40,8 +50,7 @@ class ElementCreator:
             raise RuntimeError('Attribute _ELEMENT_HTML was not initialized')
 
         attributes = ''.join(
-            f' {key.replace("_", "-")}="{value}"'  # Add space at the beginning (using HTML format)
-            if type(self) is not LineCreator else f'{key}: {value}; '  # Lines are created different
+            self._ATTRIBUTE_FORMAT.format(key=key.replace('_', '-'), value=value)
             for key, value in self._attributes.items()
         )
 
@@ -86,6 +95,7 @@ class OctahedronCreator(ElementCreator):
 
 class LineCreator(ElementCreator):
     _ELEMENT_HTML = '<a-entity line="{attributes}"></a-entity>'
+    _ATTRIBUTE_FORMAT = '{key}: {value}; '  # Lines are created different
 
 
 class PlaneCreator(ElementCreator):
@@ -108,6 +118,93 @@ class TorusCreator(ElementCreator):
     _ELEMENT_HTML = '<a-torus{attributes}></a-torus>'
 
 
+class InstancedMeshCreator(ElementCreator):
+    _ELEMENT_HTML = '<a-entity{attributes}></a-entity>'  # Rendered by instanced-mesh component (see main.js)
+
+
+class PointCloudCreator(ElementCreator):
+    _ELEMENT_HTML = '<a-entity{attributes}></a-entity>'  # Rendered by point-cloud component (see main.js)
+
+
+class LineStripCreator(ElementCreator):
+    _ELEMENT_HTML = '<a-entity{attributes}></a-entity>'  # Rendered by line-strip component (see main.js)
+
+
+class ElementsBatchCreator:
+    """
+    Batch of elements of the same type, stored as a DataFrame (one row per element, one column per attribute).
+
+    Notes
+    -----
+    The HTML of all the elements is rendered by one polars expression (instead of creating one ElementCreator object
+    per element), following the same format as ElementCreator.get_element_html().
+
+    The columns in _TAG_ATTRIBUTES (selection key and visibility of the element) are always rendered as HTML attributes
+    of the tag, even for elements whose attributes have a different format (as lines).
+    """
+
+    def __init__(self, element_type: str, elements_specs: DataFrame, filtered_by_params: bool = False):
+        creators = {**CREATOR_MAP, **_INTERNAL_CREATOR_MAP}
+        if element_type not in creators:  # pragma: no cover (all classes should be added at the end of this file)
+            raise RuntimeError(f'Class for {element_type} was not added to CREATOR_MAP')
+
+        self._creator = creators[element_type]
+        self._element_type = element_type
+        self._elements_specs = elements_specs.drop(_IGNORED_ATTRIBUTES, strict=False)
+        self._filtered_by_params = filtered_by_params
+
+    def __len__(self) -> int:
+        return self._elements_specs.height
+
+    def get_element_type(self) -> str:
+        """Returns the type of the elements of the batch."""
+        return self._element_type
+
+    def get_elements_specs(self) -> DataFrame:
+        """Returns the specifications of the elements of the batch (one row per element, one column per attribute)."""
+        return self._elements_specs
+
+    def _get_html_expression(self, is_movable: bool) -> pl.Expr:
+        """Returns the expression that renders the HTML of each element."""
+        def attribute_expression(key: str, attribute_format: str) -> pl.Expr:
+            attribute_start, attribute_end = attribute_format.replace('{key}', key.replace('_', '-')).split('{value}')
+            return (
+                pl.when(pl.col(key).is_not_null())  # Null values are not attributes of the element
+                .then(pl.concat_str([pl.lit(attribute_start), pl.col(key).cast(pl.String), pl.lit(attribute_end)]))
+                .otherwise(pl.lit(''))
+            )
+
+        html_start, html_end = self._creator._ELEMENT_HTML.split('{attributes}')
+        tag_end = html_end.index('>')  # End of the opening tag
+
+        attributes, tag_attributes = [], []
+        for key in self._elements_specs.columns:
+            if key in _TAG_ATTRIBUTES:
+                tag_attributes.append(attribute_expression(key, ElementCreator._ATTRIBUTE_FORMAT))
+            else:
+                attributes.append(attribute_expression(key, self._creator._ATTRIBUTE_FORMAT))
+
+        if is_movable:
+            attributes.append(pl.lit(' movable raycastable'))
+        elif 'info' in self._elements_specs.columns and not self._filtered_by_params:
+            attributes.append(pl.when(pl.col('info').is_not_null()).then(pl.lit(' raycastable')).otherwise(pl.lit('')))
+
+        return pl.concat_str([
+            pl.lit(html_start), *attributes, pl.lit(html_end[:tag_end]), *tag_attributes, pl.lit(html_end[tag_end:])
+        ]).alias('html')
+
+    def get_elements_html(self, is_movable: bool = ENTITY_IS_MOVABLE) -> list[str]:
+        """Returns a list with the HTML of each element of the batch."""
+        return self._elements_specs.select(self._get_html_expression(is_movable)).to_series().to_list()
+
+    def iter_elements_html(self, is_movable: bool = ENTITY_IS_MOVABLE,
+                           chunk_size: int = HTML_CHUNK_ELEMENTS) -> Iterator[list[str]]:
+        """Yields lists with the HTML of the elements of the batch, rendering chunk_size elements each time."""
+        html_expression = self._get_html_expression(is_movable)
+        for elements_specs in self._elements_specs.iter_slices(chunk_size):
+            yield elements_specs.select(html_expression).to_series().to_list()
+
+
 # Add creator classes to CREATOR_MAP dynamically
 CREATOR_MAP.update({
     'box': BoxCreator,
@@ -125,3 +222,8 @@ CREATOR_MAP.update({
     'text': TextCreator,
     'torus': TorusCreator,
 })
+_INTERNAL_CREATOR_MAP: dict[str, type[ElementCreator]] = {  # Creators used by charts (not available as elements)
+    'instanced_mesh': InstancedMeshCreator,
+    'line_strip': LineStripCreator,
+    'point_cloud': PointCloudCreator,
+}
@@ -1,194 +1,566 @@
+import asyncio
 import io
 import json
 import os
 import polars as pl
-import urllib.error, urllib.request
+import threading
+import urllib.parse
 import warnings
 
-from functools import lru_cache
-from polars import DataFrame
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from polars import DataFrame, LazyFrame
+from typing import Iterator
 
 from .axis_creator import AxisCreator
 from .chart_creator import ChartCreator
-from .constants import ENTITY_IS_MOVABLE, LABELS_SCALE
+from .constants import DEFAULT_PREFETCH_MAX_WORKERS, ENTITY_IS_MOVABLE, LABELS_SCALE
+from .data_cache import data_cache
+from .http_cache import http_cache
 from .element_creator import ElementCreator, TextCreator
 
 
-@lru_cache  # Use come cache for increasing performance
-def _get_data_from_url(url: str) -> DataFrame:
-    """Loads the data from the URL (could be a local path) and returns it as a DataFrame."""
+_CONTENT_TYPE_FORMATS = {  # Substrings of the content type for each file format (in order of checking)
+    'ndjson': 'ndjson',
+    'json': 'json',
+    'csv': 'csv',
+    'parquet': 'parquet',
+    'arrow': 'ipc',
+}
+_EXTENSION_FORMATS = {  # File extensions of each file format
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'ndjson',
+    '.ndjson': 'ndjson',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'ipc',
+    '.feather': 'ipc',
+    '.ipc': 'ipc',
+}
+_READERS = {  # Eager readers (for remote data and formats that cannot be scanned)
+    'csv': pl.read_csv,
+    'json': lambda data: DataFrame(json.load(data)),
+    'ndjson': pl.read_ndjson,
+    'parquet': pl.read_parquet,
+    'ipc': pl.read_ipc,
+}
+_SCANNERS = {  # Lazy readers (for local files), so filters and projections are pushed into the scan
+    'csv': pl.scan_csv,
+    'ndjson': pl.scan_ndjson,
+    'parquet': pl.scan_parquet,
+    'ipc': pl.scan_ipc,
+}
+
+
+_warnings_lock = threading.Lock()
+_warnings_collectors = threading.local()  # List collecting the warnings of each thread (if they are collected)
+_warnings_hook_users = 0  # Number of pools using the hook of warnings.showwarning
+_previous_showwarning = warnings.showwarning  # Function showing the warnings not collected by the hook
+
+
+def _show_or_collect_warning(message, category, filename, lineno, file=None, line=None):
+    """Hook of warnings.showwarning, collecting the warnings of the threads that have a collector."""
+    collector = getattr(_warnings_collectors, 'collector', None)
+    if collector is None:
+        _previous_showwarning(message, category, filename, lineno, file, line)
+    else:
+        collector.append((message, category, filename, lineno, file, line))
+
+
+@contextmanager
+def _warnings_hook():
+    """
+    Installs the hook of warnings.showwarning while the context is active.
+
+    Notes
+    -----
+    The hook is installed once for all the threads using it (and uninstalled when the last of them exits), instead of
+    using warnings.catch_warnings(), which saves and restores the state of the warnings of the whole process (so
+    concurrent renders would restore each other's state). The filters of the warnings are not modified.
+    """
+    global _warnings_hook_users, _previous_showwarning
+    with _warnings_lock:
+        if _warnings_hook_users == 0 and warnings.showwarning is not _show_or_collect_warning:
+            _previous_showwarning = warnings.showwarning
+            warnings.showwarning = _show_or_collect_warning
+        _warnings_hook_users += 1
+    try:
+        yield
+    finally:
+        with _warnings_lock:
+            _warnings_hook_users -= 1
+            if _warnings_hook_users == 0 and warnings.showwarning is _show_or_collect_warning:
+                warnings.showwarning = _previous_showwarning  # Not restored if it was replaced meanwhile
+
+
+def _get_file_format(file_type: str, extension: str = '') -> str:
+    """
+    Returns the format of the file from its content type or, if the content type is not a known format, from its
+    extension.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported.
+    """
+    for content_type, file_format in _CONTENT_TYPE_FORMATS.items():
+        if content_type in file_type:
+            return file_format
+
+    if extension.lower() in _EXTENSION_FORMATS:
+        return _EXTENSION_FORMATS[extension.lower()]
+    raise ValueError(f'Unsupported file type: {file_type}.')
+
+
+def _read_remote_data(body: io.BytesIO, content_type: str, url: str) -> DataFrame:
+    """Returns the DataFrame from the body of the response of the URL."""
+    file_format = _get_file_format(content_type, os.path.splitext(urllib.parse.urlparse(url).path)[1])
+    try:
+        return _READERS[file_format](body)
+    except Exception as e:
+        raise IOError(f'Error when processing data. Error: {e}.')
+
+
+def _get_remote_data(url: str) -> LazyFrame:
+    """
+    Loads the data from the remote URL and returns it as a LazyFrame.
+
+    Notes
+    -----
+    The data is revalidated with the server (using http_cache), and kept in data_cache while it is not modified. Data
+    without validators (ETag or Last-Modified headers) cannot be revalidated, so it is loaded once and used while it is
+    kept in data_cache.
+    """
+    while True:
+        memory_version = data_cache.get_version(url)
+        df_data, version = http_cache.fetch(url, _read_remote_data, memory_version)
+        data = _get_fetched_data(url, df_data, version)
+        if data is not None:
+            return data
+
+
+async def _get_remote_data_async(url: str) -> LazyFrame:
+    """Asynchronous version of _get_remote_data(), requesting the data in a worker thread."""
+    while True:
+        memory_version = data_cache.get_version(url)
+        df_data, version = await http_cache.fetch_async(url, _read_remote_data, memory_version)
+        data = _get_fetched_data(url, df_data, version)
+        if data is not None:
+            return data
+
+
+def _get_fetched_data(url: str, df_data: DataFrame | None, version: str | None) -> LazyFrame | None:
+    """
+    Returns the fetched data of the URL (storing it in data_cache), or the data in memory if it was not modified.
+    Returns None if the data in memory was evicted while revalidating (so it must be fetched again).
+    """
+    if df_data is None:  # Not modified, data in memory is up-to-date
+        df_data = data_cache.get(url, version)
+        if df_data is None:  # pragma: no cover (evicted by another thread while revalidating)
+            return None
+    else:
+        data_cache.put(url, df_data, version)
+    return df_data.lazy()
+
+
+def _get_data_from_url(url: str) -> LazyFrame:
+    """
+    Loads the data from the URL (could be a local path) and returns it as a LazyFrame.
+
+    Notes
+    -----
+    Local CSV, Parquet, Arrow IPC and NDJSON files are scanned (not read), so only the required rows and columns are
+    read when the query of the chart is collected. Remote files and JSON files are read eagerly.
+
+    The data read eagerly is stored in data_cache, keyed on the URL and the version of the source (modification time
+    and size for local files, ETag and Last-Modified for remote files). Scanned files are not cached: scanning them
+    again is cheap, and a LazyFrame does not hold the data (so it could not be bounded by the budget of the cache).
+    """
     if url.startswith(('http://', 'https://')):  # Data is stored in a URL
+        return _get_remote_data(url)
+
+    # Data is stored in a local file
+    path = os.path.normpath(url)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'Local file "{path}" was not found.')
+
+    _, file_type = os.path.splitext(path)
+    file_format = _get_file_format('', file_type)
+    if file_format in _SCANNERS:  # Scanned (not cached)
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                file_type = response.info().get_content_type()
-                data = io.BytesIO(response.read())  # For polars
-        except urllib.error.URLError:
-            raise IOError(f'Could not load data from URL: {url}.')
-    else:  # Data is stored in a local file
-        path = os.path.normpath(url)
-        if not os.path.exists(path):
-            raise FileNotFoundError(f'Local file "{path}" was not found.')
-
-        data = open(path, 'rb')
-        _, file_type = os.path.splitext(path)
-        file_type = file_type.lower()
+            data = _SCANNERS[file_format](path)
+            data.collect_schema()  # Read the schema (header or metadata) to detect invalid files
+        except Exception as e:
+            raise IOError(f'Error when processing data. Error: {e}.')
+        return data
+
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)  # The cached data is invalidated when the file changes
+    cached_data = data_cache.get(path, version)
+    if cached_data is not None:
+        return cached_data.lazy()
 
     try:
-        if 'csv' in file_type:  # Data is in CSV format
-            df_data = pl.read_csv(data)
-        elif 'json' in file_type:
-            json_data = json.load(data)
-            df_data = DataFrame(json_data)
-        else:
-            raise ValueError(f'Unsupported file type: {file_type}.')
-
-        return df_data
-    except ValueError:
-        raise  # To raise previous ValueError
+        with open(path, 'rb') as file:
+            data = _READERS[file_format](file)
     except Exception as e:
         raise IOError(f'Error when processing data. Error: {e}.')
 
-    finally:
-        if data and not url.startswith(('http', 'https')):
-            data.close()  # Close the file
+    data_cache.put(path, data, version)
+    return data.lazy()
 
 
-def _get_raw_data_and_params(chart_specs: dict) -> tuple[DataFrame, set]:
+def _prefetch_data(charts_list: list[dict], executor: ThreadPoolExecutor) -> dict[str, Future]:
     """
-    Returns a tuple containing the raw data from the chart specifications (transformed if necessary),
-    and a set containing the names for the params of the chart.
+    Starts loading concurrently the distinct URLs of the charts, and returns a dictionary with the future of each URL.
+
+    Notes
+    -----
+    Errors are raised when the result of the future is requested, so they are raised in the same order as if the data
+    was loaded chart by chart.
+    """
+    urls = dict.fromkeys(chart['data']['url'] for chart in charts_list if chart.get('data', {}).get('url'))
+    return {url: executor.submit(_get_data_from_url, url) for url in urls}  # Identical URLs are loaded once
+
+
+async def _prefetch_data_async(charts_list: list[dict]) -> dict[str, Future]:
+    """
+    Loads concurrently the distinct URLs of the charts without blocking the event loop, and returns a dictionary with
+    the (already completed) future of each URL.
+
+    Notes
+    -----
+    Remote data is requested, and local files are loaded, in worker threads. As in _prefetch_data(), errors are stored
+    in the futures, so they are raised in the same order as if the data was loaded chart by chart.
     """
-    # Get the raw data of the chart
-    data_field = chart_specs['data']
+    async def load(url: str) -> LazyFrame:
+        if url.startswith(('http://', 'https://')):
+            return await _get_remote_data_async(url)
+        return await asyncio.to_thread(_get_data_from_url, url)
+
+    urls = list(dict.fromkeys(chart['data']['url'] for chart in charts_list if chart.get('data', {}).get('url')))
+    results = await asyncio.gather(*(load(url) for url in urls), return_exceptions=True)
+
+    prefetched = {}
+    for url, result in zip(urls, results):
+        prefetched[url] = Future()
+        if isinstance(result, BaseException):
+            prefetched[url].set_exception(result)
+        else:
+            prefetched[url].set_result(result)
+    return prefetched
+
+
+def _get_source_data(data_field: dict, prefetched: dict[str, Future] | None = None) -> LazyFrame:
+    """Returns the data of the chart specifications as a LazyFrame (the source of the query of the chart)."""
     if data_field.get('url'):  # Data is stored in a file
-        raw_data = _get_data_from_url(data_field['url'])
+        if prefetched and data_field['url'] in prefetched:  # Data is being loaded concurrently
+            return prefetched[data_field['url']].result()
+        return _get_data_from_url(data_field['url'])
+    elif isinstance(data_field.get('values'), LazyFrame):  # Data is already lazy
+        return data_field['values']
+    elif isinstance(data_field.get('values'), DataFrame):  # Data is already columnar
+        return data_field['values'].lazy()
     elif data_field.get('values'):  # Data is stored as the raw data
-        json_data = data_field['values']
-        raw_data = DataFrame(json_data)
+        return DataFrame(data_field['values']).lazy()
     else:  # pragma: no cover (should never enter here, as chart_specs should have previously been validated)
         raise RuntimeError('Unreachable code: chart_specs should have been validated earlier')
 
-    # Transform data (if necessary)
-    from ..api.aggregate import AggregatedFieldDef  # To avoid circular import error
-    from ..api.filters import FilterTransform
 
-    transform_field = chart_specs.get('transform')
-    params_names = set()
-    if transform_field:
+def _get_required_fields(chart_specs: dict, scene_params_map: dict) -> set:
+    """Returns the fields of the data that are used after the transformations (encoding and params fields)."""
+    required_fields = {  # Fields of the encoding (the counts of the encoding are named as their empty field)
+        ch_spec['field'] for ch_spec in chart_specs['encoding'].values()
+        if ch_spec.get('field') or ch_spec.get('aggregate') == 'count'
+    }
+
+    for p in chart_specs.get('params', []):  # Fields of the selections defined in the chart
+        required_fields.update(p.get('select', {}).get('fields', []))
+
+    for t in chart_specs.get('transform') or []:  # Fields of the params filtering the chart
+        filter_specs = t.get('filter')
+        param_specs = scene_params_map.get(filter_specs['param']) \
+            if isinstance(filter_specs, dict) and 'param' in filter_specs else None
+        if param_specs is not None:
+            required_fields.update(param_specs['select'].get('fields', []))
+
+    return required_fields
 
-        for filter_transformation in transform_field:  # The first transformations are the filters
-            if filter_transformation.get('filter'):
-                filter_specs = filter_transformation['filter']
-                if 'param' in filter_specs:
-                    params_names.add(filter_specs['param'])
-                else:  # Exclude params from filters
-                    if isinstance(filter_specs, str):
-                        filter_object = FilterTransform.from_equation(filter_specs)
-                    elif isinstance(filter_specs, dict):
-                        filter_object = FilterTransform.from_dict(filter_transformation['filter'])
-                    else:  # pragma: no cover (should never enter here, as filter specs should have been validated)
-                        raise RuntimeError('Unreachable code. Filter specifications should have been validated earlier')
-
-                    raw_data = filter_object.get_filtered_data(raw_data)
-                    if raw_data.is_empty():  # Data does not contain any value for the filter
-                        warnings.warn(f'Data does not contain values for the filter: {filter_transformation["filter"]}')
 
+class ChartPlan:
+    """
+    Plan of the query of a chart: the data-independent part of the transformations, compiled once per chart.
+
+    Parameters
+    ----------
+    chart_specs : dict
+        Chart specifications (already validated).
+    scene_params_map : dict
+        Parameters of the scene.
+
+    Notes
+    -----
+    The filter equations are parsed, the bins and aggregates are created and the creator class of the mark is
+    resolved when creating the plan, so rendering the chart with other data only builds the polars query for the
+    schema of that data (see get_query()). The plan can be pickled.
+
+    The filters are applied first, then the bins and aggregates of each transformation (in order, merging the
+    aggregates into one agg(...) per transformation), then the bins of the encoding and finally the aggregates of the
+    encoding (merged into one agg(...)). Only the required fields are projected, so polars can push the projection and
+    the predicates into the source.
+
+    Raises
+    ------
+    ValueError
+        If the groupby of an aggregate transformation does not contain all the encoding channels.
+    """
+
+    def __init__(self, chart_specs: dict, scene_params_map: dict):
+        from ..api.aggregate import AggregatedFieldDef  # To avoid circular import error
+        from ..api.binning import BinFieldDef
+        from ..api.filters import FilterTransform
+
+        chart_type = chart_specs['mark']['type'] if isinstance(chart_specs['mark'], dict) else chart_specs['mark']
+        self.creator = ChartCreator.get_creator(chart_type)
+
+        transform_field = chart_specs.get('transform') or []
+        encoding_fields = [ch_spec['field'] for ch_spec in chart_specs['encoding'].values()]
+        self.params_names = set()
+
+        # Filters
+        self.filters = []  # Tuples (filter specifications, filter object)
+        for filter_transformation in transform_field:  # The first transformations are the filters
+            if not filter_transformation.get('filter'):
+                continue
+
+            filter_specs = filter_transformation['filter']
+            if 'param' in filter_specs:  # Exclude params from filters
+                self.params_names.add(filter_specs['param'])
+                continue
+
+            if isinstance(filter_specs, str):
+                filter_object = FilterTransform.from_equation(filter_specs)
+            elif isinstance(filter_specs, dict):
+                filter_object = FilterTransform.from_dict(filter_specs)
+            else:  # pragma: no cover (should never enter here, as filter specs should have been validated)
+                raise RuntimeError('Unreachable code. Filter specifications should have been validated earlier')
+            self.filters.append((filter_specs, filter_object))
+
+        # Bins and aggregates of the transformations
+        self.transform_steps = []  # BinFieldDef objects, or tuples (aggregate objects, groupby)
         for non_filter_transf in transform_field:  # Non-filter transformations
-            groupby = set(non_filter_transf.get('groupby')) if non_filter_transf.get('groupby') else set()
-            if non_filter_transf.get('aggregate'):
-                for aggregate in non_filter_transf.get('aggregate'):
-                    aggregate_object = AggregatedFieldDef.from_dict(aggregate)
-
-                    encoding_channels = {  # Using a set to have the possibility of getting differences
-                        ch_spec['field'] for ch_spec in chart_specs['encoding'].values()  # Take the encoding channels
-                        if ch_spec['field'] != aggregate_object.as_field  # Except the aggregate field channel
-                    }
-
-                    if groupby:
-                        not_defined_channels = encoding_channels - set(groupby)  # Difference between sets
-                        if not_defined_channels:  # There are channels in encoding_channels not defined in groupby
-                            raise ValueError(
-                                f'Encoding channel(s) "{not_defined_channels}" must be defined in aggregate groupby: '
-                                f'{groupby}, otherwise that fields will disappear.'
-                            )
-                    else:
-                        groupby = encoding_channels  # Use the encoding channels as groupby
-                    raw_data = aggregate_object.get_aggregated_data(raw_data, list(groupby))
+            if non_filter_transf.get('bin'):
+                self.transform_steps.append(BinFieldDef.from_dict(
+                    non_filter_transf['bin'], non_filter_transf['field'], non_filter_transf.get('as', '')
+                ))
+                continue
+            if not non_filter_transf.get('aggregate'):
+                continue
+
+            aggregate_objects = [AggregatedFieldDef.from_dict(aggregate)
+                                 for aggregate in non_filter_transf['aggregate']]
+            as_fields = {aggregate_object.as_field for aggregate_object in aggregate_objects}
+            encoding_channels = list(dict.fromkeys(  # Take the encoding channels (except the aggregate field channels)
+                field for field in encoding_fields if field not in as_fields
+            ))
+
+            groupby = non_filter_transf.get('groupby')
+            if groupby:
+                not_defined_channels = set(encoding_channels) - set(groupby)  # Difference between sets
+                if not_defined_channels:  # There are channels in encoding_channels not defined in groupby
+                    raise ValueError(
+                        f'Encoding channel(s) "{not_defined_channels}" must be defined in aggregate groupby: '
+                        f'{set(groupby)}, otherwise that fields will disappear.'
+                    )
+            else:
+                groupby = encoding_channels  # Use the encoding channels as groupby
+            self.transform_steps.append((aggregate_objects, groupby))
+
+        # Bins of the encoding (replacing the values of the field by the start of their bins)
+        encoding_channels_values = list(chart_specs['encoding'].values())
+        self.encoding_bins = list({
+            ch['field']: BinFieldDef.from_dict(ch['bin'], ch['field'])
+            for ch in encoding_channels_values if ch.get('bin')
+        }.values())
+
+        # Aggregates of the encoding
+        self.groupby_fields = [ch['field'] for ch in encoding_channels_values if not ch.get('aggregate')]
+        self.encoding_aggregates = list({
+            (ch['aggregate'], ch['field']): AggregatedFieldDef(ch['aggregate'], ch['field'])
+            for ch in encoding_channels_values if ch.get('aggregate') is not None
+        }.values())
+
+        self.required_fields = _get_required_fields(chart_specs, scene_params_map)
+
+    def get_query(self, source: LazyFrame) -> tuple[LazyFrame, list]:
+        """
+        Returns a tuple containing the query of the chart over the source, and a list of tuples (filter
+        specifications, filter expression).
+        """
+        query = source
+
+        # Filters
+        schema = query.collect_schema()
+        filters = [(filter_specs, filter_object.get_condition(schema)) for filter_specs, filter_object in self.filters]
+        if filters:
+            query = query.filter(*(condition for _, condition in filters))
+
+        # Bins and aggregates of the transformations
+        for step in self.transform_steps:
+            if isinstance(step, tuple):
+                query = _aggregate_query(query, *step)
+            else:
+                query = step.get_binned_data(query)
+
+        # Bins and aggregates of the encoding
+        for bin_object in self.encoding_bins:
+            query = bin_object.get_binned_data(query)
+        if self.encoding_aggregates:
+            query = _aggregate_query(query, self.encoding_aggregates, self.groupby_fields)
+
+        # Projection of the required fields
+        query = query.select([field for field in query.collect_schema().names() if field in self.required_fields])
+
+        return query, filters
+
+
+def _get_chart_plan(chart_specs: dict, scene_params_map: dict) -> ChartPlan:
+    """Returns the plan of the chart (compiled in chart_specs['plan'], see CompiledChart), or creates it."""
+    return chart_specs.get('plan') or ChartPlan(chart_specs, scene_params_map)
+
+
+def _aggregate_query(query: LazyFrame, aggregate_objects: list, groupby: list) -> LazyFrame:
+    """Returns the query aggregated by all the aggregates in a single agg(...), grouped by groupby."""
+    schema = query.collect_schema()
+    for field in [*groupby, *(a.field for a in aggregate_objects if a.op != 'count')]:
+        if field not in schema:
+            raise KeyError(f'Data has no field "{field}".')
+
+    expressions = [aggregate_object.get_expression() for aggregate_object in aggregate_objects]
+    if not groupby:  # Aggregate all the data in a single row
+        return query.select(expressions)
+    return query.group_by(groupby, maintain_order=True).agg(expressions)
+
 
-    # Aggregate in encoding
-    encoding_channels_values = list(chart_specs['encoding'].values())
-    groupby_fields = [ch['field'] for ch in encoding_channels_values if not ch.get('aggregate')]
+def _warn_empty_filters(source: LazyFrame, filters: list) -> None:
+    """Warns about the filters after which the data does not contain any value."""
+    if not filters:
+        return
 
-    for ch in encoding_channels_values:
-        aggregate_op = ch.get('aggregate')
-        if aggregate_op is not None:
-            aggregate_object = AggregatedFieldDef(aggregate_op, ch['field'])
-            raw_data = aggregate_object.get_aggregated_data(raw_data, groupby_fields)
+    conditions = [condition for _, condition in filters]
+    counts = source.select(
+        pl.all_horizontal(conditions[:i + 1]).sum().alias(str(i)) for i in range(len(conditions))
+    ).collect().row(0)
 
-    return raw_data, params_names
+    for (filter_specs, _), count in zip(filters, counts):
+        if not count:  # Data does not contain any value for the filter
+            warnings.warn(f'Data does not contain values for the filter: {filter_specs}')
 
 
-def _get_param_combinations(data: DataFrame, param_specs: dict | None) -> list[dict]:
-    """Returns a list containing the combinations in data for param specifications."""
-    combinations = []
+def _get_raw_data_and_params(chart_specs: dict, scene_params_map: dict | None = None,
+                             prefetched: dict[str, Future] | None = None,
+                             plan: ChartPlan | None = None) -> tuple[DataFrame, set]:
+    """
+    Returns a tuple containing the raw data from the chart specifications (transformed if necessary),
+    and a set containing the names for the params of the chart.
+
+    Notes
+    -----
+    The transformations are compiled into a single lazy query (see ChartPlan), which is collected only once.
+    """
+    if plan is None:
+        plan = _get_chart_plan(chart_specs, scene_params_map or {})
+    source = _get_source_data(chart_specs['data'], prefetched)
+    query, filters = plan.get_query(source)
+
+    raw_data = query.collect()
+    if raw_data.is_empty():
+        _warn_empty_filters(source, filters)
 
-    if param_specs is None:
-        return combinations
+    return raw_data, plan.params_names
 
-    select_type = param_specs['select']['type']
-    if select_type == 'point':
-        combinations = data.select(param_specs['select']['fields']).unique().to_dicts()
 
-    return combinations
+def _get_scene_params_map(specs: dict) -> dict:
+    """Returns a dictionary with the specifications of each param of the scene (defined by any of its charts)."""
+    scene_params = list(specs.get('params', []))
+    for chart in specs.get('concat', []):
+        scene_params.extend(chart.get('params', []))
+    return {p['name']: p for p in scene_params}
+
+
+def _get_param_partitions(data: DataFrame, param_specs: dict | None) -> list[tuple[dict, DataFrame]]:
+    """
+    Returns a list of tuples containing each combination in data for param specifications, and the rows of data for
+    that combination.
+
+    Notes
+    -----
+    The data is partitioned in a single pass (in order of appearance of the combinations), instead of filtering the
+    whole data once per combination.
+    """
+    if param_specs is None or param_specs['select']['type'] != 'point':
+        return []
+
+    fields = param_specs['select'].get('fields', [])
+    if not fields:
+        return []
+
+    partitions = data.partition_by(fields, maintain_order=True, as_dict=True)
+    return [(dict(zip(fields, values)), partition) for values, partition in partitions.items()]
 
 
 class ChartsHTMLCreator:
     """Charts HTML creator class."""
 
     @staticmethod
-    def _create_chart_html(chart_object: ChartCreator, param_name: str = None, param_values: dict = None) -> str:
-        filtered_by_params = False
+    def _iter_chart_html(chart_object: ChartCreator, param_name: str = None, param_values: dict = None,
+                         filtered_by_params: bool = False) -> Iterator[str]:
+        """Yields the HTML of the chart in chunks (the elements are rendered in batches of HTML_CHUNK_ELEMENTS)."""
         attributes = ''
         if param_name is not None and param_values is not None:
             filtered_by_params = True
             param_values_str = '__'.join(f'{value}' for value in param_values.values())
             attributes += f' param-name="{param_name}__{param_values_str}" visible="false"'
 
-        chart_html = (f'\t\t\t<a-entity position="{chart_object.get_relative_bottom_left_corner_position()}"'
-                      f'{attributes}>\n')
-        elements = chart_object.get_elements(filtered_by_params=filtered_by_params)  # Specifications for each element
-        for element in elements:
-            chart_html += '\t\t\t\t' + element.get_element_html() + '\n'  # Tabulate the lines (better visualization)
+        yield (f'\t\t\t<a-entity position="{chart_object.get_relative_bottom_left_corner_position()}"'
+               f'{attributes}>\n')
+        for batch in chart_object.get_elements(filtered_by_params=filtered_by_params):  # Batches of elements
+            for elements_html in batch.iter_elements_html():
+                yield ''.join(f'\t\t\t\t{element_html}\n' for element_html in elements_html)  # Tabulate the lines
 
         # Axis HTML
         axes_specs = chart_object.get_axes_specs()
 
         for ax, ax_specs in axes_specs.items():
-            chart_html += f'\n\t\t\t\t<!-- {ax.upper()}-axis -->\n'  # Added HTML comment for better visualization
-            chart_html += '\t\t\t\t' + AxisCreator.create_axis_html(ax_specs['start'], ax_specs['end']) + '\n'
+            axis_html = [f'\n\t\t\t\t<!-- {ax.upper()}-axis -->\n',  # Added HTML comment for better visualization
+                         '\t\t\t\t' + AxisCreator.create_axis_html(ax_specs['start'], ax_specs['end']) + '\n']
             for label_pos, label_value in zip(ax_specs['labels_pos'], ax_specs['labels_values']):
-                chart_html += '\t\t\t\t' + TextCreator({
+                axis_html.append('\t\t\t\t' + TextCreator({
                     'value': label_value, 'position': label_pos, 'rotation': ax_specs['labels_rotation'],
                     'align': ax_specs['labels_align'], 'scale': LABELS_SCALE
-                }).get_element_html() + '\n'
+                }).get_element_html() + '\n')
+            yield ''.join(axis_html)
 
         # Title
         title_elements = chart_object.get_title_elements(filtered_by_params=filtered_by_params)
         if title_elements:
-            chart_html += f'\n\t\t\t\t<!-- Title -->\n'  # Added HTML comment for better visualization
-            for element in title_elements:
-                chart_html += '\t\t\t\t' + element.get_element_html() + '\n'
+            yield f'\n\t\t\t\t<!-- Title -->\n'  # Added HTML comment for better visualization
+            yield ''.join('\t\t\t\t' + element.get_element_html() + '\n' for element in title_elements)
 
         # Legend
         legend_elements = chart_object.get_legend_elements(filtered_by_params=filtered_by_params)
         if legend_elements:
-            chart_html += f'\n\t\t\t\t<!-- Legend -->\n'  # Added HTML comment for better visualization
-            for element in legend_elements:
-                chart_html += '\t\t\t\t' + element.get_element_html() + '\n'
+            yield f'\n\t\t\t\t<!-- Legend -->\n'  # Added HTML comment for better visualization
+            yield ''.join('\t\t\t\t' + element.get_element_html() + '\n' for element in legend_elements)
 
         # Close the groups
-        chart_html += '\t\t\t</a-entity>\n'
-        return chart_html
+        yield '\t\t\t</a-entity>\n'
+
+    @staticmethod
+    def _create_chart_html(chart_object: ChartCreator, param_name: str = None, param_values: dict = None) -> str:
+        return ''.join(ChartsHTMLCreator._iter_chart_html(chart_object, param_name, param_values))
 
     @staticmethod
     def _create_element_html(element_specs: dict, is_movable: bool = ENTITY_IS_MOVABLE) -> str:
@@ -197,9 +569,10 @@ class ChartsHTMLCreator:
         return element_object.get_element_html(is_movable=is_movable)
 
     @staticmethod
-    def _create_entity_html(chart_specs: dict, scene_params_map: dict) -> str:
+    def _iter_entity_html(chart_specs: dict, scene_params_map: dict,
+                          prefetched: dict[str, Future] | None = None) -> Iterator[str]:
         """
-        Returns the HTML of the elements that compose the entity.
+        Yields the HTML of the elements that compose the entity, in chunks.
 
         Parameters
         ----------
@@ -207,28 +580,30 @@ class ChartsHTMLCreator:
             Chart specifications.
         scene_params_map : dict
             Parameters of the scene.
+        prefetched : dict[str, Future] | None (optional)
+            Data of the URLs of the scene, being loaded concurrently.
 
         Notes
         -----
-        Supposing that chart_specs is a dictionary (at this method has been called from self.create_charts_html).
+        Supposing that chart_specs is a dictionary (at this method has been called from self.iter_charts_html).
 
         Suppose that the parameters are correct for method calls of ChartCreator and AxisCreator.
         """
         is_movable = chart_specs.get('movable', ENTITY_IS_MOVABLE)
 
         if 'mark' in chart_specs:  # Chart
-            chart_type = chart_specs['mark']['type'] if isinstance(chart_specs['mark'], dict) else chart_specs['mark']
-            raw_data, chart_params_names = _get_raw_data_and_params(chart_specs)
-            chart_specs['data'] = {'values': raw_data.to_dicts()}
-            chart_object = ChartCreator.create_object(chart_type, chart_specs)  # Create the chart object
+            plan = _get_chart_plan(chart_specs, scene_params_map)
+            creator = plan.creator  # Creator class of the chart type
+            raw_data, chart_params_names = _get_raw_data_and_params(chart_specs, scene_params_map, prefetched, plan)
+            chart_object = creator(chart_specs, raw_data)  # Create the chart object
             group_specs = chart_object.get_group_specs()  # Get the base specifications of the group of elements
 
             attributes = ''.join(f' {key.replace("_", "-")}="{value}"' for key, value in group_specs.items())
             if is_movable:
                 attributes += ' movable'  # For drag-controls
 
-            html = ('<a-entity{attributes}>'.format(attributes=attributes) +
-                          "  <!-- Chart's box (modify this values if you want to change position or rotation) -->\n")
+            yield ('<a-entity{attributes}>'.format(attributes=attributes) +
+                   "  <!-- Chart's box (modify this values if you want to change position or rotation) -->\n")
 
             # =================
             if chart_params_names:  # Chart is filtered using params
@@ -241,71 +616,139 @@ class ChartsHTMLCreator:
                             f'that param will not be displayed. Make sure the name is correct'
                         )
 
+                    if param_specs is not None and param_specs['select'].get('views') == 'elements':
+                        # Create one chart, whose elements are tagged with their combination
+                        new_chart_object = creator(chart_specs, raw_data, param_specs)
+                        yield from ChartsHTMLCreator._iter_chart_html(new_chart_object, filtered_by_params=True)
+                        continue
+
                     # Create one chart per combination
-                    charts_html_list = []
-                    param_combinations = _get_param_combinations(raw_data, param_specs)
-                    if not param_combinations:
-                        new_chart_specs = {**chart_specs, 'data': {'values': raw_data.to_dicts()}}
-                        new_chart_object = ChartCreator.create_object(chart_type, new_chart_specs)
-                        charts_html_list.append(ChartsHTMLCreator._create_chart_html(new_chart_object))
+                    param_partitions = _get_param_partitions(raw_data, param_specs)
+                    if not param_partitions:
+                        new_chart_object = creator(chart_specs, raw_data)
+                        yield from ChartsHTMLCreator._iter_chart_html(new_chart_object)
                     else:
-                        for combination in param_combinations:
-                            new_data = raw_data
-                            for key, value in combination.items():
-                                new_data = new_data.filter(pl.col(key) == value)
-
-                            new_chart_specs = {**chart_specs, 'data': {'values': new_data.to_dicts()}}
-                            new_chart_object = ChartCreator.create_object(chart_type, new_chart_specs)
-
-                            charts_html_list.append(
-                                ChartsHTMLCreator._create_chart_html(
-                                    new_chart_object,
-                                    param_name=param_name, param_values=combination
-                                )
+                        for index, (combination, new_data) in enumerate(param_partitions):
+                            new_chart_object = creator(chart_specs, new_data)
+
+                            if index > 0:
+                                yield '\n'  # Separate the charts of each combination
+                            yield from ChartsHTMLCreator._iter_chart_html(
+                                new_chart_object,
+                                param_name=param_name, param_values=combination
                             )
 
-                    html += '\n'.join(charts_html_list)
-
             else:
-                chart_specs['data'] = {'values': raw_data.to_dicts()}
-                html += ChartsHTMLCreator._create_chart_html(chart_object)
+                yield from ChartsHTMLCreator._iter_chart_html(chart_object)
 
             # Close the entity
-            html += '\t\t</a-entity>\n\t'
+            yield '\t\t</a-entity>\n\t'
 
         elif 'element' in chart_specs:  # Single element
-            html = ChartsHTMLCreator._create_element_html(chart_specs, is_movable=is_movable)
+            yield ChartsHTMLCreator._create_element_html(chart_specs, is_movable=is_movable)
 
         else:  # pragma: no cover (should never enter here, as chart_specs should have previously been validated)
             raise RuntimeError('Unreachable code: chart_specs should have been validated earlier')
 
-        return html
+    @staticmethod
+    def _create_entity_html(chart_specs: dict, scene_params_map: dict,
+                            prefetched: dict[str, Future] | None = None) -> str:
+        """Returns the HTML of the elements that compose the entity."""
+        return ''.join(ChartsHTMLCreator._iter_entity_html(chart_specs, scene_params_map, prefetched))
 
     @staticmethod
-    def create_charts_html(specs: dict) -> str:
+    def _create_entities_html_concurrently(charts_list: list, scene_params_map: dict, prefetched: dict[str, Future],
+                                           workers: int) -> list[str]:
         """
-        Returns the HTML of the charts that compose the scene.
+        Returns the HTML of each entity of the list, created by a pool of threads (most of the work of each chart is
+        done by polars, which releases the GIL).
+
+        Notes
+        -----
+        The warnings of each chart are collected while the pool is running (see _warnings_hook()), and shown in the
+        order of the charts once all the entities are created (so the output is the same as creating them one after
+        another). The warnings of other threads are shown as usual.
+        """
+        charts_warnings = [[] for _ in charts_list]
+
+        def create_entity_html(index: int, chart_specs: dict) -> str:
+            _warnings_collectors.collector = charts_warnings[index]
+            try:
+                return ChartsHTMLCreator._create_entity_html(chart_specs, scene_params_map, prefetched)
+            finally:
+                _warnings_collectors.collector = None
+
+        try:
+            with _warnings_hook(), ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(create_entity_html, range(len(charts_list)), charts_list))
+        finally:
+            for warning_args in chain.from_iterable(charts_warnings):
+                warnings.showwarning(*warning_args)
+
+    @staticmethod
+    def iter_charts_html(specs: dict, prefetched: dict[str, Future] | None = None) -> Iterator[str]:
+        """
+        Yields the HTML of the charts that compose the scene, in chunks.
 
         Parameters
         ----------
         specs : dict
             Specifications of all the charts composing the scene.
+        prefetched : dict[str, Future] | None (optional)
+            Data of the URLs of the scene, already being loaded (see _prefetch_data_async()). If not defined, the data
+            of the concatenated charts is loaded concurrently by a pool of threads.
 
         Notes
         -----
-        Supposing that specs is a dictionary, at this method has been called from SceneCreator.create_scene().
+        Supposing that specs is a dictionary, at this method has been called from SceneCreator.iter_scene().
+
+        Suppose that chart_specs is a dictionary for self._iter_entity_html(chart_specs).
+
+        The data sources of the concatenated charts are loaded concurrently before creating the charts.
 
-        Suppose that chart_specs is a dictionary for self._create_entity_html(chart_specs).
+        The budget of elements of the scene (specs['max_elements']) is split equally between the charts, except the
+        charts defining their own budget.
+
+        If specs['workers'] is greater than 1, the concatenated charts are created by a pool of that number of threads
+        (in the order of the charts, see self._create_entities_html_concurrently()). As the whole concatenation is
+        created before yielding it, the HTML of all the charts is kept in memory.
         """
-        scene_params = list(specs.get('params', []))
-        for chart in specs.get('concat', []):
-            scene_params.extend(chart.get('params', []))
-        scene_params_map = {p['name']: p for p in scene_params}
+        scene_params_map = _get_scene_params_map(specs)
 
         charts_list = specs.get('concat')
-        if charts_list:
-            return '\n\t\t'.join(
-                ChartsHTMLCreator._create_entity_html(chart, scene_params_map) for chart in charts_list
-            )
+        if not charts_list:
+            yield from ChartsHTMLCreator._iter_entity_html(specs, scene_params_map, prefetched)
+            return
+
+        if specs.get('max_elements') is not None:  # Share the budget of the scene between the charts
+            charts_budget = max(specs['max_elements'] // sum('mark' in chart for chart in charts_list), 1)
+            charts_list = [{'max_elements': charts_budget, **chart} if 'mark' in chart else chart
+                           for chart in charts_list]
+
+        workers = specs.get('workers')
+        with ThreadPoolExecutor(max_workers=DEFAULT_PREFETCH_MAX_WORKERS) as executor:
+            if prefetched is None:
+                prefetched = _prefetch_data(charts_list, executor)
+            if workers is not None and workers > 1:  # Charts are created concurrently (in other pool than the data)
+                entities_html = ChartsHTMLCreator._create_entities_html_concurrently(
+                    charts_list, scene_params_map, prefetched, workers
+                )
+                yield '\n\t\t'.join(entities_html)  # Separate the entities
+                return
+
+            for index, chart in enumerate(charts_list):
+                if index > 0:
+                    yield '\n\t\t'  # Separate the entities
+                yield from ChartsHTMLCreator._iter_entity_html(chart, scene_params_map, prefetched)
 
-        return ChartsHTMLCreator._create_entity_html(specs, scene_params_map)
+    @staticmethod
+    def create_charts_html(specs: dict) -> str:
+        """
+        Returns the HTML of the charts that compose the scene.
+
+        Parameters
+        ----------
+        specs : dict
+            Specifications of all the charts composing the scene.
+        """
+        return ''.join(ChartsHTMLCreator.iter_charts_html(specs))
@@ -0,0 +1,331 @@
+import json
+import math
+import polars as pl
+import struct
+import warnings
+
+from concurrent.futures import ThreadPoolExecutor
+from polars import DataFrame, Series
+
+from .chart_creator import ChartCreator, _pack_typed_array
+from .constants import DEFAULT_PREFETCH_MAX_WORKERS, GLB_COLORS, GLB_DEFAULT_COLOR
+from .element_creator import ElementsBatchCreator
+from .entities_html_creator import _get_raw_data_and_params, _prefetch_data
+
+_GLB_MAGIC = 0x46546C67  # 'glTF'
+_GLB_VERSION = 2
+_JSON_CHUNK_TYPE = 0x4E4F534A  # 'JSON'
+_BIN_CHUNK_TYPE = 0x004E4942  # 'BIN'
+
+_FLOAT, _UNSIGNED_INT = 5126, 5125  # Component types of the accessors
+_ARRAY_BUFFER, _ELEMENT_ARRAY_BUFFER = 34962, 34963  # Targets of the buffer views
+_POINTS, _LINES, _TRIANGLES = 0, 1, 4  # Modes of the primitives
+
+_RENDER_MODES = ('instanced', 'polyline', 'cloud')  # Modes of the marks for the HTML (meshes are always merged)
+_SPHERE_SEGMENTS = (18, 12)  # Width and height segments of the spheres
+_CYLINDER_SEGMENTS = 36  # Radial segments of a whole cylinder
+_CYLINDER_DEFAULT_HEIGHT = 1  # Height of a-cylinder when it is not defined
+
+
+def _box_template() -> tuple[DataFrame, list[int]]:
+    """Returns the vertices (positions and normals) and the triangles of a box of size 1, centered in the origin."""
+    vertices, indices = [], []
+    for axis in range(3):  # Two faces per axis
+        u_axis, v_axis = (axis + 1) % 3, (axis + 2) % 3
+        for sign in (1, -1):
+            first = len(vertices)
+            for u, v in ((-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)):
+                position, normal = [0.0] * 3, [0.0] * 3
+                position[axis], position[u_axis], position[v_axis] = 0.5 * sign, u * sign, v
+                normal[axis] = sign
+                vertices.append((*position, *normal))
+            indices += [first, first + 1, first + 2, first, first + 2, first + 3]
+    return DataFrame(vertices, schema=['vx', 'vy', 'vz', 'nx', 'ny', 'nz'], orient='row'), indices
+
+
+def _sphere_template() -> tuple[DataFrame, list[int]]:
+    """Returns the vertices (positions and normals) and the triangles of a sphere of radius 1, in the origin."""
+    width_segments, height_segments = _SPHERE_SEGMENTS
+    vertices, indices = [], []
+    for iy in range(height_segments + 1):
+        v = iy / height_segments
+        for ix in range(width_segments + 1):
+            u = ix / width_segments
+            x = -math.cos(2 * math.pi * u) * math.sin(math.pi * v)
+            y = math.cos(math.pi * v)
+            z = math.sin(2 * math.pi * u) * math.sin(math.pi * v)
+            vertices.append((x, y, z, x, y, z))  # Normal is the position (radius 1)
+
+    row = width_segments + 1
+    for iy in range(height_segments):
+        for ix in range(width_segments):
+            a, b = iy * row + ix + 1, iy * row + ix
+            c, d = (iy + 1) * row + ix, (iy + 1) * row + ix + 1
+            if iy != 0:
+                indices += [a, b, d]
+            if iy != height_segments - 1:
+                indices += [b, c, d]
+    return DataFrame(vertices, schema=['vx', 'vy', 'vz', 'nx', 'ny', 'nz'], orient='row'), indices
+
+
+def _cylinder_sector(radius: float, height: float, theta_start: float,
+                     theta_length: float) -> tuple[list[tuple], list[int]]:
+    """Returns the vertices and the triangles of a sector of cylinder (as a-cylinder, angles in degrees)."""
+    segments = max(1, math.ceil(_CYLINDER_SEGMENTS * theta_length / 360))
+    thetas = [math.radians(theta_start + theta_length * i / segments) for i in range(segments + 1)]
+
+    vertices, indices = [], []
+    for y in (height / 2, -height / 2):  # Side
+        vertices += [(radius * math.sin(t), y, radius * math.cos(t), math.sin(t), 0, math.cos(t)) for t in thetas]
+    for i in range(segments):
+        a, b, c, d = i, segments + 1 + i, segments + 2 + i, i + 1
+        indices += [a, b, d, b, c, d]
+
+    for y, sign in ((height / 2, 1), (-height / 2, -1)):  # Caps
+        center = len(vertices)
+        vertices.append((0, y, 0, 0, sign, 0))
+        vertices += [(radius * math.sin(t), y, radius * math.cos(t), 0, sign, 0) for t in thetas]
+        for i in range(segments):
+            indices += [center, center + 1 + i, center + 2 + i]
+    return vertices, indices
+
+
+def _split_coordinates(column: str, prefix: str) -> list[pl.Expr]:
+    """Returns the expressions of the coordinates of a column of positions (as "x y z")."""
+    coordinates = pl.col(column).str.split(' ')
+    return [coordinates.list.get(i).cast(pl.Float64).alias(f'{prefix}{axis}') for i, axis in enumerate('xyz')]
+
+
+def _rotation_quaternion(rotation: str) -> list[float]:
+    """Returns the quaternion (x, y, z, w) of the rotation in degrees (as A-Frame, using YXZ order)."""
+    c1, c2, c3, s1, s2, s3 = (f(math.radians(float(angle)) / 2) for f in (math.cos, math.sin)
+                              for angle in rotation.split())
+    return [
+        s1 * c2 * c3 + c1 * s2 * s3,
+        c1 * s2 * c3 - s1 * c2 * s3,
+        c1 * c2 * s3 - s1 * s2 * c3,
+        c1 * c2 * c3 + s1 * s2 * s3,
+    ]
+
+
+def _linear_color(color: str) -> list[float]:
+    """Returns the linear RGBA factor (as glTF materials) of the CSS color (name or hexadecimal)."""
+    hex_color = GLB_COLORS.get(color.lower(), color)
+    if not (hex_color.startswith('#') and len(hex_color) in (4, 7)):
+        warnings.warn(f'Color "{color}" cannot be exported to GLB, using "{GLB_DEFAULT_COLOR}".')
+        hex_color = GLB_COLORS[GLB_DEFAULT_COLOR]
+    if len(hex_color) == 4:  # Short format (#RGB)
+        hex_color = '#' + ''.join(2 * c for c in hex_color[1:])
+
+    srgb = [int(hex_color[i:i + 2], 16) / 255 for i in (1, 3, 5)]
+    return [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in srgb] + [1.0]
+
+
+class _GLBBuilder:
+    """Builder of the JSON and the binary chunk of the GLB (one mesh per chart, one primitive per material)."""
+
+    def __init__(self):
+        self._binary = bytearray()
+        self._gltf = {'asset': {'version': '2.0', 'generator': 'aframexr'}, 'scene': 0, 'scenes': [{'nodes': []}],
+                      'nodes': [], 'meshes': [], 'materials': [], 'accessors': [], 'bufferViews': []}
+        self._materials: dict[str, int] = {}
+
+    def _add_accessor(self, data: bytes, component_type: int, accessor_type: str, count: int, target: int,
+                      bounds: tuple[list, list] | None = None) -> int:
+        """Adds the data to the binary chunk and returns the index of its accessor."""
+        self._gltf['bufferViews'].append({
+            'buffer': 0, 'byteOffset': len(self._binary), 'byteLength': len(data), 'target': target
+        })
+        self._binary += data + b'\x00' * (-len(data) % 4)  # Views are aligned to 4 bytes
+
+        accessor = {'bufferView': len(self._gltf['bufferViews']) - 1, 'componentType': component_type,
+                    'count': count, 'type': accessor_type}
+        if bounds is not None:
+            accessor['min'], accessor['max'] = bounds
+        self._gltf['accessors'].append(accessor)
+        return len(self._gltf['accessors']) - 1
+
+    def _get_material(self, color: str) -> int:
+        """Returns the index of the material of the color (one material per color)."""
+        if color not in self._materials:
+            self._materials[color] = len(self._gltf['materials'])
+            self._gltf['materials'].append({
+                'name': color, 'doubleSided': True,
+                'pbrMetallicRoughness': {'baseColorFactor': _linear_color(color), 'metallicFactor': 0.0,
+                                         'roughnessFactor': 1.0}
+            })
+        return self._materials[color]
+
+    def create_primitive(self, mode: int, color: str, vertices: DataFrame, indices: Series | None = None) -> dict:
+        """
+        Returns the primitive of the vertices (columns x, y, z and, for triangles, nx, ny, nz), with the material of
+        the color.
+        """
+        positions = [vertices['x'], vertices['y'], vertices['z']]
+        positions = [p.cast(pl.Float32) for p in positions]
+        bounds = ([p.min() for p in positions], [p.max() for p in positions])  # Required for positions
+        attributes = {'POSITION': self._add_accessor(
+            _pack_typed_array(pl.Float32, *positions), _FLOAT, 'VEC3', vertices.height, _ARRAY_BUFFER, bounds
+        )}
+        if 'nx' in vertices.columns:
+            attributes['NORMAL'] = self._add_accessor(
+                _pack_typed_array(pl.Float32, vertices['nx'], vertices['ny'], vertices['nz']),
+                _FLOAT, 'VEC3', vertices.height, _ARRAY_BUFFER
+            )
+
+        primitive = {'attributes': attributes, 'material': self._get_material(color), 'mode': mode}
+        if indices is not None:
+            primitive['indices'] = self._add_accessor(
+                _pack_typed_array(pl.UInt32, indices), _UNSIGNED_INT, 'SCALAR', indices.len(), _ELEMENT_ARRAY_BUFFER
+            )
+        return primitive
+
+    def add_chart(self, group_specs: dict, relative_position: str, primitives: list[dict]) -> None:
+        """Adds the node of the chart (with its position and rotation), and the mesh of its primitives."""
+        mesh_node = {'translation': [float(p) for p in relative_position.split()]}
+        if primitives:
+            self._gltf['meshes'].append({'primitives': primitives})
+            mesh_node['mesh'] = len(self._gltf['meshes']) - 1
+        self._gltf['nodes'].append(mesh_node)
+
+        self._gltf['nodes'].append({
+            'translation': [float(p) for p in group_specs['position'].split()],
+            'rotation': _rotation_quaternion(group_specs['rotation']),
+            'children': [len(self._gltf['nodes']) - 1],
+        })
+        self._gltf['scenes'][0]['nodes'].append(len(self._gltf['nodes']) - 1)
+
+    def get_glb(self) -> bytes:
+        """Returns the binary glTF (header, JSON chunk and binary chunk)."""
+        gltf = {key: value for key, value in self._gltf.items() if value != []}  # Empty lists are not valid
+        if self._binary:
+            gltf['buffers'] = [{'byteLength': len(self._binary)}]
+
+        json_chunk = json.dumps(gltf, separators=(',', ':')).encode()
+        json_chunk += b' ' * (-len(json_chunk) % 4)  # Padded with spaces
+        chunks = struct.pack('<II', len(json_chunk), _JSON_CHUNK_TYPE) + json_chunk
+        if self._binary:
+            chunks += struct.pack('<II', len(self._binary), _BIN_CHUNK_TYPE) + self._binary
+        return struct.pack('<III', _GLB_MAGIC, _GLB_VERSION, 12 + len(chunks)) + chunks
+
+
+class GLBCreator:
+    """GLB (binary glTF) creator class."""
+
+    @staticmethod
+    def _get_triangles(template: tuple[DataFrame, list[int]], elements: DataFrame) -> tuple[DataFrame, Series]:
+        """
+        Returns the vertices and the indices of the template placed on each element (columns px, py, pz for the
+        position, and sx, sy, sz for the scale), merged in one mesh.
+        """
+        template_vertices, template_indices = template
+        vertices = elements.with_row_index('element').join(template_vertices, how='cross').select(
+            x=pl.col('vx') * pl.col('sx') + pl.col('px'),
+            y=pl.col('vy') * pl.col('sy') + pl.col('py'),
+            z=pl.col('vz') * pl.col('sz') + pl.col('pz'),
+            nx='nx', ny='ny', nz='nz',
+        )
+        indices = (
+            pl.DataFrame({'element': pl.int_range(elements.height, eager=True, dtype=pl.UInt32)})
+            .join(pl.DataFrame({'index': pl.Series(template_indices, dtype=pl.UInt32)}), how='cross')
+            .select(pl.col('element') * template_vertices.height + pl.col('index'))
+            .to_series()
+        )
+        return vertices, indices
+
+    @staticmethod
+    def _get_primitives(builder: _GLBBuilder, batch: ElementsBatchCreator, as_points: bool) -> list[dict]:
+        """Returns the primitives (one per color) of the batch of elements."""
+        element_type, specs = batch.get_element_type(), batch.get_elements_specs()
+        primitives = []
+        for (color,), elements in specs.partition_by('color', maintain_order=True, as_dict=True).items():
+            if element_type == 'line':
+                starts = elements.with_row_index('segment').select('segment', *_split_coordinates('start', ''))
+                ends = elements.with_row_index('segment').select('segment', *_split_coordinates('end', ''))
+                vertices = pl.concat([starts, ends]).sort('segment', maintain_order=True)  # Start and end of segments
+                primitives.append(builder.create_primitive(_LINES, color, vertices))
+                continue
+
+            positions = elements.select(*_split_coordinates('position', 'p'))
+            if element_type == 'sphere' and as_points:
+                vertices = positions.rename({'px': 'x', 'py': 'y', 'pz': 'z'})
+                primitives.append(builder.create_primitive(_POINTS, color, vertices))
+            elif element_type in ('box', 'sphere'):
+                if element_type == 'box':
+                    template = _box_template()
+                    scales = elements.select(sx='width', sy='height', sz='depth')
+                else:
+                    template = _sphere_template()
+                    scales = elements.select(sx='radius', sy='radius', sz='radius')
+                vertices, indices = GLBCreator._get_triangles(template, positions.hstack(scales))
+                primitives.append(builder.create_primitive(_TRIANGLES, color, vertices, indices))
+            elif element_type == 'cylinder':
+                vertices, indices = [], []
+                for position, element in zip(positions.iter_rows(), elements.iter_rows(named=True)):
+                    sector_vertices, sector_indices = _cylinder_sector(
+                        element['radius'], element['height'] or _CYLINDER_DEFAULT_HEIGHT, element['theta_start'],
+                        element['theta_length']
+                    )
+                    indices += [len(vertices) + index for index in sector_indices]
+                    vertices += [(x + position[0], y + position[1], z + position[2], *normal)
+                                 for x, y, z, *normal in sector_vertices]
+                vertices = DataFrame(vertices, schema=['x', 'y', 'z', 'nx', 'ny', 'nz'], orient='row')
+                primitives.append(builder.create_primitive(
+                    _TRIANGLES, color, vertices, pl.Series(indices, dtype=pl.UInt32)
+                ))
+        return primitives
+
+    @staticmethod
+    def _add_chart(builder: _GLBBuilder, chart_specs: dict, scene_params_map: dict, prefetched: dict) -> None:
+        """Adds the elements and the axes of the chart to the GLB."""
+        mark = chart_specs['mark'] if isinstance(chart_specs['mark'], dict) else {'type': chart_specs['mark']}
+        as_points = mark.get('cloud', False)
+        chart_specs = {**chart_specs, 'mark': {k: v for k, v in mark.items() if k not in _RENDER_MODES}}
+
+        raw_data, _ = _get_raw_data_and_params(chart_specs, scene_params_map, prefetched)  # Views are not exported
+        chart_object = ChartCreator.create_object(mark['type'], chart_specs, raw_data)
+
+        primitives = []
+        for batch in chart_object.get_elements(filtered_by_params=False):
+            primitives += GLBCreator._get_primitives(builder, batch, as_points)
+
+        axes_specs = chart_object.get_axes_specs()
+        if axes_specs:
+            axes = DataFrame({'start': [ax['start'] for ax in axes_specs.values()],
+                              'end': [ax['end'] for ax in axes_specs.values()], 'color': 'black'})
+            primitives += GLBCreator._get_primitives(builder, ElementsBatchCreator('line', axes), as_points=False)
+
+        builder.add_chart(chart_object.get_group_specs(), chart_object.get_relative_bottom_left_corner_position(),
+                          primitives)
+
+    @staticmethod
+    def create_glb(specs: dict) -> bytes:
+        """
+        Returns the binary glTF (GLB) of the charts that compose the scene.
+
+        Parameters
+        ----------
+        specs : dict
+            Specifications of all the charts composing the scene.
+
+        Notes
+        -----
+        The elements of each chart are merged into one mesh, with one primitive per material (color): bars, points and
+        arcs are triangles, lines and axes are lines, and the points of a cloud are points. Texts (labels, titles and
+        legends) and single elements are not exported. Charts filtered by params are exported with all their data.
+        """
+        scene_params = list(specs.get('params', []))
+        for chart in specs.get('concat', []):
+            scene_params.extend(chart.get('params', []))
+        scene_params_map = {p['name']: p for p in scene_params}
+
+        charts_list = specs.get('concat') or [specs]
+        builder = _GLBBuilder()
+        with ThreadPoolExecutor(max_workers=DEFAULT_PREFETCH_MAX_WORKERS) as executor:
+            prefetched = _prefetch_data(charts_list, executor)
+            for chart_specs in charts_list:
+                if 'mark' not in chart_specs:
+                    warnings.warn('Single elements are not exported to GLB.')
+                    continue
+                GLBCreator._add_chart(builder, chart_specs, scene_params_map, prefetched)
+        return builder.get_glb()
@@ -0,0 +1,219 @@
+import asyncio
+import hashlib
+import io
+import json
+import os
+import polars as pl
+import threading
+import urllib.error, urllib.request
+
+from polars import DataFrame
+from typing import Callable
+
+from .constants import DEFAULT_HTTP_CACHE_MAX_BYTES
+
+NO_VALIDATORS = (None, None)  # Version of the responses without ETag and Last-Modified headers
+
+
+def _get_default_directory() -> str:
+    """Returns the default directory of the HTTP cache (AFRAMEXR_CACHE_DIR, or ~/.cache/aframexr)."""
+    return os.environ.get('AFRAMEXR_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'aframexr')
+
+
+class HTTPCache:
+    """
+    Persistent on-disk cache of the data loaded from remote URLs.
+
+    Parameters
+    ----------
+    directory : str | None (optional)
+        Directory of the cache. If not defined, using AFRAMEXR_CACHE_DIR environment variable, or ~/.cache/aframexr.
+    max_bytes : int (optional)
+        Maximum size (in bytes) of the cached files. If not defined, using DEFAULT_HTTP_CACHE_MAX_BYTES.
+
+    Notes
+    -----
+    The data is stored as Arrow IPC files, together with the ETag and Last-Modified headers of the response. Cached
+    data is revalidated using If-None-Match / If-Modified-Since, so unchanged data costs one 304 response. Setting
+    directory to None disables the cache.
+
+    Examples
+    --------
+    >>> import aframexr
+    >>> aframexr.http_cache.directory = '/tmp/aframexr_cache'  # Change the directory of the cache
+    >>> aframexr.http_cache.max_bytes = 2 * 2 ** 30  # Increase the maximum size to 2 GiB
+    """
+
+    def __init__(self, directory: str | None = None, max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES):
+        self.directory = directory or _get_default_directory()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _get_paths(self, url: str) -> tuple[str, str]:
+        """Returns the paths of the data file and the metadata file for the URL."""
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.directory, f'{name}.arrow'), os.path.join(self.directory, f'{name}.json')
+
+    def _read_metadata(self, url: str) -> dict | None:
+        """Returns the metadata (validators of the response) of the cached URL, or None if it is not cached."""
+        if self.directory is None:
+            return None
+
+        data_path, metadata_path = self._get_paths(url)
+        try:
+            with open(metadata_path) as file:
+                metadata = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return metadata if os.path.exists(data_path) else None
+
+    def _enforce_max_bytes(self) -> None:
+        """Removes the least recently used files until the cache fits in its maximum size."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.arrow'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):  # Oldest first
+            if total_size <= self.max_bytes:
+                break
+            for file_path in (path, path.removesuffix('.arrow') + '.json'):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:  # pragma: no cover (removed by another process)
+                    pass
+            total_size -= size
+
+    def _store(self, url: str, data: DataFrame, metadata: dict) -> None:
+        """Stores the data and the metadata of the URL (atomically, so concurrent readers never see partial files)."""
+        data_path, metadata_path = self._get_paths(url)
+        suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'  # Unique temporal files (for concurrent writers)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            data.write_ipc(data_path + suffix)
+            os.replace(data_path + suffix, data_path)
+            with open(metadata_path + suffix, 'w') as file:
+                json.dump(metadata, file)
+            os.replace(metadata_path + suffix, metadata_path)
+            self._enforce_max_bytes()
+
+    def _get_validators(self, url: str, memory_version: tuple | None) -> tuple[tuple | None, dict | None]:
+        """
+        Returns a tuple containing the validators (ETag and Last-Modified) revalidating the data, and the metadata of
+        the cached URL on disk. The validators of the data in memory are used before the ones on disk (the metadata
+        is not read in that case).
+        """
+        if memory_version is not None:
+            return memory_version, None
+        metadata = self._read_metadata(url)
+        if metadata is None:
+            return None, None
+        return (metadata.get('etag'), metadata.get('last_modified')), metadata
+
+    @staticmethod
+    def _get_request_headers(validators: tuple | None) -> dict:
+        """Returns the headers of the conditional request (revalidating the cached data)."""
+        headers = {}
+        if validators is not None:
+            etag, last_modified = validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _get_not_modified_data(self, url: str, metadata: dict | None,
+                               memory_version: tuple | None) -> tuple[DataFrame | None, tuple]:
+        """Returns the cached data of the URL (or None if the data in memory is up-to-date) and its version."""
+        if memory_version is not None:  # Revalidated with the validators of the data in memory
+            return None, memory_version
+
+        data_path, _ = self._get_paths(url)
+        os.utime(data_path)  # Mark as recently used
+        with open(data_path, 'rb') as file:  # Read in memory (not mapped), so the file can be replaced
+            return pl.read_ipc(io.BytesIO(file.read())), (metadata.get('etag'), metadata.get('last_modified'))
+
+    def _get_modified_data(self, url: str, parse: Callable[[io.BytesIO, str, str], DataFrame], body: io.BytesIO,
+                           content_type: str, etag: str | None, last_modified: str | None) -> tuple[DataFrame, tuple]:
+        """Returns the data parsed from the body of the response (stored if it can be revalidated) and its version."""
+        data = parse(body, content_type, url)
+        if self.directory is not None and (etag or last_modified):  # Data can be revalidated
+            self._store(url, data, {'url': url, 'etag': etag, 'last_modified': last_modified})
+        return data, (etag, last_modified)
+
+    def clear(self) -> None:
+        """Removes all the cached files."""
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(('.arrow', '.json')):
+                    os.remove(entry.path)
+
+    def fetch(self, url: str, parse: Callable[[io.BytesIO, str, str], DataFrame], memory_version: tuple | None = None,
+              timeout: float = 10) -> tuple[DataFrame | None, tuple]:
+        """
+        Returns a tuple containing the data of the URL and its version (tuple of the ETag and Last-Modified headers).
+
+        Parameters
+        ----------
+        url : str
+            URL of the data.
+        parse : Callable
+            Function that returns the DataFrame from the body, the content type and the URL of the response.
+        memory_version : tuple | None (optional)
+            Version of the data already loaded in memory. If the server responds that it has not been modified, the
+            returned data is None (the data in memory must be used).
+        timeout : float (optional)
+            Timeout of the request in seconds.
+
+        Notes
+        -----
+        The data is revalidated with the validators of the data in memory (even if it is not stored on disk), or else
+        with the ones of the data on disk. If the server did not send any validator (NO_VALIDATORS version), the data
+        in memory cannot be revalidated, so it is used without any request while it is in memory.
+
+        Raises
+        ------
+        IOError
+            If the data could not be loaded from the URL.
+        """
+        if memory_version == NO_VALIDATORS:  # Data in memory cannot be revalidated
+            return None, memory_version
+
+        validators, metadata = self._get_validators(url, memory_version)
+        headers = self._get_request_headers(validators)
+
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+                content_type = response.info().get_content_type()
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+                body = io.BytesIO(response.read())  # For polars
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or validators is None:
+                raise IOError(f'Could not load data from URL: {url}.')
+
+            return self._get_not_modified_data(url, metadata, memory_version)  # Not modified, use the cached data
+        except urllib.error.URLError:
+            raise IOError(f'Could not load data from URL: {url}.')
+
+        return self._get_modified_data(url, parse, body, content_type, etag, last_modified)
+
+    async def fetch_async(self, url: str, parse: Callable[[io.BytesIO, str, str], DataFrame],
+                          memory_version: tuple | None = None,
+                          timeout: float = 10) -> tuple[DataFrame | None, tuple]:
+        """
+        Asynchronous version of fetch(), executed in a worker thread (the event loop is never blocked).
+
+        Notes
+        -----
+        The request is made by urllib as in fetch(), so the proxies, redirections and errors are the same. The task
+        can be cancelled while waiting for the response (the request is completed in its thread, and discarded).
+        """
+        return await asyncio.to_thread(self.fetch, url, parse, memory_version, timeout)
+
+
+http_cache = HTTPCache()  # Cache used when loading remote UrlData
@@ -1,4 +1,11 @@
-from .entities_html_creator import ChartsHTMLCreator
+import asyncio
+import functools
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib import resources
+from typing import AsyncIterator, Iterator
+
+from .entities_html_creator import ChartsHTMLCreator, _prefetch_data_async
 
 HTML_SCENE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -8,7 +15,7 @@ HTML_SCENE_TEMPLATE = """<!DOCTYPE html>
   <script src="https://aframe.io/releases/1.7.1/aframe.min.js"></script>
   <script src="https://cdn.jsdelivr.net/gh/c-frame/aframe-extras@7.6.1/dist/aframe-extras.min.js"></script>
   <script src="https://unpkg.com/aframe-environment-component@1.5.0/dist/aframe-environment-component.min.js"></script>
-  <script src="https://cdn.jsdelivr.net/gh/davidlab20/TFG@v0.10.2/docs/static/scripts/main.min.js"></script>
+  {main_script}
 </head>
 <body>
 <a-scene cursor="rayOrigin: mouse" raycaster="objects: [raycastable]" drag-controls="mode: cursor"
@@ -41,17 +48,44 @@ HTML_SCENE_TEMPLATE = """<!DOCTYPE html>
 </body>
 </html>"""
 
+# Script of the last release (without the components of the rendering modes and the param views of the elements)
+PUBLISHED_MAIN_SCRIPT_URL = 'https://cdn.jsdelivr.net/gh/davidlab20/TFG@v0.10.2/docs/static/scripts/main.min.js'
+PUBLISHED_MAIN_SCRIPT = f'<script src="{PUBLISHED_MAIN_SCRIPT_URL}"></script>'
+
+
+@functools.cache
+def _get_packaged_main_script() -> str:
+    """Returns the script element with the code of main.js shipped with the package (read once)."""
+    return f'<script>\n{resources.files("aframexr").joinpath("static", "main.js").read_text()}\n</script>'
+
+
+def _uses_unpublished_components(specs: dict) -> bool:
+    """
+    Returns True if the scene uses components that the published main.js does not register (instanced-mesh,
+    point-cloud and line-strip marks, and param views tagging the elements).
+    """
+    charts_specs = [specs, *specs.get('concat', [])]
+    for chart_specs in charts_specs:
+        mark = chart_specs.get('mark')
+        if isinstance(mark, dict) and any(mark.get(mode) for mode in ('instanced', 'cloud', 'polyline')):
+            return True
+        if any(p.get('select', {}).get('views') == 'elements' for p in chart_specs.get('params', [])):
+            return True
+    return False
+
 
 class SceneCreator:
     @staticmethod
-    def create_scene(specs: dict):
+    def iter_scene(specs: dict, prefetched: dict[str, Future] | None = None) -> Iterator[str]:
         """
-        Creates the HTML scene from the JSON specifications.
+        Yields the HTML scene from the JSON specifications, in chunks (the document is never built as a whole).
 
         Parameters
         ----------
         specs : dict
             Specifications of the elements composing the scene.
+        prefetched : dict[str, Future] | None (optional)
+            Data of the URLs of the scene, already loaded (see ChartsHTMLCreator.iter_charts_html()).
         """
         ar_scale = specs.get('ar_scale')
         if ar_scale is None:
@@ -59,7 +93,51 @@ class SceneCreator:
         else:
             ar_scale_value = f'="scale: {ar_scale}"'  # Setting value for JavaScript
         environment = specs.get('environment', 'default')
-        elements_html = ChartsHTMLCreator.create_charts_html(specs)
-        return HTML_SCENE_TEMPLATE.format(
-            ar_scale_value=ar_scale_value, environment=environment, elements=elements_html
-        )
+
+        # The published script is loaded unless the scene needs the components of the script shipped with the package
+        main_script = _get_packaged_main_script() if _uses_unpublished_components(specs) else PUBLISHED_MAIN_SCRIPT
+
+        scene_start, scene_end = HTML_SCENE_TEMPLATE.split('{elements}')
+        yield scene_start.format(ar_scale_value=ar_scale_value, environment=environment, main_script=main_script)
+        yield from ChartsHTMLCreator.iter_charts_html(specs, prefetched)
+        yield scene_end
+
+    @staticmethod
+    async def iter_scene_async(specs: dict) -> AsyncIterator[str]:
+        """
+        Asynchronously yields the HTML scene from the JSON specifications, in chunks.
+
+        Parameters
+        ----------
+        specs : dict
+            Specifications of the elements composing the scene.
+
+        Notes
+        -----
+        The data of the scene is loaded without blocking the event loop (in worker threads, all the URLs
+        concurrently). Then, each chunk is created in a worker thread, so the event loop only waits between chunks and
+        the creation of the scene can be cancelled between them.
+        """
+        prefetched = await _prefetch_data_async(specs.get('concat') or [specs])
+        iterator = SceneCreator.iter_scene(specs, prefetched)
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)  # Chunks are created (and the iterator closed) one at a time
+        try:
+            while (chunk := await loop.run_in_executor(executor, next, iterator, None)) is not None:
+                yield chunk
+        finally:
+            executor.submit(iterator.close)  # Releases the resources of the iterator, once the last chunk ends
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def create_scene(specs: dict):
+        """
+        Creates the HTML scene from the JSON specifications.
+
+        Parameters
+        ----------
+        specs : dict
+            Specifications of the elements composing the scene.
+        """
+        return ''.join(SceneCreator.iter_scene(specs))
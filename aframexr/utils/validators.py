@@ -1,7 +1,9 @@
+from polars import DataFrame, LazyFrame
 from typing import Literal
 
 from .constants import (
-    AVAILABLE_AGGREGATES, AVAILABLE_ENCODING_TYPES, AVAILABLE_ENVIRONMENTS, AVAILABLE_MARKS, ERROR_MESSAGES
+    AVAILABLE_AGGREGATES, AVAILABLE_ENCODING_TYPES, AVAILABLE_ENVIRONMENTS, AVAILABLE_MARKS, AVAILABLE_PARAM_VIEWS,
+    DEFAULT_PARAM_VIEWS, ERROR_MESSAGES
 )
 from .element_creator import CREATOR_MAP
 
@@ -37,6 +39,9 @@ def _validate_data(data: dict) -> None:
 
     if 'values' in data:
         values = data['values']
+        if isinstance(values, (DataFrame, LazyFrame)):  # Columnar data (internally resolved, not in JSON specifications)
+            return
+
         AframeXRValidator.validate_type('specs.data.values', values, list)
         if not all(isinstance(v, dict) for v in values):
             raise TypeError(ERROR_MESSAGES['NOT_ALL_DATA_VALUES_ARE_DICT'])
@@ -101,6 +106,9 @@ def _validate_params(params: list) -> None:
         AframeXRValidator.validate_type('specs.params.param', p, dict)
         if not 'name' in p:
             raise ValueError(ERROR_MESSAGES['NAME_NOT_IN_PARAM'])
+        views = p.get('select', {}).get('views', DEFAULT_PARAM_VIEWS)
+        if views not in AVAILABLE_PARAM_VIEWS:
+            raise ValueError(ERROR_MESSAGES['PARAM_VIEWS'].format(views=views))
 
 
 def _validate_transform(transform: list[dict]) -> None:
@@ -122,6 +130,11 @@ def _validate_transform(transform: list[dict]) -> None:
                     raise ValueError(ERROR_MESSAGES['AGGREGATE_OPERATION_NOT_IN_AGGREGATE'])
                 AframeXRValidator.validate_aggregate_operation(agg['op'])
 
+        elif t.get('bin'):
+            AframeXRValidator.validate_type('specs.transform.bin', t['bin'], (bool, dict))
+            if 'field' not in t:
+                raise ValueError(ERROR_MESSAGES['FIELD_NOT_IN_BIN'])
+
         else:
             raise ValueError(ERROR_MESSAGES['TRANSFORM_TYPE'].format(transform_type=t))
 
@@ -140,6 +153,13 @@ class AframeXRValidator:
     def validate_chart_specs(specs: dict) -> None:
         """Raises ValueError if chart specifications are invalid."""
         AframeXRValidator.validate_type('specifications', specs, dict)
+        if 'max_elements' in specs:  # Options of the scene (or of the chart)
+            AframeXRValidator.validate_type('max_elements', specs['max_elements'], int)
+            AframeXRValidator.validate_positive_number('max_elements', specs['max_elements'])
+        if 'workers' in specs:
+            AframeXRValidator.validate_type('workers', specs['workers'], int)
+            AframeXRValidator.validate_positive_number('workers', specs['workers'])
+
         if 'concat' in specs:
             charts = specs['concat']
             AframeXRValidator.validate_type('specs.concat', charts, list)
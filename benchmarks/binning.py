@@ -0,0 +1,49 @@
+"""
+Benchmark of building the scene of a histogram of a binned field (X(bin=...) and count).
+
+Measures the time of the whole scene (binning and counting inside the query, and layout of the bars) for several
+numbers of rows, with 1D (x) and 2D (x and z) bins.
+
+Execute --> python3 benchmarks/binning.py [--rows N ...] [--maxbins N]
+"""
+
+import argparse
+import time
+
+import polars as pl
+
+import aframexr
+
+
+def generate_dataset(rows: int) -> pl.DataFrame:
+    index = pl.int_range(0, rows, eager=True)
+    return pl.DataFrame({
+        'x': (index * 7919 % 100_003) / 100,
+        'z': (index * 104729 % 99_991) / 100,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--maxbins', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{"rows":>10} | {"1D (s)":>10} | {"2D (s)":>10}')
+    for rows in args.rows:
+        data = generate_dataset(rows)
+        charts = [
+            aframexr.Chart(data).mark_bar().encode(x=aframexr.X('x', bin=args.maxbins), y='count()'),
+            aframexr.Chart(data).mark_bar().encode(x=aframexr.X('x', bin=args.maxbins),
+                                                   z=aframexr.Z('z', bin=args.maxbins), y='count()'),
+        ]
+        times = []
+        for chart in charts:
+            t0 = time.perf_counter()
+            chart.to_html()
+            times.append(time.perf_counter() - t0)
+        print(f'{rows:>10} | {times[0]:>10.4f} | {times[1]:>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark of building charts with the fluent API (mark_*, encode, transform_*, properties and concatenation).
+
+Builds N charts over the same DataFrame and concatenates them in one scene, measuring time and peak of allocated
+memory. Every builder call shares the unchanged specifications and the data reference, so the cost does not depend
+on the number of rows of the data.
+
+Execute --> python3 benchmarks/chart_building.py [--charts N] [--rows N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import polars as pl
+
+import aframexr
+
+
+def build_scene(data: pl.DataFrame, charts: int) -> aframexr.Chart:
+    scene = None
+    for i in range(charts):
+        chart = (aframexr.Chart(data).mark_bar().encode(x='cat', y='sum(y)').transform_filter(f'datum.x > {i % 100}')
+                 .properties(position=f'{i * 5} 0 0'))
+        scene = chart if scene is None else scene + chart
+    return scene
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--charts', type=int, nargs='+', default=[100, 1_000, 5_000])
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    index = pl.int_range(0, args.rows, eager=True)
+    data = pl.DataFrame({'x': index % 100, 'y': index * 7919 % 1000, 'cat': (index % 5).cast(pl.String)})
+
+    print(f'{"charts":>10} | {"time (s)":>10} | {"peak (MiB)":>10}')
+    for charts in args.charts:
+        gc.collect()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        build_scene(data, charts)
+        elapsed = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{charts:>10} | {elapsed:>10.4f} | {peak / 2 ** 20:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of the data hand-over between the transformation stage and the chart creators.
+
+Compares the previous path (polars DataFrame --> list of dicts --> polars DataFrame) with the columnar path (the
+transformed DataFrame is passed directly to ChartCreator), measuring time and peak of allocated memory.
+
+Execute --> python3 benchmarks/columnar_data.py [--rows N] [--repeats N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import polars as pl
+
+from aframexr.utils.chart_creator import ChartCreator
+
+CHART_SPECS = {'mark': {'type': 'point'}, 'encoding': {'x': {'field': 'x'}, 'y': {'field': 'y'},
+                                                       'color': {'field': 'cat'}}}
+
+
+def generate_dataset(rows: int) -> pl.DataFrame:
+    index = pl.int_range(0, rows, eager=True)
+    return pl.DataFrame({
+        'x': (index * 7919 % 1000) / 10,
+        'y': (index * 104729 % 1000) / 10,
+        'cat': (index % 3).replace_strict({0: 'A', 1: 'B', 2: 'C'}, return_dtype=pl.String),
+    })
+
+
+def dicts_path(data: pl.DataFrame) -> ChartCreator:
+    return ChartCreator.create_object('point', {**CHART_SPECS, 'data': {'values': data.to_dicts()}})
+
+
+def columnar_path(data: pl.DataFrame) -> ChartCreator:
+    return ChartCreator.create_object('point', CHART_SPECS, data)
+
+
+def measure(func, data: pl.DataFrame, repeats: int) -> tuple[float, int]:
+    """Returns the best time (seconds) and the peak of allocated memory (bytes) of func(data)."""
+    best_time = float('inf')
+    for _ in range(repeats):
+        gc.collect()
+        t0 = time.perf_counter()
+        func(data)
+        best_time = min(best_time, time.perf_counter() - t0)
+
+    gc.collect()
+    tracemalloc.start()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best_time, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 500_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"rows":>10} | {"dicts (s)":>10} | {"columnar (s)":>12} | {"dicts (MiB)":>11} | {"columnar (MiB)":>14}')
+    for rows in args.rows:
+        data = generate_dataset(rows)
+        dicts_time, dicts_mem = measure(dicts_path, data, args.repeats)
+        columnar_time, columnar_mem = measure(columnar_path, data, args.repeats)
+        print(f'{rows:>10} | {dicts_time:>10.4f} | {columnar_time:>12.4f} | '
+              f'{dicts_mem / 2 ** 20:>11.2f} | {columnar_mem / 2 ** 20:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
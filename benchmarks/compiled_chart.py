@@ -0,0 +1,57 @@
+"""
+Benchmark of rendering the same chart definition with many datasets, with to_html() and with a compiled chart.
+
+Measures the time of rendering a filtered and aggregated bar chart once per dataset (small datasets, so the time is
+dominated by the data-independent work), and checks that the scenes are the same.
+
+Execute --> python3 benchmarks/compiled_chart.py [--datasets N] [--rows N]
+"""
+
+import argparse
+import time
+
+import polars as pl
+
+import aframexr
+
+
+def generate_datasets(datasets: int, rows: int) -> list:
+    index = pl.int_range(0, rows, eager=True)
+    return [
+        pl.DataFrame({
+            'model': (index % 7).cast(pl.String),
+            'sales': (index * 7919 + customer) % 1009,
+            'doors': (index + customer) % 5 + 1,
+        })
+        for customer in range(datasets)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--datasets', type=int, default=500)
+    parser.add_argument('--rows', type=int, default=50)
+    args = parser.parse_args()
+
+    datasets = generate_datasets(args.datasets, args.rows)
+    chart = aframexr.Chart().mark_bar().encode(x='model', y='sum(sales)') \
+        .transform_filter('datum.doors > 2').transform_filter('datum.sales < 900')
+
+    t0 = time.perf_counter()
+    expected = [chart.properties(data=data).to_html() for data in datasets]
+    uncompiled = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    compiled_chart = chart.compile()
+    scenes = [compiled_chart.render(data) for data in datasets]
+    compiled = time.perf_counter() - t0
+
+    print(f'{"method":>10} | {"time (s)":>10} | {"per dataset (ms)":>16} | {"speedup":>8}')
+    print(f'{"to_html":>10} | {uncompiled:>10.4f} | {uncompiled / args.datasets * 1000:>16.3f} | {1:>8.2f}')
+    print(f'{"compiled":>10} | {compiled:>10.4f} | {compiled / args.datasets * 1000:>16.3f} | '
+          f'{uncompiled / compiled:>8.2f}')
+    print(f'same output: {"yes" if scenes == expected else "NO"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Stress benchmark of rendering charts concurrently from several threads (as a threaded web server does).
+
+Renders the same chart and different charts from each number of threads, checks that every output is identical to
+the sequential output, and reports the throughput (scenes per second) and its scaling against one thread.
+
+Execute --> python3 benchmarks/concurrent_rendering.py [--renders N] [--points N] [--threads N ...]
+"""
+
+import argparse
+import os
+import time
+
+import polars as pl
+
+from concurrent.futures import ThreadPoolExecutor
+
+import aframexr
+
+
+def generate_charts(points: int) -> list:
+    index = pl.int_range(0, points, eager=True)
+    data = pl.DataFrame({
+        'x': (index * 7919 % 1009) / 10,
+        'y': (index * 104729 % 1013) / 10,
+        'z': (index * 1299709 % 1019) / 10,
+        'sensor': 's' + (index % 4).cast(pl.String),
+    })
+    return [
+        aframexr.Chart(data).mark_point().encode(x='x', y='y', z='z', color='sensor'),
+        aframexr.Chart(data).mark_bar().encode(x='sensor', y='mean(y)'),
+        aframexr.Chart(data).mark_line().encode(x='x', y='y', color='sensor'),
+        aframexr.Chart(data).mark_arc().encode(color='sensor', theta='sum(z)'),
+    ]
+
+
+def measure(charts: list, expected: list, renders: int, threads: int) -> tuple[float, bool]:
+    """Returns the throughput (scenes per second) of the renders and whether all the outputs are the expected."""
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        outputs = list(executor.map(lambda i: charts[i % len(charts)].to_html(), range(renders)))
+    elapsed = time.perf_counter() - t0
+    identical = all(output == expected[i % len(charts)] for i, output in enumerate(outputs))
+    return renders / elapsed, identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--renders', type=int, default=200)
+    parser.add_argument('--points', type=int, default=5_000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    charts = generate_charts(args.points)
+    expected = [chart.to_html() for chart in charts]
+
+    print(f'{"threads":>8} | {"charts":>9} | {"scenes/s":>10} | {"scaling":>8} | {"identical":>9}')
+    for label, rendered_charts, rendered_expected in [('same', charts[:1], expected[:1]),
+                                                      ('different', charts, expected)]:
+        baseline = None
+        for threads in dict.fromkeys(args.threads):
+            throughput, identical = measure(rendered_charts, rendered_expected, args.renders, threads)
+            baseline = baseline or throughput
+            print(f'{threads:>8} | {label:>9} | {throughput:>10.2f} | {throughput / baseline:>8.2f} | '
+                  f'{"yes" if identical else "NO":>9}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of the HTML emission of the elements of a chart.
+
+Compares the per-row path (one ElementCreator object per element, formatting the attributes in Python) with the
+columnar path (ElementsBatchCreator, rendering all the elements in one polars expression).
+
+Execute --> python3 benchmarks/element_html.py [--rows N] [--repeats N]
+"""
+
+import argparse
+import time
+
+import polars as pl
+
+from aframexr.utils.element_creator import BoxCreator, ElementsBatchCreator
+
+
+def generate_specs(rows: int) -> pl.DataFrame:
+    index = pl.int_range(0, rows, eager=True)
+    return pl.DataFrame({
+        'info': 'model: ' + (index % 50).cast(pl.String),
+        'position': (index * 0.1).cast(pl.String) + ' 1.5 0',
+        'width': pl.repeat(0.4, rows, eager=True),
+        'height': (index % 1000) / 100,
+        'depth': pl.repeat(1.0, rows, eager=True),
+        'color': pl.repeat('#FF0000', rows, eager=True),
+    })
+
+
+def per_row_path(specs: pl.DataFrame) -> list[str]:
+    return [BoxCreator(element_specs).get_element_html(is_movable=False) for element_specs in specs.to_dicts()]
+
+
+def columnar_path(specs: pl.DataFrame) -> list[str]:
+    return ElementsBatchCreator('box', specs).get_elements_html(is_movable=False)
+
+
+def best_time(func, specs: pl.DataFrame, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func(specs)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 500_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"rows":>10} | {"per row (s)":>11} | {"columnar (s)":>12}')
+    for rows in args.rows:
+        specs = generate_specs(rows)
+        assert per_row_path(specs.head(100)) == columnar_path(specs.head(100))  # Same HTML
+        print(f'{rows:>10} | {best_time(per_row_path, specs, args.repeats):>11.4f} | '
+              f'{best_time(columnar_path, specs, args.repeats):>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
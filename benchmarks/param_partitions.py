@@ -0,0 +1,65 @@
+"""
+Benchmark of the views of a chart filtered by a selection_point param.
+
+Compares the previous path (filtering the whole data once per combination of the param fields) with the single-pass
+partitioning of the data, for several numbers of combinations.
+
+Execute --> python3 benchmarks/param_partitions.py [--rows N] [--combinations N ...] [--repeats N]
+"""
+
+import argparse
+import time
+
+import polars as pl
+
+from aframexr.utils.entities_html_creator import _get_param_partitions
+
+
+def generate_dataset(rows: int, combinations: int) -> pl.DataFrame:
+    index = pl.int_range(0, rows, eager=True)
+    return pl.DataFrame({
+        'category': 'c' + (index * 7919 % combinations).cast(pl.String),
+        'value': index * 104729 % 1000,
+    })
+
+
+def filter_path(data: pl.DataFrame, param_specs: dict) -> list[pl.DataFrame]:
+    views = []
+    for combination in data.select(param_specs['select']['fields']).unique().to_dicts():
+        view = data
+        for key, value in combination.items():
+            view = view.filter(pl.col(key) == value)
+        views.append(view)
+    return views
+
+
+def partition_path(data: pl.DataFrame, param_specs: dict) -> list[pl.DataFrame]:
+    return [view for _, view in _get_param_partitions(data, param_specs)]
+
+
+def best_time(func, data: pl.DataFrame, param_specs: dict, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func(data, param_specs)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--combinations', type=int, nargs='+', default=[10, 50, 200, 1_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    param_specs = {'name': 'param', 'select': {'type': 'point', 'fields': ['category']}}
+    print(f'{"combinations":>12} | {"filter (s)":>10} | {"partition (s)":>13}')
+    for combinations in args.combinations:
+        data = generate_dataset(args.rows, combinations)
+        print(f'{combinations:>12} | {best_time(filter_path, data, param_specs, args.repeats):>10.4f} | '
+              f'{best_time(partition_path, data, param_specs, args.repeats):>13.4f}')
+
+
+if __name__ == '__main__':
+    main()
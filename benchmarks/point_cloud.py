@@ -0,0 +1,44 @@
+"""
+Benchmark of building the scene of a point cloud (mark_point(cloud=True)).
+
+Measures the time of the whole scene (channels processing, layout and packing of the points) for several numbers of
+points, and the size of the HTML.
+
+Execute --> python3 benchmarks/point_cloud.py [--points N ...]
+"""
+
+import argparse
+import time
+
+import polars as pl
+
+import aframexr
+
+
+def generate_dataset(points: int) -> pl.DataFrame:
+    index = pl.int_range(0, points, eager=True)
+    return pl.DataFrame({
+        'x': (index * 7919 % 100_003) / 100,
+        'y': (index * 104729 % 99_991) / 100,
+        'z': (index * 1299709 % 99_989) / 100,
+        'sensor': 's' + (index % 4).cast(pl.String),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000])
+    args = parser.parse_args()
+
+    print(f'{"points":>10} | {"time (s)":>10} | {"HTML (MiB)":>10}')
+    for points in args.points:
+        chart = (aframexr.Chart(generate_dataset(points)).mark_point(cloud=True)
+                 .encode(x='x', y='y', z='z', color='sensor'))
+        t0 = time.perf_counter()
+        html = chart.to_html()
+        elapsed = time.perf_counter() - t0
+        print(f'{points:>10} | {elapsed:>10.4f} | {len(html) / 2 ** 20:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
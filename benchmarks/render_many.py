@@ -0,0 +1,54 @@
+"""
+Benchmark of rendering a batch of scenes with render_many(), sequentially and with several processes.
+
+Measures the time of rendering the same batch of point charts (one per entity) with each number of workers, and
+checks that the scenes are the same as the rendered sequentially.
+
+Execute --> python3 benchmarks/render_many.py [--charts N] [--points N] [--workers N ...]
+"""
+
+import argparse
+import os
+import time
+
+import polars as pl
+
+import aframexr
+
+
+def generate_charts(charts: int, points: int) -> list:
+    index = pl.int_range(0, points, eager=True)
+    return [
+        aframexr.Chart(pl.DataFrame({
+            'x': (index * 7919 + entity) % 1009 / 10,
+            'y': (index * 104729 + entity) % 1013 / 10,
+            'z': (index * 1299709 + entity) % 1019 / 10,
+        })).mark_point().encode(x='x', y='y', z='z')
+        for entity in range(charts)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--charts', type=int, default=200)
+    parser.add_argument('--points', type=int, default=2_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    charts = generate_charts(args.charts, args.points)
+    t0 = time.perf_counter()
+    expected = aframexr.render_many(charts, workers=1)
+    sequential = time.perf_counter() - t0
+
+    print(f'{"workers":>8} | {"time (s)":>10} | {"speedup":>8} | {"same output":>11}')
+    print(f'{1:>8} | {sequential:>10.4f} | {1:>8.2f} | {"yes":>11}')
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        scenes = aframexr.render_many(charts, workers=workers)
+        elapsed = time.perf_counter() - t0
+        same = 'yes' if scenes == expected else 'NO'
+        print(f'{workers:>8} | {elapsed:>10.4f} | {sequential / elapsed:>8.2f} | {same:>11}')
+
+
+if __name__ == '__main__':
+    main()
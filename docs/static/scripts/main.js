@@ -118,6 +118,194 @@ AFRAME.registerComponent('show-on-enter-ar', {
   }
 });
 
+// Decode a base64 string into a typed array (little-endian, as packed by the charts)
+function decodeTypedArray(base64, TypedArray) {
+    const binary = atob(base64 || '');
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return new TypedArray(bytes.buffer);
+}
+
+AFRAME.registerComponent('instanced-mesh', {
+    schema: {
+        geometry: { type: 'string', default: 'box' },  // Options: 'box' or 'sphere'
+        count: { type: 'int', default: 0 }
+    },
+
+    init: function () {
+        const el = this.el;
+
+        const positions = decodeTypedArray(el.getAttribute('instances-position'), Float32Array);
+        const scales = decodeTypedArray(el.getAttribute('instances-scale'), Float32Array);
+        const colorIndices = decodeTypedArray(el.getAttribute('instances-color-index'), Uint16Array);
+        const palette = JSON.parse(el.getAttribute('instances-color') || '[]').map(color => new THREE.Color(color));
+        this.info = JSON.parse(el.getAttribute('info') || '[]');
+        this.activatesParam = JSON.parse(el.getAttribute('activates-param') || '[]');
+
+        const geometry = this.data.geometry === 'sphere'
+            ? new THREE.SphereGeometry(1, 36, 18)  // Same segments as a-sphere
+            : new THREE.BoxGeometry(1, 1, 1);
+        const material = new THREE.MeshStandardMaterial({ side: THREE.DoubleSide });
+        const mesh = new THREE.InstancedMesh(geometry, material, this.data.count);
+
+        // One matrix and one color per instance (the whole mesh is one draw call)
+        const matrix = new THREE.Matrix4();
+        const position = new THREE.Vector3();
+        const scale = new THREE.Vector3();
+        const quaternion = new THREE.Quaternion();
+        for (let i = 0; i < this.data.count; i++) {
+            position.fromArray(positions, 3 * i);
+            scale.fromArray(scales, 3 * i);
+            mesh.setMatrixAt(i, matrix.compose(position, quaternion, scale));
+            mesh.setColorAt(i, palette[colorIndices[i]]);
+        }
+        mesh.instanceMatrix.needsUpdate = true;
+        if (mesh.instanceColor) mesh.instanceColor.needsUpdate = true;
+        mesh.computeBoundingSphere();  // Bounding sphere of all the instances (for raycasting)
+        el.setObject3D('mesh', mesh);
+
+        // Raycasters intersecting the mesh (the hovered instance is checked on each tick)
+        this.raycasters = [];
+        this.instanceId = null;
+        el.addEventListener('raycaster-intersected', event => {
+            this.raycasters.push(event.detail.el);
+        });
+        el.addEventListener('raycaster-intersected-cleared', event => {
+            this.raycasters = this.raycasters.filter(raycaster => raycaster !== event.detail.el);
+            if (!this.raycasters.length) this.setInstance(null);
+        });
+    },
+
+    tick: function () {
+        if (!this.raycasters.length) return;
+
+        let instanceId = null;
+        for (const raycaster of this.raycasters) {
+            const intersection = raycaster.components.raycaster.getIntersection(this.el);
+            if (intersection && intersection.instanceId !== undefined) {
+                instanceId = intersection.instanceId;
+                break;
+            }
+        }
+        this.setInstance(instanceId);
+    },
+
+    // Emit 'instanceleave' for the previous hovered instance and 'instanceenter' for the new one
+    setInstance: function (instanceId) {
+        if (instanceId === this.instanceId) return;
+
+        if (this.instanceId !== null) {
+            this.el.emit('instanceleave', { instanceId: this.instanceId });
+        }
+        this.instanceId = instanceId;
+        if (instanceId !== null) {
+            this.el.emit('instanceenter', {
+                instanceId: instanceId,
+                info: this.info[instanceId],
+                activatesParam: this.activatesParam[instanceId],
+                bbox: this.getInstanceBox(instanceId)
+            });
+        }
+    },
+
+    // World bounding box of one instance
+    getInstanceBox: function (instanceId) {
+        const mesh = this.el.getObject3D('mesh');
+        const matrix = new THREE.Matrix4();
+        mesh.getMatrixAt(instanceId, matrix);
+        if (!mesh.geometry.boundingBox) mesh.geometry.computeBoundingBox();
+        return mesh.geometry.boundingBox.clone().applyMatrix4(matrix).applyMatrix4(mesh.matrixWorld);
+    },
+
+    remove: function () {
+        this.el.removeObject3D('mesh');
+    }
+});
+
+AFRAME.registerComponent('point-cloud', {
+    schema: {
+        count: { type: 'int', default: 0 }
+    },
+
+    init: function () {
+        const el = this.el;
+
+        const positions = decodeTypedArray(el.getAttribute('points-position'), Float32Array);
+        const sizes = decodeTypedArray(el.getAttribute('points-size'), Float32Array);
+        const colorIndices = decodeTypedArray(el.getAttribute('points-color-index'), Uint16Array);
+        const palette = JSON.parse(el.getAttribute('points-color') || '[]').map(color => new THREE.Color(color));
+
+        // Color of each point
+        const colors = new Float32Array(3 * this.data.count);
+        for (let i = 0; i < this.data.count; i++) {
+            palette[colorIndices[i]].toArray(colors, 3 * i);
+        }
+
+        const geometry = new THREE.BufferGeometry();
+        geometry.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+        geometry.setAttribute('size', new THREE.BufferAttribute(sizes, 1));
+        geometry.setAttribute('color', new THREE.BufferAttribute(colors, 3));
+        geometry.setDrawRange(0, this.data.count);
+
+        // Round points whose size (diameter) is in world units
+        this.material = new THREE.ShaderMaterial({
+            uniforms: { viewportHeight: { value: 1 } },
+            vertexShader: `
+                attribute float size;
+                attribute vec3 color;
+                uniform float viewportHeight;
+                varying vec3 vColor;
+                void main() {
+                    vColor = color;
+                    vec4 mvPosition = modelViewMatrix * vec4(position, 1.0);
+                    gl_PointSize = size * projectionMatrix[1][1] * viewportHeight * 0.5 / -mvPosition.z;
+                    gl_Position = projectionMatrix * mvPosition;
+                }`,
+            fragmentShader: `
+                varying vec3 vColor;
+                void main() {
+                    if (length(gl_PointCoord - vec2(0.5)) > 0.5) discard;
+                    gl_FragColor = vec4(vColor, 1.0);
+                }`
+        });
+        el.setObject3D('point-cloud', new THREE.Points(geometry, this.material));
+        this.viewportSize = new THREE.Vector2();
+    },
+
+    tick: function () {
+        this.el.sceneEl.renderer.getDrawingBufferSize(this.viewportSize);
+        this.material.uniforms.viewportHeight.value = this.viewportSize.y;
+    },
+
+    remove: function () {
+        this.el.removeObject3D('point-cloud');
+    }
+});
+
+AFRAME.registerComponent('line-strip', {
+    schema: {
+        color: { type: 'color', default: '#74BEC1' },  // Same default color as line component
+        count: { type: 'int', default: 0 }
+    },
+
+    init: function () {
+        // All the vertices of the series are drawn by one line (one draw call)
+        const vertices = decodeTypedArray(this.el.getAttribute('vertices'), Float32Array);
+        const geometry = new THREE.BufferGeometry();
+        geometry.setAttribute('position', new THREE.BufferAttribute(vertices, 3));
+        geometry.setDrawRange(0, this.data.count);
+
+        const material = new THREE.LineBasicMaterial({ color: this.data.color });
+        this.el.setObject3D('line-strip', new THREE.Line(geometry, material));
+    },
+
+    remove: function () {
+        this.el.removeObject3D('line-strip');
+    }
+});
+
 // Wait for the DOM to be fully loaded
 document.addEventListener('DOMContentLoaded', () => {
 	// Frequently accessed elements
@@ -126,6 +314,7 @@ document.addEventListener('DOMContentLoaded', () => {
 	const HUDPlane = document.querySelector('#HUD-plane')
 	const HUDTextsEntity = document.querySelector('#HUD-texts');
 	const interactiveAframeElements = 'a-box, a-cylinder, a-sphere';
+	const raycastableAframeElements = `${interactiveAframeElements}, [instanced-mesh]`;
 	const scene = document.querySelector("a-scene");
 	const sceneChartsContainer = document.querySelector('#charts');
 
@@ -138,7 +327,13 @@ document.addEventListener('DOMContentLoaded', () => {
 		const targetElement = event.target;
         targetElement.setAttribute('scale', '1.1 1.1 1');
 
-        const HUDInfo = targetElement.getAttribute('info');
+        // Object's bounding box
+        const bbox = new THREE.Box3().setFromObject(targetElement.object3D);
+        showHUD(targetElement.getAttribute('info'), bbox);
+    }
+
+	// Display the HUD with the information over the bounding box
+	function showHUD(HUDInfo, bbox) {
         if (!HUDInfo) return;
         const HUDTexts = HUDInfo.split(';');
 
@@ -146,8 +341,6 @@ document.addEventListener('DOMContentLoaded', () => {
         const cameraPos = new THREE.Vector3();
         camera.object3D.getWorldPosition(cameraPos);
 
-        // Object's bounding box
-        const bbox = new THREE.Box3().setFromObject(targetElement.object3D);
         const objectCenter = new THREE.Vector3();
         bbox.getCenter(objectCenter);
 
@@ -200,9 +393,22 @@ document.addEventListener('DOMContentLoaded', () => {
 	    HUD.setAttribute('visible', 'false');  // Hide the HUD
 	}
 
+	// Elements of the charts whose param views are rendered as tags of the elements (index of selection key --> elements)
+	const paramElements = {};
+	document.querySelectorAll('[param-key]').forEach(element => {
+	    const paramKey = element.getAttribute('param-key');
+	    if (!paramElements[paramKey]) {
+	        paramElements[paramKey] = [];
+	    }
+	    paramElements[paramKey].push(element);
+	});
+
 	// Subcharts
 	function displaySubchart(event) {
-	    const paramName = event.target.getAttribute('activates-param');
+	    activateParam(event.target.getAttribute('activates-param'));
+	}
+
+	function activateParam(paramName) {
 	    if (!paramName) return;
 	    const groupName = paramName.split('__')[0];  // Format is {groupName}__{values}
 
@@ -214,9 +420,13 @@ document.addEventListener('DOMContentLoaded', () => {
 	    activeSubcharts[groupName].forEach(chart => {
             chart.setAttribute('visible', 'false');
 
-            // Remove 'raycastable' from all children of the subchart
-            const children = chart.querySelectorAll(interactiveAframeElements);
-            children.forEach(child => child.removeAttribute('raycastable'));
+            // Remove 'raycastable' from the element, or all children of the subchart
+            if (chart.hasAttribute('param-key')) {
+                chart.removeAttribute('raycastable');
+            } else {
+                const children = chart.querySelectorAll(raycastableAframeElements);
+                children.forEach(child => child.removeAttribute('raycastable'));
+            }
         });
 
         activeSubcharts[groupName] = [];  // Clear the current group's subcharts
@@ -226,11 +436,21 @@ document.addEventListener('DOMContentLoaded', () => {
             chart.setAttribute('visible', 'true');
 
             // Add 'raycastable' to all children of the subchart
-            const children = chart.querySelectorAll(interactiveAframeElements);
+            const children = chart.querySelectorAll(raycastableAframeElements);
             children.forEach(child => child.setAttribute('raycastable', ''));
 
             activeSubcharts[groupName].push(chart);
         });
+
+        const targetElements = paramElements[paramName] || [];
+        targetElements.forEach(element => {
+            element.setAttribute('visible', 'true');
+            if (element.matches(interactiveAframeElements)) {
+                element.setAttribute('raycastable', '');
+            }
+
+            activeSubcharts[groupName].push(element);
+        });
 	}
 
     const interactiveElements = document.querySelectorAll(interactiveAframeElements);
@@ -240,6 +460,17 @@ document.addEventListener('DOMContentLoaded', () => {
         element.addEventListener('click', displaySubchart);
     });
 
+    // Instanced meshes (one entity for all the elements of the chart, events are emitted for each instance)
+    document.querySelectorAll('[instanced-mesh]').forEach(element => {
+        element.addEventListener('instanceenter', event => showHUD(event.detail.info, event.detail.bbox));
+        element.addEventListener('instanceleave', () => HUD.setAttribute('visible', 'false'));
+        element.addEventListener('click', () => {
+            const instancedMesh = element.components['instanced-mesh'];
+            if (instancedMesh.instanceId === null) return;
+            activateParam(instancedMesh.activatesParam[instancedMesh.instanceId]);
+        });
+    });
+
     scene.addEventListener("exit-vr", () => {
         sceneChartsContainer.object3D.position.set(0,0,0);
         sceneChartsContainer.object3D.rotation.set(0,0,0);
@@ -1,6 +1,8 @@
 """Constants for testing."""
 
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 
 from aframexr.api.parameter import selection_point
 from aframexr.api.data import Data, UrlData
@@ -16,8 +18,11 @@ AFRAMEXR_DATA = Data(DATA.to_dict(orient='records'))  # To test Data.__init__()
 AFRAMEXR_DATA_2 = Data.from_json(AFRAMEXR_DATA.to_json())  # To test Data.from_json() and Data.to_json() methods
 ALL_NEGATIVE_DATA =  DATA.assign(sales=DATA['sales'] * -1)  # DATA with negative sales
 POSITIVE_NEGATIVE_DATA = DATA.assign(sales=DATA['sales'] * ([1, -1] * len(DATA))[:len(DATA)])  # Alternate signs
+POLARS_DATA = pl.from_pandas(DATA)  # Data as polars.DataFrame
+LAZY_DATA = POLARS_DATA.lazy()  # Data as polars.LazyFrame
+ARROW_DATA = pa.Table.from_pandas(DATA)  # Data as pyarrow.Table
 DATA_FORMATS = (ALL_NEGATIVE_DATA, DATA, AFRAMEXR_DATA, AFRAMEXR_DATA_2, POSITIVE_NEGATIVE_DATA, LOCAL_PATH_CSV_DATA,
-                LOCAL_PATH_JSON_DATA, URL_DATA)
+                LOCAL_PATH_JSON_DATA, URL_DATA, POLARS_DATA, LAZY_DATA, ARROW_DATA)
 
 # Data ERROR
 NON_EXISTING_URL_DATA = UrlData('https://bad_url.bad_url')
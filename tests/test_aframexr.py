@@ -1,11 +1,986 @@
 import aframexr
+import polars as pl
 import unittest
 
+from aframexr.utils.constants import OTHER_ELEMENTS_LABEL
 from aframexr.utils.validators import ERROR_MESSAGES
+from tests.constants import *  # Constants used for testing
+
+
+def _render_scene_or_crash(specs: dict):
+    """Renders the scene of the batch, killing the worker if the title of the chart is "crash"."""
+    import os
+    from aframexr.api.batch import _render_scene
+
+    if specs.get('title') == 'crash':
+        os._exit(1)
+    return _render_scene(specs)
+
+
+class TestAframexrOK(unittest.TestCase):
+    """General OK tests."""
+    def test_chart_creator_columnar_data(self):
+        """Verify that passing the DataFrame to ChartCreator creates the same elements as passing the values."""
+        chart_specs = {'mark': 'bar', 'encoding': {'x': {'field': 'model'}, 'y': {'field': 'sales'}}}
+        raw_data = pl.from_dicts(AFRAMEXR_DATA.values)
+
+        values_specs = {**chart_specs, 'data': {'values': raw_data.to_dicts()}}
+
+        from_values = aframexr.ChartCreator.create_object('bar', values_specs)
+        from_frame = aframexr.ChartCreator.create_object('bar', chart_specs, raw_data)
+        self.assertEqual(
+            [b.get_elements_html() for b in from_values.get_elements(filtered_by_params=False)],
+            [b.get_elements_html() for b in from_frame.get_elements(filtered_by_params=False)]
+        )
+
+    def test_elements_batch_html(self):
+        """Verify that the batch of elements creates the same HTML as one ElementCreator per element."""
+        from aframexr.utils.element_creator import CREATOR_MAP as ELEMENT_CREATORS
+
+        specs = pl.DataFrame({'info': ['a: 1', None], 'position': ['0 1.5 0', '1 2.25 0'], 'radius': [0.5, None],
+                              'color': ['red', 'blue'], 'theta_start': [0, 180]})
+        for element_type in ('sphere', 'line'):
+            for is_movable, filtered_by_params in ((False, False), (True, False), (False, True)):
+                batch = aframexr.ElementsBatchCreator(element_type, specs, filtered_by_params=filtered_by_params)
+                self.assertEqual(
+                    batch.get_elements_html(is_movable=is_movable),
+                    [ELEMENT_CREATORS[element_type](element_specs, filtered_by_params=filtered_by_params)
+                     .get_element_html(is_movable=is_movable) for element_specs in specs.to_dicts()]
+                )
+
+    def test_instanced_mesh(self):
+        """Verify that instanced bars and points create one entity with the packed attributes of each element."""
+        import base64
+        import json
+        from array import array
+        from bs4 import BeautifulSoup
+
+        def decode(attribute: str, typecode: str) -> list:
+            return array(typecode, base64.b64decode(attribute)).tolist()
+
+        param = aframexr.selection_point('param_name', fields=['model'])
+        for mark, element_tag in (('mark_bar', 'a-box'), ('mark_point', 'a-sphere')):
+            chart = getattr(aframexr.Chart(POLARS_DATA), mark)().encode(x='model', y='sales', color='motor')
+            elements = BeautifulSoup(chart.add_params(param).to_html(), 'lxml').find_all(element_tag)
+            instanced_chart = getattr(aframexr.Chart(POLARS_DATA), mark)(instanced=True).encode(
+                x='model', y='sales', color='motor'
+            )
+            soup = BeautifulSoup(instanced_chart.add_params(param).to_html(), 'lxml')
+
+            self.assertEqual(soup.find_all(element_tag), [])  # Elements of the chart are instances
+            [mesh] = soup.find_all('a-entity', attrs={'instanced-mesh': True})
+            self.assertIn(f'count: {len(elements)}', mesh['instanced-mesh'])
+            self.assertIn('raycastable', mesh.attrs)
+            self.assertEqual(json.loads(mesh['info']), [element['info'] for element in elements])
+            self.assertEqual(json.loads(mesh['activates-param']), [element['activates-param'] for element in elements])
+
+            positions = decode(mesh['instances-position'], 'f')
+            expected_positions = [float(value) for element in elements for value in element['position'].split()]
+            self.assertEqual(len(positions), len(expected_positions))
+            for position, expected_position in zip(positions, expected_positions):
+                self.assertAlmostEqual(position, expected_position, places=5)
+
+            palette = json.loads(mesh['instances-color'])
+            colors = [palette[index] for index in decode(mesh['instances-color-index'], 'H')]
+            self.assertEqual(colors, [element['color'] for element in elements])
+
+        with self.assertRaises(TypeError):
+            aframexr.Chart(POLARS_DATA).mark_bar(instanced='yes')
+
+    def test_point_cloud(self):
+        """Verify that a point cloud creates one entity with the packed positions, sizes and colors of the points."""
+        import base64
+        import json
+        from array import array
+        from bs4 import BeautifulSoup
+
+        def decode(attribute: str, typecode: str) -> list:
+            return array(typecode, base64.b64decode(attribute)).tolist()
+
+        chart = aframexr.Chart(POLARS_DATA).mark_point().encode(x='model', y='sales', color='motor', size='sales')
+        spheres = BeautifulSoup(chart.to_html(), 'lxml').find_all('a-sphere')
+        cloud_chart = (aframexr.Chart(POLARS_DATA).mark_point(cloud=True, instanced=True)
+                       .encode(x='model', y='sales', color='motor', size='sales'))
+        soup = BeautifulSoup(cloud_chart.to_html(), 'lxml')
+
+        self.assertEqual(soup.find_all('a-sphere'), [])
+        self.assertEqual(soup.find_all('a-entity', attrs={'instanced-mesh': True}), [])  # Cloud takes precedence
+        [cloud] = soup.find_all('a-entity', attrs={'point-cloud': True})
+        self.assertEqual(cloud['point-cloud'], f'count: {len(spheres)}')
+        self.assertNotIn('raycastable', cloud.attrs)
+
+        expected = {
+            'points-position': [float(value) for sphere in spheres for value in sphere['position'].split()],
+            'points-size': [2 * float(sphere['radius']) for sphere in spheres],
+        }
+        for attribute, expected_values in expected.items():
+            values = decode(cloud[attribute], 'f')
+            self.assertEqual(len(values), len(expected_values))
+            for value, expected_value in zip(values, expected_values):
+                self.assertAlmostEqual(value, expected_value, places=5)
+
+        palette = json.loads(cloud['points-color'])
+        colors = [palette[index] for index in decode(cloud['points-color-index'], 'H')]
+        self.assertEqual(colors, [sphere['color'] for sphere in spheres])
+
+    def test_polyline(self):
+        """Verify that a polyline creates one entity per series with its vertices, and the markers as instances."""
+        import base64
+        from array import array
+        from bs4 import BeautifulSoup
+
+        chart = aframexr.Chart(POLARS_DATA).mark_line(point=True).encode(x='model', y='sales', color='motor')
+        chart_soup = BeautifulSoup(chart.to_html(), 'lxml')
+        markers = chart_soup.find_all('a-sphere')
+        polyline_chart = (aframexr.Chart(POLARS_DATA).mark_line(point=True, polyline=True)
+                          .encode(x='model', y='sales', color='motor'))
+        soup = BeautifulSoup(polyline_chart.to_html(), 'lxml')
+
+        series_colors = [marker['color'] for marker in markers]
+        expected_colors = [c for c in dict.fromkeys(series_colors) if series_colors.count(c) > 1]
+        segments = len(markers) - len(set(series_colors))
+        axes_lines = soup.find_all('a-entity', attrs={'line': True})  # Only the lines of the axes remain
+        self.assertEqual(len(axes_lines), len(chart_soup.find_all('a-entity', attrs={'line': True})) - segments)
+        self.assertEqual(soup.find_all('a-sphere'), [])
+        line_strips = soup.find_all('a-entity', attrs={'line-strip': True})
+        self.assertEqual([line_strip['line-strip'].split(';')[0] for line_strip in line_strips],
+                         [f'color: {color}' for color in expected_colors])
+
+        for line_strip, color in zip(line_strips, expected_colors):
+            vertices = array('f', base64.b64decode(line_strip['vertices'])).tolist()
+            expected_vertices = [float(value) for marker in markers if marker['color'] == color
+                                 for value in marker['position'].split()]
+            self.assertIn(f'count: {len(expected_vertices) // 3}', line_strip['line-strip'])
+            self.assertEqual(len(vertices), len(expected_vertices))
+            for vertex, expected_vertex in zip(vertices, expected_vertices):
+                self.assertAlmostEqual(vertex, expected_vertex, places=5)
+
+        [mesh] = soup.find_all('a-entity', attrs={'instanced-mesh': True})
+        self.assertIn(f'count: {len(markers)}', mesh['instanced-mesh'])
+
+    def test_line_downsampling(self):
+        """Verify that mark_line(max_points=...) keeps at most max_points vertices per series, with the extremes."""
+        import math
+        from bs4 import BeautifulSoup
+
+        length = 1000
+        data = pl.DataFrame({
+            'x': list(range(length)) * 2,
+            'y': [math.sin(i / 40) + (10 if i == 321 else 0) for i in range(length)] + [0.0] * length,
+            'series': ['peak'] * length + ['flat'] * length,
+        })
+        chart = aframexr.Chart(data).mark_line(point=True, max_points=50).encode(x='x', y='y', color='series')
+        markers = BeautifulSoup(chart.to_html(), 'lxml').find_all('a-sphere')
+        self.assertEqual(len(markers), 2 * 50)
+
+        peak_color = markers[0]['color']
+        peak_heights = [float(marker['position'].split()[1]) for marker in markers if marker['color'] == peak_color]
+        self.assertEqual(len(peak_heights), 50)
+        self.assertEqual(max(peak_heights), max(float(m['position'].split()[1]) for m in markers))  # Peak is kept
+
+        with self.assertRaises(ValueError) as error:
+            aframexr.Chart(data).mark_line(max_points=2)
+        self.assertEqual(str(error.exception), ERROR_MESSAGES['MAX_POINTS'].format(max_points=2))
+
+    def test_elements_budget(self):
+        """Verify that to_html(max_elements=...) reduces the charts exceeding their budget, warning about it."""
+        from bs4 import BeautifulSoup
+
+        length = 3000
+        data = pl.DataFrame({
+            'x': [i % 97 for i in range(length)],
+            'y': [(i * 31) % 89 for i in range(length)],
+            'z': [(i * 7) % 83 for i in range(length)],
+            'series': [f's{i % 3}' for i in range(length)],
+        })
+        charts = {
+            'a-sphere': aframexr.Chart(data).mark_point().encode(x='x', y='y', z='z', color='series'),
+            'a-box': aframexr.Chart(data.head(40)).mark_bar().encode(x='series', y='y', z='x'),
+            'a-cylinder': aframexr.Chart(POLARS_DATA).mark_arc().encode(color='model', theta='sales'),
+        }
+        for tag, chart in charts.items():
+            with self.assertWarnsRegex(UserWarning, r'exceeding the budget of 5 elements'):
+                soup = BeautifulSoup(chart.to_html(max_elements=5), 'lxml')
+            self.assertLessEqual(len(soup.find_all(tag)), 5)
+
+        with self.assertWarnsRegex(UserWarning, f'adding the rest as "{OTHER_ELEMENTS_LABEL}"'):
+            arcs = BeautifulSoup(charts['a-cylinder'].to_html(max_elements=3), 'lxml').find_all('a-cylinder')
+        self.assertEqual(len(arcs), 3)
+        self.assertIn(f'model: {OTHER_ELEMENTS_LABEL}', arcs[-1]['info'])
+        self.assertAlmostEqual(sum(float(arc['theta-length']) for arc in arcs), 360, places=3)  # Same total
+
+        categorical_data = POLARS_DATA.with_columns(pl.col('model').cast(pl.Categorical))
+        for chart in (aframexr.Chart(categorical_data).mark_arc().encode(color='model', theta='sales'),
+                      aframexr.Chart(categorical_data).mark_bar().encode(x='model', y='sales')):
+            param = aframexr.selection_point('param_name', fields=['motor'])  # Field not encoded
+            with self.assertWarnsRegex(UserWarning, f'adding the rest as "{OTHER_ELEMENTS_LABEL}"'):
+                html = chart.add_params(param).to_html(max_elements=3)
+            self.assertIn(f'model: {OTHER_ELEMENTS_LABEL}; sales: ', html)
+
+        line_chart = aframexr.Chart(data).mark_line(point=True).encode(x='x', y='y', color='series')
+        with self.assertWarnsRegex(UserWarning, r'downsampled each series to 5 vertices'):
+            spheres = BeautifulSoup((line_chart + charts['a-sphere']).to_html(max_elements=60), 'lxml')
+        self.assertLessEqual(len(spheres.find_all('a-sphere')), 60)  # Budget of 30 per chart
+
+        axes_lines = len(BeautifulSoup(line_chart.to_html(), 'lxml').find_all('a-entity', attrs={'line': True})) \
+            - (length - 3)  # Lines of the axes (the rest are the segments of the 3 series)
+        many_series_data = data.with_columns(series=pl.format('s{}', pl.col('x') % 50))
+        for point in (False, True):
+            for max_elements in (1, 4, 20, 200):
+                line_chart = aframexr.Chart(many_series_data).mark_line(point=point) \
+                    .encode(x='x', y='y', color='series')
+                with self.assertWarnsRegex(UserWarning, r'exceeding the budget'):
+                    soup = BeautifulSoup(line_chart.to_html(max_elements=max_elements), 'lxml')
+                segments = len(soup.find_all('a-entity', attrs={'line': True})) - axes_lines
+                self.assertLessEqual(segments + len(soup.find_all('a-sphere')), max_elements)
+
+        with self.assertRaises(ValueError) as error:
+            line_chart.to_html(max_elements=0)
+        self.assertEqual(str(error.exception), ERROR_MESSAGES['POSITIVE_NUMBER'].format(param_name='max_elements'))
+
+    def test_render_many(self):
+        """Verify that render_many() and save_many() render each chart as its scene, reporting the failures."""
+        import os
+        import tempfile
+
+        charts = [
+            aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='sales'),
+            aframexr.Chart(aframexr.Data(DATA.to_dict('records'))).mark_point().encode(x='model', y='sales'),
+            aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='bad_field'),
+        ]
+        expected = [chart.to_html() for chart in charts[:2]]
+
+        for workers in (1, 2):
+            scenes = aframexr.render_many(charts, workers=workers)
+            self.assertEqual(scenes[:2], expected)
+            self.assertIsInstance(scenes[2], KeyError)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f'chart_{i}.html') for i in range(len(charts))]
+            failures = aframexr.save_many(charts, paths, workers=1)
+            self.assertEqual(list(failures), [paths[2]])
+            self.assertFalse(os.path.exists(paths[2]))  # No partial file
+            for path, scene in zip(paths, expected):
+                with open(path) as file:
+                    self.assertEqual(file.read(), scene)
+
+        with self.assertRaises(ValueError):
+            aframexr.save_many(charts, paths[:1])
+        with self.assertRaises(ValueError) as error:  # Results of the charts would overwrite each other
+            aframexr.save_many(charts, ['chart.html', 'other.html', './chart.html'])
+        self.assertEqual(str(error.exception),
+                         "Expected one file per chart, got repeated paths: ['./chart.html', 'chart.html'].")
+
+    def test_render_many_crashed_worker(self):
+        """Verify that a chart killing its worker gets BrokenProcessPool, while the rest of the batch is rendered."""
+        from concurrent.futures.process import BrokenProcessPool
+        from aframexr.api.batch import _run_batch
+
+        chart = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='sales')
+        charts = [chart.properties(title=f'chart {i}') for i in range(12)]
+        charts[5] = chart.properties(title='crash')
+        charts[9] = chart.properties(title='crash')
+
+        results = _run_batch(_render_scene_or_crash, charts, [()] * len(charts), 2, {})
+        for index, result in enumerate(results):
+            if index in (5, 9):
+                self.assertIsInstance(result, BrokenProcessPool)
+            else:
+                self.assertEqual(result, charts[index].to_html())
+
+    def test_compiled_chart(self):
+        """Verify that a compiled scene renders and saves each dataset as the scene defined with that data."""
+        import json
+        import os
+        import pickle
+        import tempfile
+
+        chart = aframexr.Chart().mark_bar().encode(x='model', y='sum(sales)').transform_filter('datum.doors > 3')
+        compiled_chart = chart.compile()
+        self.assertIsNotNone(compiled_chart._specs['plan'])  # Filters are parsed when compiling
+        for data in (POLARS_DATA, POLARS_DATA.head(3), aframexr.Data(DATA.to_dict('records'))):
+            expected = chart.properties(data=data).to_html()
+            self.assertEqual(compiled_chart.render(data), expected)
+            self.assertEqual(pickle.loads(pickle.dumps(compiled_chart)).render(data), expected)
+
+        scene = chart + aframexr.Box() + chart.mark_point().encode(x='model', y='sales', z='doors')
+        compiled_scene = scene.compile(environment='forest', max_elements=50)
+        expected_scene = scene._with_specs({'concat': [
+            scene._specifications['concat'][0] | {'data_ref': POLARS_DATA},
+            scene._specifications['concat'][1],
+            scene._specifications['concat'][2] | {'data_ref': POLARS_DATA.head(2)},
+        ]})
+        self.assertEqual(compiled_scene.render([POLARS_DATA, POLARS_DATA.head(2)]),
+                         expected_scene.to_html(environment='forest', max_elements=50))
+
+        with tempfile.TemporaryDirectory() as directory:
+            compiled_chart.save(POLARS_DATA, os.path.join(directory, 'chart.html'))
+            with open(os.path.join(directory, 'chart.html')) as file:
+                self.assertEqual(file.read(), compiled_chart.render(POLARS_DATA))
+            compiled_chart.save(POLARS_DATA, os.path.join(directory, 'chart.json'))
+            with open(os.path.join(directory, 'chart.json')) as file:
+                self.assertEqual(json.load(file), {**chart.properties(data=POLARS_DATA).to_dict(),
+                                                   'environment': 'default'})
+
+    def test_concurrent_concatenation(self):
+        """Verify that to_html(workers=...) creates the same scene and warnings as creating the charts in order."""
+        import warnings
+
+        scene = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='sales')
+        for index, mark in enumerate(['mark_point', 'mark_line', 'mark_bar', 'mark_point']):
+            chart = getattr(aframexr.Chart(POLARS_DATA, position=f'{index * 5} 0 0'), mark)()
+            scene += chart.encode(x='model', y='sales').transform_filter(f'datum.sales < {index}')  # Empty (warns)
+
+        with warnings.catch_warnings(record=True) as expected_warnings:
+            warnings.simplefilter('always')
+            expected = scene.to_html()
+        for workers in (1, 2, 8):
+            with warnings.catch_warnings(record=True) as scene_warnings:
+                warnings.simplefilter('always')
+                self.assertEqual(scene.to_html(workers=workers), expected)
+            self.assertEqual([str(w.message) for w in scene_warnings], [str(w.message) for w in expected_warnings])
+
+        with self.assertRaises(ValueError) as error:
+            scene.to_html(workers=0)
+        self.assertEqual(str(error.exception), ERROR_MESSAGES['POSITIVE_NUMBER'].format(param_name='workers'))
+
+    def test_thread_safety(self):
+        """Verify that rendering the same and different charts from several threads gives the sequential output."""
+        import warnings
+        from concurrent.futures import ThreadPoolExecutor
+
+        bars = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='sales')
+        points = aframexr.Chart(POLARS_DATA, position='5 0 0').mark_point().encode(x='model', y='sales', color='motor')
+        empty = aframexr.Chart(POLARS_DATA).mark_line().encode(x='model', y='sales').transform_filter('datum.sales < 0')
+        renders = [
+            lambda: bars.to_html(),
+            lambda: points.to_html(max_elements=3),
+            lambda: (bars + points + empty).to_html(workers=2),
+            lambda: (points + bars).to_html(),
+        ]
+        showwarning = warnings.showwarning
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            expected = [render() for render in renders]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda i: renders[i % len(renders)](), range(8 * len(renders))))
+
+        self.assertEqual(results, expected * 8)
+        self.assertIs(warnings.showwarning, showwarning)  # The hook of the warnings is uninstalled
+
+    def test_glb(self):
+        """Verify the headers, chunks and accessors of the GLB of the scene, and that save() writes it."""
+        import json
+        import os
+        import struct
+        import tempfile
+        from array import array
+
+        bars_chart = aframexr.Chart(POLARS_DATA).mark_bar(instanced=True).encode(x='model', y='sales', color='motor')
+        scene = (bars_chart + aframexr.Chart(POLARS_DATA, position='6 0 0').mark_point(cloud=True)
+                 .encode(x='model', y='sales') + aframexr.Chart(POLARS_DATA, rotation='0 90 0')
+                 .mark_line(polyline=True).encode(x='model', y='sales') + aframexr.Chart(POLARS_DATA)
+                 .mark_arc().encode(color='model', theta='sales'))
+        glb = scene.to_glb()
+
+        magic, version, length = struct.unpack_from('<III', glb)
+        self.assertEqual((magic, version, length), (0x46546C67, 2, len(glb)))
+        json_length, json_type = struct.unpack_from('<II', glb, 12)
+        self.assertEqual(json_type, 0x4E4F534A)
+        gltf = json.loads(glb[20:20 + json_length])
+        bin_length, bin_type = struct.unpack_from('<II', glb, 20 + json_length)
+        self.assertEqual(bin_type, 0x004E4942)
+        self.assertEqual(28 + json_length + bin_length, len(glb))
+        self.assertEqual(gltf['buffers'], [{'byteLength': bin_length}])
+        binary = glb[28 + json_length:]
+
+        def read_accessor(index: int) -> list:
+            accessor = gltf['accessors'][index]
+            view = gltf['bufferViews'][accessor['bufferView']]
+            self.assertEqual(view['byteOffset'] % 4, 0)
+            self.assertLessEqual(view['byteOffset'] + view['byteLength'], bin_length)
+            components = {'SCALAR': 1, 'VEC3': 3}[accessor['type']]
+            self.assertEqual(view['byteLength'], 4 * components * accessor['count'])
+            typecode = {5126: 'f', 5125: 'I'}[accessor['componentType']]
+            return array(typecode, binary[view['byteOffset']:view['byteOffset'] + view['byteLength']]).tolist()
+
+        self.assertEqual(len(gltf['scenes'][0]['nodes']), 4)  # One node per chart
+        self.assertEqual(gltf['nodes'][gltf['scenes'][0]['nodes'][1]]['translation'], [6.0, 0.0, 0.0])
+        primitives = [primitive for mesh in gltf['meshes'] for primitive in mesh['primitives']]
+        self.assertEqual({primitive['mode'] for primitive in primitives}, {0, 1, 4})  # Points, lines and triangles
+        self.assertEqual(len({m['name'] for m in gltf['materials']}), len(gltf['materials']))  # One per color
+
+        bars_primitives = gltf['meshes'][0]['primitives']
+        bars = sum(gltf['accessors'][p['attributes']['POSITION']]['count'] for p in bars_primitives if p['mode'] == 4)
+        self.assertEqual(bars, 24 * POLARS_DATA.height)  # One box (24 vertices) per row
+        for primitive in primitives:
+            accessor = gltf['accessors'][primitive['attributes']['POSITION']]
+            positions = read_accessor(primitive['attributes']['POSITION'])
+            self.assertEqual(accessor['min'], [min(positions[i::3]) for i in range(3)])
+            self.assertEqual(accessor['max'], [max(positions[i::3]) for i in range(3)])
+            if 'indices' in primitive:
+                self.assertLess(max(read_accessor(primitive['indices'])), accessor['count'])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'scene.glb')
+            scene.save(path)
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), glb)
+
+    def test_iter_html(self):
+        """Verify that the chunks of iter_html() compose the HTML of to_html(), and save() streams them to the file."""
+        import os
+        import tempfile
+
+        chart = aframexr.Chart(POLARS_DATA).mark_point().encode(x='model', y='sales', color='motor')
+        scene = chart + chart.properties(position='5 0 -5', title='Second chart')
+        chunks = list(scene.iter_html(environment='forest'))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), scene.to_html(environment='forest'))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'scene.html')
+            scene.save(path, environment='forest')
+            with open(path) as file:
+                self.assertEqual(file.read(), ''.join(chunks))
+
+            invalid_chart = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='unknown_field')
+            with self.assertRaises(KeyError):
+                invalid_chart.save(path)
+            self.assertFalse(os.path.exists(path))  # Partial scenes are not kept
+
+    def test_param_views_partitions(self):
+        """Verify that each view of a chart filtered by a param contains the same elements as the filtered chart."""
+        from bs4 import BeautifulSoup
+
+        selector_chart = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='motor', y='sales').add_params(DYNAMIC_FILTER)
+        filtered_chart = (aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='sales')
+                          .transform_filter(DYNAMIC_FILTER))
+        soup = BeautifulSoup((selector_chart + filtered_chart).to_html(), 'lxml')
+
+        motors = POLARS_DATA['motor'].unique(maintain_order=True).to_list()
+        views = soup.find_all('a-entity', attrs={'param-name': True})
+        self.assertEqual([view['param-name'] for view in views], [f'param_name__{motor}' for motor in motors])
+        for view, motor in zip(views, motors):
+            expected_chart = (aframexr.Chart(POLARS_DATA.filter(pl.col('motor') == motor)).mark_bar()
+                              .encode(x='model', y='sales'))
+            expected_boxes = BeautifulSoup(expected_chart.to_html(), 'lxml').find_all('a-box')
+            self.assertEqual([box.attrs for box in view.find_all('a-box')],
+                             [{k: v for k, v in box.attrs.items() if k != 'raycastable'} for box in expected_boxes])
+
+    def test_param_views_elements(self):
+        """Verify that param views rendered as elements create one chart, with the selection key in each element."""
+        from bs4 import BeautifulSoup
+
+        param = aframexr.selection_point('param_name', fields=['motor'], views='elements')
+        self.assertEqual(param.to_specs()['select']['views'], 'elements')
+        selector_chart = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='motor', y='sales').add_params(param)
+        bars_chart = aframexr.Chart(POLARS_DATA).mark_bar().encode(x='model', y='sales').transform_filter(param)
+        line_chart = (aframexr.Chart(POLARS_DATA).mark_line(point=True).encode(x='model', y='sales')
+                      .transform_filter(param))
+        soup = BeautifulSoup((selector_chart + bars_chart + line_chart).to_html(), 'lxml')
+
+        self.assertEqual(soup.find_all('a-entity', attrs={'param-name': True}), [])  # No duplicated charts
+        expected_keys = [f'param_name__{motor}' for motor in POLARS_DATA['motor']]
+        boxes = soup.find_all('a-box', attrs={'param-key': True})
+        self.assertEqual([box['param-key'] for box in boxes], expected_keys)
+        self.assertTrue(all(box['visible'] == 'false' and 'raycastable' not in box.attrs for box in boxes))
+        spheres = soup.find_all('a-sphere', attrs={'param-key': True})
+        self.assertEqual([sphere['param-key'] for sphere in spheres], expected_keys)
+
+        lines = soup.find_all('a-entity', attrs={'line': True, 'param-key': True})  # Lines join points of the same key
+        self.assertEqual(len(lines), POLARS_DATA.height - POLARS_DATA['motor'].n_unique())
+
+        with self.assertRaises(ValueError) as error:
+            aframexr.selection_point('param_name', fields=['motor'], views='invalid')
+        self.assertEqual(str(error.exception), ERROR_MESSAGES['PARAM_VIEWS'].format(views='invalid'))
+
+    def test_main_script(self):
+        """Verify that the scenes using the components not published yet load the script shipped with the package."""
+        import os
+        from aframexr.utils.scene_creator import PUBLISHED_MAIN_SCRIPT, _get_packaged_main_script
+
+        docs_script_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'static', 'scripts', 'main.js')
+        with open(docs_script_path) as file:  # The shipped script is the one of the documentation
+            self.assertEqual(_get_packaged_main_script(), f'<script>\n{file.read()}\n</script>')
+
+        chart = aframexr.Chart(POLARS_DATA).encode(x='model', y='sales')
+        param = aframexr.selection_point('param_name', fields=['motor'], views='elements')
+        packaged_script_charts = [
+            chart.mark_bar(instanced=True), chart.mark_point(instanced=True), chart.mark_point(cloud=True),
+            chart.mark_line(polyline=True), chart.mark_bar() + chart.mark_point().add_params(param),
+        ]
+        for packaged_script_chart in packaged_script_charts:
+            html = packaged_script_chart.to_html()
+            self.assertIn(_get_packaged_main_script(), html)
+            self.assertNotIn(PUBLISHED_MAIN_SCRIPT, html)
+
+        for published_script_chart in (chart.mark_bar(), chart.mark_line(point=True), chart.mark_bar().add_params(
+                aframexr.selection_point('param_name', fields=['motor']))):
+            html = published_script_chart.to_html()
+            self.assertIn(PUBLISHED_MAIN_SCRIPT, html)
+            self.assertNotIn('registerComponent', html)
+
+    def test_pandas_data_ingested_once(self):
+        """Verify that the pandas DataFrame is converted only once for the chart and the charts derived from it."""
+        import gc
+        from unittest import mock
+        from aframexr.api import components
+
+        data = DATA.copy()
+        with mock.patch.object(components, '_pandas_to_polars', wraps=components._pandas_to_polars) as conversion:
+            chart = aframexr.Chart(data).mark_bar().encode(x='model', y='sales')
+            first_html = chart.to_html()
+            self.assertIs(chart._specifications['data_ref'], data)  # The specifications are not modified
+            ingested_data = chart._ingest_data(data)
+            self.assertIsInstance(ingested_data, pl.DataFrame)
+
+            self.assertEqual(chart.to_html(), first_html)
+            self.assertIs(chart._ingest_data(data), ingested_data)  # Not converted again
+            self.assertEqual(chart.to_dict()['data']['values'], data.to_dict(orient='records'))
+
+            derived_charts = [chart.encode(x='motor', y='sales'), chart.properties(position='1 2 3'),
+                              chart.transform_filter('datum.doors > 3'), chart + chart.mark_point()]
+            for derived_chart in derived_charts:
+                derived_chart.to_html()
+                self.assertIs(derived_chart._ingest_data(data), ingested_data)
+            self.assertEqual(conversion.call_count, 1)
+
+        key = id(data)
+        self.assertIn(key, components._ingested_data)
+        del chart, derived_charts, derived_chart, conversion, data  # The mock keeps the arguments of its calls
+        gc.collect()
+        self.assertNotIn(key, components._ingested_data)  # Released with the DataFrame
+
+    def test_pandas_data_modified_after_render(self):
+        """Verify that a modified copy of a pandas DataFrame is shown by the chart, without modifying the original."""
+        chart = aframexr.Chart(DATA).mark_bar().encode(x='model', y='sales')
+        original_html = chart.to_html()
+        original_values = chart.to_dict()['data']['values']
+
+        data = DATA.copy()
+        data.loc[0, 'model'] = 'Z'
+        data.loc[1, 'sales'] = 7
+        new_chart = chart.properties(data=data)
+        new_values = new_chart.to_dict()['data']['values']
+        self.assertEqual((new_values[0]['model'], new_values[1]['sales']), ('Z', 7))
+        self.assertEqual(new_values, data.to_dict(orient='records'))
+        self.assertNotEqual(new_chart.to_html(), original_html)
+
+        self.assertEqual(chart.to_dict()['data']['values'], original_values)
+        self.assertEqual(chart.to_html(), original_html)
+
+    def test_lazy_frame_transformations(self):
+        """Verify that a LazyFrame with filters and aggregates creates the same chart as the eager DataFrame."""
+        for d in (POLARS_DATA, LAZY_DATA, ARROW_DATA):
+            chart = (aframexr.Chart(d).mark_bar().encode(x='motor', y='sum(sales)')
+                     .transform_filter('datum.doors > 3'))
+            self.assertEqual(
+                chart.to_html(),
+                aframexr.Chart(DATA).mark_bar().encode(x='motor', y='sum(sales)').transform_filter('datum.doors > 3')
+                .to_html()
+            )
+            self.assertEqual(chart.to_dict()['data']['values'], DATA.to_dict(orient='records'))
+
+    def test_local_file_formats(self):
+        """Verify that local Parquet, Arrow IPC, NDJSON and CSV files create the same chart as the DataFrame."""
+        import os
+        import tempfile
+
+        expected_html = (aframexr.Chart(DATA).mark_bar().encode(x='model', y='sales')
+                         .transform_filter('datum.doors > 3').to_html())
+        writers = {'.parquet': POLARS_DATA.write_parquet, '.arrow': POLARS_DATA.write_ipc,
+                   '.ndjson': POLARS_DATA.write_ndjson, '.csv': POLARS_DATA.write_csv}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for extension, writer in writers.items():
+                path = os.path.join(tmp_dir, f'data{extension}')
+                writer(path)
+                chart = (aframexr.Chart(aframexr.UrlData(path)).mark_bar().encode(x='model', y='sales')
+                         .transform_filter('datum.doors > 3'))
+                self.assertEqual(chart.to_html(), expected_html)
+
+    def test_data_cache(self):
+        """Verify that the data cache is invalidated when a file changes, evicts over its budget and skips scans."""
+        import os
+        import tempfile
+
+        aframexr.data_cache.clear()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, f'data_{i}.json') for i in range(2)]
+            for path in paths:
+                POLARS_DATA.write_json(path)
+
+            chart = aframexr.Chart(aframexr.UrlData(paths[0])).mark_bar().encode(x='model', y='sales')
+            first_html = chart.to_html()
+            self.assertEqual(chart.to_html(), first_html)
+            self.assertEqual(aframexr.data_cache.stats['hits'], 1)
+
+            POLARS_DATA.head(3).write_json(paths[0])  # Modify the file
+            self.assertNotEqual(chart.to_html(), first_html)
+            self.assertEqual(aframexr.data_cache.stats['misses'], 2)
+
+            aframexr.data_cache.max_bytes = POLARS_DATA.estimated_size()  # Budget for only one file
+            try:
+                aframexr.Chart(aframexr.UrlData(paths[1])).mark_bar().encode(x='model', y='sales').to_html()
+                self.assertEqual(aframexr.data_cache.stats['evictions'], 1)
+                self.assertEqual(aframexr.data_cache.stats['entries'], 1)
+            finally:
+                aframexr.data_cache.max_bytes = aframexr.DEFAULT_DATA_CACHE_MAX_BYTES
+
+            csv_path = os.path.join(tmp_dir, 'data.csv')  # Scanned lazily, so not cached
+            POLARS_DATA.write_csv(csv_path)
+            aframexr.data_cache.clear()
+            csv_chart = aframexr.Chart(aframexr.UrlData(csv_path)).mark_bar().encode(x='model', y='sales')
+            self.assertEqual(csv_chart.to_html(), csv_chart.to_html())
+            self.assertEqual(aframexr.data_cache.stats['entries'], 0)
+
+        aframexr.data_cache.clear()
+        self.assertEqual(aframexr.data_cache.stats, {'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0,
+                                                     'size_bytes': 0})
+
+    def test_http_cache(self):
+        """Verify that remote data is stored on disk and revalidated with conditional requests."""
+        import functools
+        import http.server
+        import os
+        import tempfile
+        import threading
+
+        status_codes = []
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def log_message(self, *args):  # Silence the server
+                pass
+
+            def send_response(self, code, message=None):
+                status_codes.append(code)
+                super().send_response(code, message)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            POLARS_DATA.write_json(os.path.join(tmp_dir, 'data.json'))
+            server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                     functools.partial(Handler, directory=tmp_dir))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            default_directory = aframexr.http_cache.directory
+            aframexr.http_cache.directory = os.path.join(tmp_dir, 'cache')
+            try:
+                url = f'http://127.0.0.1:{server.server_address[1]}/data.json'
+                chart = aframexr.Chart(aframexr.UrlData(url)).mark_bar().encode(x='model', y='sales')
+
+                aframexr.data_cache.clear()
+                first_html = chart.to_html()
+                self.assertEqual(status_codes, [200])
+                self.assertEqual(len(os.listdir(aframexr.http_cache.directory)), 2)  # Data and metadata
+
+                self.assertEqual(chart.to_html(), first_html)  # Revalidated, data in memory
+                aframexr.data_cache.clear()
+                self.assertEqual(chart.to_html(), first_html)  # Revalidated, data on disk
+                self.assertEqual(status_codes, [200, 304, 304])
+            finally:
+                server.shutdown()
+                server.server_close()
+                aframexr.http_cache.clear()
+                aframexr.http_cache.directory = default_directory
+                aframexr.data_cache.clear()
+
+    def test_http_cache_requests(self):
+        """Verify the requests of repeated renders, with and without validators, without the on-disk cache."""
+        import asyncio
+        import functools
+        import http.server
+        import os
+        import tempfile
+        import threading
+
+        status_codes = []
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def log_message(self, *args):  # Silence the server
+                pass
+
+            def send_response(self, code, message=None):
+                status_codes.append(code)
+                super().send_response(code, message)
+
+            def send_header(self, keyword, value):
+                if keyword == 'Last-Modified' and self.path.startswith('/no_validators'):
+                    return  # Response without validators
+                super().send_header(keyword, value)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ('data', 'no_validators'):
+                POLARS_DATA.write_json(os.path.join(tmp_dir, f'{name}.json'))
+            server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                     functools.partial(Handler, directory=tmp_dir))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            default_directory = aframexr.http_cache.directory
+            aframexr.http_cache.directory = None  # Disable the on-disk cache
+            try:
+                base_url = f'http://127.0.0.1:{server.server_address[1]}'
+                for name, expected_status_codes in (('no_validators', [200]), ('data', [200, 304, 304, 304])):
+                    status_codes.clear()
+                    aframexr.data_cache.clear()
+                    chart = aframexr.Chart(aframexr.UrlData(f'{base_url}/{name}.json')).mark_bar() \
+                        .encode(x='model', y='sales')
+                    html = chart.to_html()
+                    self.assertEqual(chart.to_html(), html)
+                    self.assertEqual(chart.to_html(), html)
+                    self.assertEqual(asyncio.run(chart.to_html_async()), html)
+                    self.assertEqual(status_codes, expected_status_codes)  # Revalidated with the data in memory
+            finally:
+                server.shutdown()
+                server.server_close()
+                aframexr.http_cache.directory = default_directory
+                aframexr.data_cache.clear()
+
+    def test_http_cache_fetch_async(self):
+        """Verify that fetch() and fetch_async() return the same for the same responses."""
+        import asyncio
+        import http.server
+        import threading
+        from aframexr.utils.entities_html_creator import _read_remote_data
+
+        body = POLARS_DATA.write_json().encode()
+        responses = {  # Status, headers and body of each path
+            '/ok.json': (200, {'ETag': '"ok"'}, body),
+            '/non_authoritative.json': (203, {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}, body),
+            '/chunked.json': (200, {'Transfer-Encoding': 'chunked'},
+                              f'{len(body):x}\r\n'.encode() + body + b'\r\n0\r\n\r\n'),
+            '/no_content.json': (204, {}, b''),
+            '/missing.json': (404, {}, b''),
+            '/moved.json': (302, {'Location': '/ok.json'}, b''),
+        }
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):  # Silence the server
+                pass
+
+            def do_GET(self):
+                status, headers, response_body = responses[self.path]
+                if headers.get('ETag') and self.headers.get('If-None-Match') == headers['ETag']:
+                    status, response_body = 304, b''
+                self.send_response(status)
+                for keyword, value in {'Content-Type': 'application/json', **headers}.items():
+                    self.send_header(keyword, value)
+                if 'Transfer-Encoding' not in headers and status not in (204, 304):
+                    self.send_header('Content-Length', str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+        def fetch(url: str, memory_version: tuple | None = None, asynchronous: bool = False):
+            """Returns the rows of the data and its version, or the type of the error raised."""
+            try:
+                if asynchronous:
+                    data, version = asyncio.run(aframexr.http_cache.fetch_async(url, _read_remote_data,
+                                                                                memory_version))
+                else:
+                    data, version = aframexr.http_cache.fetch(url, _read_remote_data, memory_version)
+            except IOError as error:
+                return type(error)
+            return None if data is None else data.to_dicts(), version
+
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        default_directory = aframexr.http_cache.directory
+        aframexr.http_cache.directory = None  # Disable the on-disk cache
+        try:
+            base_url = f'http://127.0.0.1:{server.server_address[1]}'
+            for path in responses:
+                expected = fetch(base_url + path)
+                self.assertEqual(fetch(base_url + path, asynchronous=True), expected)
+                if isinstance(expected, tuple):  # Revalidated with the data in memory
+                    self.assertEqual(fetch(base_url + path, expected[1], asynchronous=True),
+                                     fetch(base_url + path, expected[1]))
+            self.assertEqual(fetch(f'{base_url}/ok.json', ('"ok"', None), asynchronous=True), (None, ('"ok"', None)))
+            self.assertEqual(fetch(f'{base_url}/missing.json', asynchronous=True), IOError)
+            self.assertEqual(fetch(f'{base_url}/moved.json', asynchronous=True), fetch(f'{base_url}/ok.json'))
+        finally:
+            server.shutdown()
+            server.server_close()
+            aframexr.http_cache.directory = default_directory
+
+    def test_specifications_are_shared(self):
+        """Verify that builder methods share the unchanged specifications and data, without modifying the chart."""
+        data = aframexr.Data(AFRAMEXR_DATA.values)
+        chart = aframexr.Chart(data).mark_bar().encode(x='model', y='sales')
+        filtered_chart = chart.transform_filter('datum.doors > 3').properties(position='1 2 3')
+        self.assertNotIn('transform', chart.to_dict())
+        self.assertIs(filtered_chart._specifications['encoding'], chart._specifications['encoding'])
+        self.assertIs(filtered_chart._specifications['data_ref'], data)
+
+        scene = chart + filtered_chart
+        self.assertIs(scene._specifications['concat'][0], chart._specifications)
+        self.assertIs(scene.copy()._specifications['concat'][1]['data_ref'], data)
+
+        specs = chart.to_dict()
+        specs['encoding']['x']['field'] = 'motor'  # Modifying the exported specifications does not modify the chart
+        self.assertEqual(chart._specifications['encoding']['x']['field'], 'model')
+        imported_chart = aframexr.Chart.from_dict(specs)
+        specs['encoding']['x']['field'] = 'model'  # Modifying the imported specifications does not modify the chart
+        self.assertEqual(imported_chart._specifications['encoding']['x']['field'], 'motor')
+
+    def test_concat_prefetch(self):
+        """Verify that the distinct URLs of a concatenated scene are loaded once each, and concurrently."""
+        import functools
+        import http.server
+        import os
+        import tempfile
+        import threading
+        import time
+
+        requested_paths = []
+        active_requests = [0, 0]  # Current and maximum number of requests being handled at the same time
+        lock = threading.Lock()
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def log_message(self, *args):  # Silence the server
+                pass
+
+            def do_GET(self):
+                with lock:
+                    requested_paths.append(self.path)
+                    active_requests[0] += 1
+                    active_requests[1] = max(active_requests)
+                time.sleep(0.2)  # Slow server
+                super().do_GET()
+                with lock:
+                    active_requests[0] -= 1
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ('a', 'b'):
+                POLARS_DATA.write_json(os.path.join(tmp_dir, f'{name}.json'))
+            server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                     functools.partial(Handler, directory=tmp_dir))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            default_directory = aframexr.http_cache.directory
+            aframexr.http_cache.directory = None  # Disable the on-disk cache
+            try:
+                base_url = f'http://127.0.0.1:{server.server_address[1]}'
+                charts = [aframexr.Chart(aframexr.UrlData(url)).mark_bar().encode(x='model', y='sales')
+                          for url in (f'{base_url}/a.json', f'{base_url}/b.json', f'{base_url}/a.json')]
+                local_charts = [aframexr.Chart(aframexr.UrlData(os.path.join(tmp_dir, name))).mark_bar()
+                                .encode(x='model', y='sales') for name in ('a.json', 'b.json', 'a.json')]
+
+                aframexr.data_cache.clear()
+                html = (charts[0] + charts[1] + charts[2]).to_html()
+                self.assertEqual(html, (local_charts[0] + local_charts[1] + local_charts[2]).to_html())
+                self.assertEqual(sorted(requested_paths), ['/a.json', '/b.json'])  # Identical URLs loaded once
+                self.assertEqual(active_requests[1], 2)  # Loaded concurrently
+            finally:
+                server.shutdown()
+                server.server_close()
+                aframexr.http_cache.directory = default_directory
+                aframexr.data_cache.clear()
+
+    def test_async_rendering(self):
+        """Verify the asynchronous rendering (non-blocking requests, revalidation and cancellation)."""
+        import asyncio
+        import functools
+        import http.server
+        import os
+        import tempfile
+        import threading
+        import time
+
+        status_codes = []
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def log_message(self, *args):  # Silence the server
+                pass
+
+            def do_GET(self):
+                if self.path == '/slow.json':
+                    time.sleep(1)  # Slow server
+                super().do_GET()
+
+            def send_response(self, code, message=None):
+                status_codes.append(code)
+                super().send_response(code, message)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ('data', 'slow'):
+                POLARS_DATA.write_json(os.path.join(tmp_dir, f'{name}.json'))
+            server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                     functools.partial(Handler, directory=tmp_dir))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            default_directory = aframexr.http_cache.directory
+            aframexr.http_cache.directory = os.path.join(tmp_dir, 'cache')
+            try:
+                base_url = f'http://127.0.0.1:{server.server_address[1]}'
+                chart = aframexr.Chart(aframexr.UrlData(f'{base_url}/data.json')).mark_bar() \
+                    .encode(x='model', y='sales')
+                slow_chart = chart.properties(data=aframexr.UrlData(f'{base_url}/slow.json'))
+                local_html = aframexr.Chart(aframexr.UrlData(os.path.join(tmp_dir, 'data.json'))).mark_bar() \
+                    .encode(x='model', y='sales').to_html()
+
+                aframexr.data_cache.clear()
+                self.assertEqual(asyncio.run(chart.to_html_async()), local_html)
+                aframexr.data_cache.clear()
+                self.assertEqual(asyncio.run((chart + chart).to_html_async()), (chart + chart).to_html())
+                self.assertEqual(status_codes, [200, 304, 304])  # Revalidated, data on disk
+
+                async def render_while_slow_chart_is_saved(fp: str) -> str:
+                    slow_task = asyncio.create_task(slow_chart.save_async(fp))
+                    await asyncio.sleep(0.1)  # The slow chart is waiting for the response
+                    html = await asyncio.wait_for(chart.to_html_async(), 0.5)  # Not stalled by the slow chart
+                    self.assertFalse(slow_task.done())
+                    slow_task.cancel()
+                    with self.assertRaises(asyncio.CancelledError):
+                        await slow_task
+                    return html
+
+                fp = os.path.join(tmp_dir, 'slow.html')
+                self.assertEqual(asyncio.run(render_while_slow_chart_is_saved(fp)), local_html)
+                self.assertFalse(os.path.exists(fp))  # Partial file removed
+
+                fp = os.path.join(tmp_dir, 'chart.html')
+                asyncio.run(chart.save_async(fp))
+                with open(fp) as file:
+                    self.assertEqual(file.read(), local_html)
+            finally:
+                server.shutdown()
+                server.server_close()
+                aframexr.http_cache.clear()
+                aframexr.http_cache.directory = default_directory
+                aframexr.data_cache.clear()
 
 
 class TestAframexrError(unittest.TestCase):
     """General ERROR tests."""
+    def test_filter_type_mismatch(self):
+        """Verify that filtering a field with a value of incompatible type raises TypeError before the query runs."""
+        import datetime
+
+        data = POLARS_DATA.with_columns(
+            date=pl.lit(datetime.date(2024, 1, 1)),
+            timestamp=pl.lit(datetime.datetime(2024, 1, 1)),
+            electric=pl.col('motor') == 'electric',
+            motor_enum=pl.col('motor').cast(pl.Enum(['diesel', 'electric', 'gasoline'])),
+        )
+        chart = aframexr.Chart(data).mark_bar().encode(x='model', y='sales')
+        mismatches = [('date', "'2024-01-01'", 'Date', 'str'), ('date', '3', 'Date', 'float'),
+                      ('timestamp', "'2024-01-01'", "Datetime(time_unit='us', time_zone=None)", 'str'),
+                      ('electric', "'yes'", 'Boolean', 'str'),
+                      ('motor_enum', '3', "Enum(categories=['diesel', 'electric', 'gasoline'])", 'float')]
+        for field, value, dtype, value_type in mismatches:
+            with self.assertRaises(TypeError) as error:
+                chart.transform_filter(f'datum.{field} == {value}').to_html()
+            self.assertEqual(str(error.exception),
+                             f'Type mismatch: column "{field}" has type {dtype} but value is of type {value_type}')
+
+        with self.assertRaises(ValueError) as error:
+            chart.transform_filter("datum.motor_enum > 'hybrid'").to_html()
+        self.assertEqual(str(error.exception), 'Value "hybrid" is not a category of column "motor_enum" '
+                                               "(type Enum(categories=['diesel', 'electric', 'gasoline'])).")
+
+        self.assertEqual(chart.transform_filter('datum.electric == 1').to_html(),  # Compatible types
+                         chart.transform_filter("datum.motor == 'electric'").to_html())
+        self.assertEqual(chart.transform_filter("datum.motor_enum == 'electric'").to_html(),
+                         chart.transform_filter("datum.motor == 'electric'").to_html())
+
     def test_from_dict_error_validate_type(self):
         """Verify that the error is raised when using from_dict with no dictionary."""
         invalid_specs = 'not_a_dict'
@@ -41,7 +1016,8 @@ class TestAframexrError(unittest.TestCase):
         self.assertEqual(
             str(error.exception),
             ERROR_MESSAGES['TYPE'].format(
-                param_name='data', expected_type='Data or UrlData or DataFrame', current_type=type(err_data).__name__
+                param_name='data', expected_type='Data or UrlData or DataFrame or DataFrame or LazyFrame or Table',
+                current_type=type(err_data).__name__
             )
         )
 
@@ -111,9 +1087,22 @@ class TestAframexrError(unittest.TestCase):
             aframexr.Chart.from_dict({'element': bad_element_type}).to_html()
         self.assertEqual(str(error.exception), ERROR_MESSAGES['ELEMENT_TYPE'].format(element=bad_element_type))
 
+    def test_compiled_chart_errors(self):
+        """Verify that the specifications are validated when compiling, and the data when rendering."""
+        with self.assertRaises(ValueError) as error:
+            aframexr.Chart().mark_bar().encode(x='model', y='sales').compile(environment='bad_environment')
+        self.assertEqual(str(error.exception), ERROR_MESSAGES['ENVIRONMENT'].format(environment='bad_environment'))
+
+        compiled_scene = (aframexr.Chart().mark_bar().encode(x='model', y='sales') + aframexr.Box()).compile()
+        with self.assertRaises(ValueError) as error:
+            compiled_scene.render([POLARS_DATA, POLARS_DATA])
+        self.assertEqual(str(error.exception), ERROR_MESSAGES['COMPILED_CHART_DATA'].format(charts=1, datasets=2))
+        with self.assertRaises(TypeError):
+            compiled_scene.render('bad_data')
+
     def test_save_invalid_type_format(self):
         """Verify that the error is raised when the save type is invalid."""
         bad_file_format = 'good_file.bad_format'
         with self.assertRaises(ValueError) as error:
             aframexr.Chart().save(bad_file_format)
-        self.assertEqual(str(error.exception), 'Invalid file format. Must be "json" or "html"')
+        self.assertEqual(str(error.exception), 'Invalid file format. Must be "json", "html" or "glb"')
@@ -240,6 +240,20 @@ class TestMarkBarOK(unittest.TestCase):
             self.assertTrue(_bars_bases_are_on_x_axis(bars_chart_2_html))
             self.assertTrue(_bars_height_does_not_exceed_max_height(bars_chart_2_html, bars_chart_2))
 
+    def test_several_aggregates(self):
+        """Bars chart with several aggregates in the same transformation creation."""
+        bars_chart = (aframexr.Chart(DATA).mark_bar().encode(x='motor', y='total', z='n')
+                      .transform_aggregate(total='sum(sales)', n='count()'))
+        bars_chart_html = bars_chart.to_html()
+        self.assertTrue(_bars_bases_are_on_x_axis(bars_chart_html))
+
+        bars = BeautifulSoup(bars_chart_html, 'lxml').find_all('a-box')
+        expected = DATA.groupby('motor', sort=False).agg(total=('sales', 'sum'), n=('sales', 'size'))
+        self.assertEqual(
+            [b['info'] for b in bars],
+            [f'motor: {motor}; total: {row.total}; n: {row.n}' for motor, row in expected.iterrows()]
+        )
+
     def test_aggregate_position_rotation_size_height_width_filter(self):
         """Bars chart changing position, rotation size, height, width and filter creation."""
         for a, p, r, s, h, w, f in zip(AGGREGATES, POSITIONS, ROTATIONS, MARK_BAR_POINT_SIZES,
@@ -251,6 +265,38 @@ class TestMarkBarOK(unittest.TestCase):
             self.assertTrue(_bars_bases_are_on_x_axis(bars_chart_html))
             self.assertTrue(_bars_height_does_not_exceed_max_height(bars_chart_html, bars_chart))
 
+    def test_bin(self):
+        """Bars chart (histogram) of a binned field creation."""
+        for maxbins in (2, 5, 10):
+            histogram = (aframexr.Chart(DATA).mark_bar().encode(x='bin_start', y='n')
+                         .transform_bin('bin_start', 'sales', maxbins=maxbins).transform_aggregate(n='count()'))
+            histogram_html = histogram.to_html()
+            self.assertTrue(_bars_bases_are_on_x_axis(histogram_html))
+
+            bars = BeautifulSoup(histogram_html, 'lxml').find_all('a-box')
+            counts = {}
+            for b in bars:
+                bin_start, n = [float(field.split(':')[1]) for field in b['info'].split(';')]
+                counts[bin_start] = n
+            self.assertLessEqual(len(counts), maxbins + 1)
+            self.assertEqual(sum(counts.values()), len(DATA))
+
+            step = sorted(counts)[1] - sorted(counts)[0] if len(counts) > 1 else 0
+            for sales in DATA['sales']:  # Each value is counted in its bin
+                self.assertTrue(any(start <= sales < start + step or len(counts) == 1 for start in counts))
+
+    def test_encoding_bin(self):
+        """Bars chart with binned encoding channels creation."""
+        histogram = aframexr.Chart(DATA).mark_bar().encode(x=aframexr.X('sales', bin=4), y='count()')
+        transformed = (aframexr.Chart(DATA).mark_bar().encode(x='sales_bin', y='n')
+                       .transform_bin('sales_bin', 'sales', maxbins=4).transform_aggregate(n='count()'))
+        self.assertEqual(histogram.to_dict()['encoding']['x'], {'field': 'sales', 'bin': {'maxbins': 4}})
+
+        bars = BeautifulSoup(histogram.to_html(), 'lxml').find_all('a-box')
+        transformed_bars = BeautifulSoup(transformed.to_html(), 'lxml').find_all('a-box')
+        self.assertEqual([(b['position'], b['height']) for b in bars],
+                         [(b['position'], b['height']) for b in transformed_bars])
+
     def test_concatenation(self):
         """Bars chart concatenation creation."""
         concatenated_chart = (aframexr.Chart(DATA, position=CONCATENATION_POSITIONS[0]).mark_bar()
@@ -484,6 +530,18 @@ class TestMarkBarError(unittest.TestCase):
         self.assertRegex(str(error.exception), r'Encoding channel\(s\) .* must be defined in aggregate .*'
                                                r', otherwise that fields will disappear.')
 
+    def test_bin_error(self):
+        """Bars chart bin error."""
+        for maxbins in (0, -3):
+            with self.assertRaises(ValueError) as error:
+                aframexr.Chart(DATA).mark_bar().encode(x='binned', y='sales').transform_bin('binned', 'sales',
+                                                                                             maxbins=maxbins)
+            self.assertEqual(str(error.exception), ERROR_MESSAGES['POSITIVE_NUMBER'].format(param_name='maxbins'))
+
+        with self.assertRaises(KeyError):
+            (aframexr.Chart(DATA).mark_bar().encode(x='binned', y='sales')
+             .transform_bin('binned', 'bad_field').to_html())
+
     def test_environment_error(self):
         """Scene creation with invalid personalized environment."""
         environment = 'bad_environment'
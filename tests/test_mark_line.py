@@ -99,6 +99,18 @@ class TestMarkLineOK(unittest.TestCase):
         line_chart = aframexr.Chart(DATA).mark_line(point=True).encode(x='model', y='sales')
         line_chart.to_html()
 
+    def test_point_markers_selection(self):
+        """Line chart using point markers creation, whose markers activate the selection param."""
+        from bs4 import BeautifulSoup
+
+        param = aframexr.selection_point('param_name', fields=['model'])
+        line_chart = aframexr.Chart(DATA).mark_line(point=True).encode(x='model', y='sales').add_params(param)
+        point_chart = aframexr.Chart(DATA).mark_point().encode(x='model', y='sales').add_params(param)
+        markers = BeautifulSoup(line_chart.to_html(), 'lxml').find_all('a-sphere')
+        points = BeautifulSoup(point_chart.to_html(), 'lxml').find_all('a-sphere')
+        self.assertEqual([marker['activates-param'] for marker in markers],
+                         [point['activates-param'] for point in points])
+
     def test_encoding(self):
         """Line chart changing encoding creation."""
         for e in MARK_BAR_ENCODINGS: